@@ -324,32 +324,31 @@ def _is_acronym(term):
     return len(term) <= 5 and term.isupper() and term.isalpha()
 
 
-def _build_term_matchers(search_terms):
+def _build_term_patterns(search_terms):
     """
-    Pre-compile matchers for each search term.
+    Pre-compile one alternation regex per matching mode.
 
     Acronyms (short, all-uppercase like ACA, TCJA, NCLB) get whole-word,
     case-sensitive regex matching to avoid false positives from substrings
     (e.g., "aca" inside "academic").
 
-    Longer terms get standard case-insensitive substring matching.
+    Longer terms get standard case-insensitive substring matching (the
+    pattern is meant to be run on lowercased text).
 
     Returns:
     --------
-    list of (term, match_fn) tuples
+    tuple of (acronym_pattern, substring_pattern); either may be None
     """
-    matchers = []
-    for term in search_terms:
-        if _is_acronym(term):
-            # Whole-word, case-sensitive: matches "ACA", "(ACA)", "ACA's"
-            # but NOT "academic", "vacancy"
-            pattern = re.compile(r'\b' + re.escape(term) + r'\b')
-            matchers.append((term, lambda text_orig, p=pattern: bool(p.search(text_orig))))
-        else:
-            # Case-insensitive substring match for longer terms
-            term_lower = term.lower()
-            matchers.append((term, lambda text_lower, t=term_lower: t in text_lower))
-    return matchers
+    acronyms = [t for t in search_terms if _is_acronym(t)]
+    others = [t.lower() for t in search_terms if not _is_acronym(t)]
+
+    # Whole-word, case-sensitive: matches "ACA", "(ACA)", "ACA's"
+    # but NOT "academic", "vacancy"
+    acronym_pattern = (re.compile(r'\b(?:' + '|'.join(re.escape(t) for t in acronyms) + r')\b')
+                       if acronyms else None)
+    substring_pattern = (re.compile('|'.join(re.escape(t) for t in others))
+                         if others else None)
+    return acronym_pattern, substring_pattern
 
 
 def filter_by_relevance(df, search_terms):
@@ -380,55 +379,35 @@ def filter_by_relevance(df, search_terms):
     if len(df) == 0 or len(search_terms) == 0:
         return df, {'kept': len(df), 'filtered_with_abstract': 0, 'kept_no_abstract': 0}
 
-    matchers = _build_term_matchers(search_terms)
+    acronym_pattern, substring_pattern = _build_term_patterns(search_terms)
     acronym_terms = [t for t in search_terms if _is_acronym(t)]
     if acronym_terms:
         print(f"    Acronym terms (whole-word, case-sensitive matching): {acronym_terms}")
 
-    stats = {
-        'kept': 0,
-        'filtered_with_abstract': 0,
-        'kept_no_abstract': 0,
-        'kept_with_abstract_match': 0
-    }
+    # Build the searched text once for all rows (title + abstract, plus a
+    # lowercased copy for the substring terms)
+    title = df['title'].astype(str) if 'title' in df.columns else pd.Series('', index=df.index)
+    abstract = df['abstract'].astype(str) if 'abstract' in df.columns else pd.Series('', index=df.index)
+    abstract_lower = abstract.str.lower()
+    has_abstract = ~(abstract_lower.isin(['nan', 'none']) | (abstract_lower.str.strip() == ''))
 
-    def is_relevant(row):
-        title = str(row.get('title', ''))
-        abstract = str(row.get('abstract', ''))
-        abstract_lower = abstract.lower()
-
-        # Check if abstract is missing/empty
-        has_abstract = (abstract_lower and abstract_lower != 'nan'
-                        and abstract_lower.strip() != '' and abstract_lower != 'none')
-
-        if not has_abstract:
-            # No abstract - keep the paper
-            stats['kept_no_abstract'] += 1
-            return True
-
-        # Has abstract - check for search term presence
-        text_orig = title + ' ' + abstract
-        text_lower = text_orig.lower()
-        for term, match_fn in matchers:
-            # Acronym matchers receive the original-case text;
-            # substring matchers receive the lowercased text
-            if _is_acronym(term):
-                if match_fn(text_orig):
-                    stats['kept_with_abstract_match'] += 1
-                    return True
-            else:
-                if match_fn(text_lower):
-                    stats['kept_with_abstract_match'] += 1
-                    return True
-
-        # Has abstract but no search term match - filter out
-        stats['filtered_with_abstract'] += 1
-        return False
+    search_text = title.str.cat(abstract, sep=' ')
+    term_found = pd.Series(False, index=df.index)
+    if acronym_pattern is not None:
+        term_found |= search_text.str.contains(acronym_pattern, regex=True, na=False)
+    if substring_pattern is not None:
+        term_found |= search_text.str.lower().str.contains(substring_pattern, regex=True, na=False)
 
     # Apply filter
-    mask = df.apply(is_relevant, axis=1)
+    mask = ~has_abstract | term_found
     filtered_df = df[mask].copy()
-    stats['kept'] = len(filtered_df)
+
+    stats = {
+        'kept': len(filtered_df),
+        'filtered_with_abstract': int((has_abstract & ~term_found).sum()),
+        'kept_no_abstract': int((~has_abstract).sum()),
+        'kept_with_abstract_match': int((has_abstract & term_found).sum())
+    }
 
     return filtered_df, stats
 
@@ -29,11 +29,14 @@ Key Implementation Notes:
 - NBER: all papers are economics working papers by definition.
 - paper_type column: 'journal_article' or 'working_paper' for each paper.
 - Abstract recovery times first 20 papers to estimate total time.
+- Semantic Scholar responses are cached in tmp/ss_http_cache.sqlite (14 days);
+  cached pages skip the SS rate limiter on re-runs.
 
 Output Files:
 -------------
 - TCJA_papers_econ_apis_raw.parquet: Merged dataset before relevance filtering
 - TCJA_papers_econ_apis_filtered.parquet: After relevance filtering
+- TCJA_papers_econ_apis_{raw,filtered}.csv: CSV copies, only when WRITE_CSV=1
 - TCJA_econ_apis_metadata.json: Scraping and processing statistics
 - tmp/TCJA_openalex_econ_raw.parquet: OpenAlex-only raw results
 - tmp/TCJA_ss_econ_raw.parquet: Semantic Scholar-only raw results
@@ -46,6 +49,9 @@ Date: February 2026
 import argparse
 import html
 import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 import json
 import pandas as pd
 import time
@@ -77,6 +83,20 @@ try:
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+# orjson — optional dependency (faster serialization of raw API responses)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyahocorasick — optional dependency (multi-term relevance matching)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # undetected-chromedriver — optional dependency (for SSRN Cloudflare bypass)
 try:
     import undetected_chromedriver as uc
@@ -98,6 +118,10 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 os.makedirs(TMP_DIR, exist_ok=True)
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
+# CSV copies of the raw/filtered outputs are for manual inspection only;
+# downstream scripts read the Parquet files. Set WRITE_CSV=1 to emit them.
+WRITE_CSV = os.getenv('WRITE_CSV', '0') == '1'
+
 # Load .env from repo root
 REPO_ROOT = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "..", ".."))
 load_dotenv(os.path.join(REPO_ROOT, ".env"))
@@ -120,7 +144,9 @@ SS_FIELDS = "paperId,title,abstract,authors,year,citationCount,venue,publication
 SS_FIELDS_OF_STUDY = "Economics,Business"
 SS_PER_PAGE = 1000
 SS_RATE_LIMIT = 1.1
-SS_MAX_WORKERS = 2
+SS_MAX_WORKERS = 4        # In-flight terms; ss_rate_limiter still caps aggregate req/s
+SS_HTTP_CACHE_FILE = os.path.join(TMP_DIR, "ss_http_cache.sqlite")
+SS_HTTP_CACHE_EXPIRE_SECONDS = 14 * 86400
 
 # NBER
 NBER_API = "https://www.nber.org/api/v1/search"
@@ -134,6 +160,10 @@ CROSSREF_API = "https://api.crossref.org/works"
 CROSSREF_RATE_LIMIT = 0.1
 RECOVERY_WORKERS = 5  # Parallel workers for abstract recovery
 
+# Relevance filtering: use an Aho-Corasick automaton (if installed) from this
+# many search terms on; below it the regex alternation is just as fast
+AHO_CORASICK_MIN_TERMS = 8
+
 # =============================================================================
 # RATE LIMITERS
 # =============================================================================
@@ -160,6 +190,65 @@ epmc_rate_limiter = RateLimiter(0.15)      # Europe PMC: ~7 req/sec
 oa_url_rate_limiter = RateLimiter(0.3)     # OA URL scraping: ~3 req/sec
 nber_web_rate_limiter = RateLimiter(0.5)   # NBER website: 2 req/sec
 
+
+# =============================================================================
+# HTTP SESSIONS
+# =============================================================================
+def build_ss_session():
+    """
+    Build the shared HTTP session for all Semantic Scholar API calls.
+
+    Bulk search pages, DOI lookups and title searches reuse pooled keep-alive
+    connections to api.semanticscholar.org instead of a new TCP + TLS
+    handshake per request. urllib3 retries 429 and 5xx responses with
+    exponential backoff, honouring the Retry-After header when present.
+    Successful (200) responses are cached on disk in SS_HTTP_CACHE_FILE so
+    re-runs replay pages already fetched instead of waiting on the 1 req/s
+    limit; the x-api-key header is excluded from cache keys by requests-cache.
+
+    Returns:
+    --------
+    CachedSession : Session with pooled HTTPS adapter and API key header
+    """
+    session = CachedSession(
+        SS_HTTP_CACHE_FILE,
+        backend='sqlite',
+        expire_after=SS_HTTP_CACHE_EXPIRE_SECONDS,
+        allowable_codes=(200,),
+        allowable_methods=('GET',)
+    )
+    retry = Retry(
+        total=5,
+        backoff_factor=2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session.mount("https://", adapter)
+    if SS_API_KEY:
+        session.headers['x-api-key'] = SS_API_KEY
+    return session
+
+
+SS_SESSION = build_ss_session()
+
+
+def ss_get(url, params, timeout):
+    """
+    GET a Semantic Scholar API URL through SS_SESSION.
+
+    Only requests that will actually reach the network wait on
+    ss_rate_limiter; pages already in the on-disk cache return immediately.
+    """
+    request = SS_SESSION.prepare_request(requests.Request('GET', url, params=params))
+    cached = SS_SESSION.cache.get_response(SS_SESSION.cache.create_key(request))
+    if cached is None or cached.is_expired:
+        ss_rate_limiter.wait()
+    return SS_SESSION.get(url, params=params, timeout=timeout)
+
+
 # SSRN recovery configuration
 SSRN_PROFILE_DIR = os.path.join(
     os.environ.get('LOCALAPPDATA', os.path.expanduser('~')),
@@ -190,6 +279,18 @@ def load_policies(policies_file):
     return df
 
 
+def dump_json_bytes(obj):
+    """
+    Serialize raw API results compactly (no indentation).
+
+    Uses orjson when available, falling back to the standard json module.
+    Non-JSON values are converted with str(), as before.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, separators=(',', ':'), default=str).encode('utf-8')
+
+
 def normalize_title(title):
     """Normalize title for deduplication: strip HTML, decode entities, lowercase, no punctuation."""
     if not title or pd.isna(title):
@@ -205,6 +306,27 @@ def normalize_title(title):
     return title
 
 
+def normalize_title_series(titles):
+    """
+    Vectorized normalize_title for a whole column (same rules, '' for missing).
+
+    Runs the regex steps through pandas .str methods; html.unescape is only
+    applied to the rows that actually contain an '&'.
+    """
+    s = titles.fillna('').astype(str).str.replace(r'<[^>]+>', '', regex=True)
+    has_entity = s.str.contains('&', regex=False)
+    if has_entity.any():
+        s = s.where(~has_entity, s[has_entity].map(html.unescape))
+    return (
+        s.str.lower()
+        .str.replace('&', ' and ', regex=False)
+        .str.replace(r'[\u2013\u2014-]+', ' ', regex=True)
+        .str.replace(r'[^\w\s]', '', regex=True)
+        .str.split()
+        .str.join(' ')
+    )
+
+
 def normalize_doi(doi):
     """Normalize DOI: strip URL prefix, lowercase."""
     if not doi or pd.isna(doi):
@@ -424,20 +546,31 @@ def filter_by_relevance(df, search_terms):
     if len(df) == 0:
         return df
 
-    def is_relevant(row):
-        title = str(row.get('title', '')).lower()
-        abstract = str(row.get('abstract', '')).lower()
-
-        if not abstract or abstract in ('nan', '', 'none'):
-            return True
-
-        text = title + ' ' + abstract
-        for term in search_terms:
-            if term.lower() in text:
-                return True
-        return False
+    # A missing column counts as empty (sources without abstracts keep all papers)
+    empty = pd.Series('', index=df.index)
+    title = (df['title'] if 'title' in df.columns else empty).astype(str).str.lower()
+    abstract = (df['abstract'] if 'abstract' in df.columns else empty).astype(str).str.lower()
+    no_abstract = abstract.isin(['', 'nan', 'none'])
+
+    terms = [t.lower() for t in search_terms]
+    if not terms:
+        return df[no_abstract].copy()
+
+    text = title.str.cat(abstract, sep=' ')
+    if AHOCORASICK_AVAILABLE and len(terms) >= AHO_CORASICK_MIN_TERMS:
+        # Single pass per row over all terms at once
+        automaton = ahocorasick.Automaton()
+        for t in terms:
+            automaton.add_word(t, t)
+        automaton.make_automaton()
+        term_found = text.map(lambda s: next(automaton.iter(s), None) is not None).astype(bool)
+    else:
+        # One alternation regex scanned once per row instead of one substring
+        # search per term
+        terms_re = re.compile('|'.join(re.escape(t) for t in terms))
+        term_found = text.str.contains(terms_re, regex=True, na=False)
 
-    mask = df.apply(is_relevant, axis=1)
+    mask = no_abstract | term_found
     return df[mask].copy()
 
 
@@ -581,8 +714,8 @@ def scrape_openalex(search_terms, policy_abbr, from_year=None):
         results = search_openalex_econ(term, from_year=from_year)
         safe_term = term.replace(' ', '_').replace('/', '_').lower()
         raw_file = os.path.join(TMP_DIR, f"raw_oa_{policy_abbr}_{safe_term}.json")
-        with open(raw_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(raw_file, 'wb') as f:
+            f.write(dump_json_bytes(results))
         papers = []
         for work in results:
             paper_info = extract_openalex_paper(work)
@@ -644,7 +777,7 @@ def search_ss_econ(query, limit=SS_PER_PAGE, max_retries=3, from_year=None):
     limit : int
         Results per page (up to 1000 for bulk)
     max_retries : int
-        Max retries for rate limit errors
+        Max retries for network errors (429/5xx are retried by SS_SESSION)
     from_year : int or None
         If set, restrict to publications from this year onward
 
@@ -659,10 +792,6 @@ def search_ss_econ(query, limit=SS_PER_PAGE, max_retries=3, from_year=None):
     print(f"  [SS] Searching: '{query}' (fieldsOfStudy={SS_FIELDS_OF_STUDY}"
           + (f", year={year_range}" if year_range else "") + ")")
 
-    headers = {}
-    if SS_API_KEY:
-        headers['x-api-key'] = SS_API_KEY
-
     while True:
         params = {
             'query': query,
@@ -677,15 +806,8 @@ def search_ss_econ(query, limit=SS_PER_PAGE, max_retries=3, from_year=None):
 
         for retry in range(max_retries):
             try:
-                ss_rate_limiter.wait()
-                response = requests.get(SS_API, params=params, headers=headers)
-
-                if response.status_code == 429:
-                    wait_time = (2 ** retry) * 5
-                    print(f"    [SS] Rate limited. Waiting {wait_time}s (retry {retry + 1}/{max_retries})...")
-                    time.sleep(wait_time)
-                    continue
-
+                # 429/5xx backoff is handled by SS_SESSION's urllib3 Retry
+                response = ss_get(SS_API, params, timeout=30)
                 response.raise_for_status()
                 data = response.json()
 
@@ -716,8 +838,21 @@ def search_ss_econ(query, limit=SS_PER_PAGE, max_retries=3, from_year=None):
     return all_results
 
 
+# Column order of the tuples returned by extract_ss_paper
+SS_PAPER_COLUMNS = [
+    'semantic_scholar_id', 'title', 'abstract', 'authors', 'author_count',
+    'publication_year', 'publication_date', 'venue', 'cited_by_count',
+    'is_open_access', 'open_access_url', 's2_fields_of_study', 'paper_type'
+]
+
+
 def extract_ss_paper(paper):
-    """Extract paper info from Semantic Scholar paper object, including paper_type."""
+    """
+    Extract paper info from Semantic Scholar paper object, including paper_type.
+
+    Returns a tuple in SS_PAPER_COLUMNS order so the caller can build the
+    frame in one pd.DataFrame.from_records call.
+    """
     authors = paper.get('authors', [])
     if isinstance(authors, list):
         author_names = [a.get('name', '') if isinstance(a, dict) else str(a) for a in authors]
@@ -733,22 +868,21 @@ def extract_ss_paper(paper):
     s2_fields = paper.get('s2FieldsOfStudy', []) or []
     fields_str = ' | '.join([f.get('category', '') for f in s2_fields if isinstance(f, dict)])
 
-    return {
-        'semantic_scholar_id': paper.get('paperId', ''),
-        'title': paper.get('title', ''),
-        'abstract': paper.get('abstract', ''),
-        'authors': authors_str,
-        'author_count': len(author_names),
-        'publication_year': paper.get('year'),
-        'publication_date': paper.get('publicationDate', ''),
-        'venue': paper.get('venue', ''),
-        'cited_by_count': paper.get('citationCount', 0),
-        'is_open_access': paper.get('isOpenAccess', False),
-        'open_access_url': oa_url,
-        's2_fields_of_study': fields_str,
-        'paper_type': classify_paper_type_ss(paper),
-        'data_source': 'SemanticScholar'
-    }
+    return (
+        paper.get('paperId', ''),
+        paper.get('title', ''),
+        paper.get('abstract', ''),
+        authors_str,
+        len(author_names),
+        paper.get('year'),
+        paper.get('publicationDate', ''),
+        paper.get('venue', ''),
+        paper.get('citationCount', 0),
+        paper.get('isOpenAccess', False),
+        oa_url,
+        fields_str,
+        classify_paper_type_ss(paper),
+    )
 
 
 def scrape_semantic_scholar(search_terms, policy_abbr, from_year=None):
@@ -759,53 +893,52 @@ def scrape_semantic_scholar(search_terms, policy_abbr, from_year=None):
     --------
     pd.DataFrame : SS results with paper_type and search_terms_matched
     """
-    all_papers = []
-    results_lock = threading.Lock()
+    # Deduplicate while ingesting: each paperId is extracted once, and every
+    # term that returned it is recorded for search_terms_matched
+    papers_by_id = {}
+    terms_by_id = {}
+    total_found = 0
 
     def search_single_term(term):
         results = search_ss_econ(term, from_year=from_year)
         safe_term = term.replace(' ', '_').replace('/', '_').lower()
         raw_file = os.path.join(TMP_DIR, f"raw_ss_{policy_abbr}_{safe_term}.json")
-        with open(raw_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        papers = []
-        for p in results:
-            paper_info = extract_ss_paper(p)
-            paper_info['search_term'] = term
-            papers.append(paper_info)
-        print(f"    [SS] Extracted {len(papers)} papers for '{term}'")
-        return papers
+        with open(raw_file, 'wb') as f:
+            f.write(dump_json_bytes(results))
+        print(f"    [SS] Fetched {len(results)} papers for '{term}'")
+        return results
 
     print(f"\n  === SEMANTIC SCHOLAR (econ-filtered) ===")
-    print(f"  Searching {len(search_terms)} terms (max {SS_MAX_WORKERS} workers)...")
+    n_workers = max(1, min(SS_MAX_WORKERS, len(search_terms)))
+    print(f"  Searching {len(search_terms)} terms ({n_workers} workers)...")
 
-    with ThreadPoolExecutor(max_workers=SS_MAX_WORKERS) as executor:
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
         future_to_term = {executor.submit(search_single_term, t): t for t in search_terms}
         for future in as_completed(future_to_term):
             term = future_to_term[future]
             try:
-                papers = future.result()
-                with results_lock:
-                    all_papers.extend(papers)
+                results = future.result()
             except Exception as e:
                 print(f"    [SS] ERROR for '{term}': {e}")
-
-    if not all_papers:
+                continue
+            # Runs in this (single) thread, so no lock is needed
+            total_found += len(results)
+            for p in results:
+                paper_id = p.get('paperId', '')
+                terms_by_id.setdefault(paper_id, set()).add(term)
+                if paper_id not in papers_by_id:
+                    papers_by_id[paper_id] = extract_ss_paper(p)
+
+    if not papers_by_id:
         return pd.DataFrame()
 
-    df = pd.DataFrame(all_papers)
-
-    # Aggregate search terms and dedup
-    search_terms_agg = df.groupby('semantic_scholar_id')['search_term'].apply(
-        lambda x: ' | '.join(sorted(set(x)))
-    ).reset_index()
-    search_terms_agg.columns = ['semantic_scholar_id', 'search_terms_matched']
-
-    df_unique = df.drop_duplicates(subset=['semantic_scholar_id'], keep='first').copy()
-    df_unique = df_unique.drop(columns=['search_term'])
-    df_unique = df_unique.merge(search_terms_agg, on='semantic_scholar_id', how='left')
+    df_unique = pd.DataFrame.from_records(list(papers_by_id.values()), columns=SS_PAPER_COLUMNS)
+    df_unique = df_unique.assign(
+        data_source='SemanticScholar',
+        search_terms_matched=[' | '.join(sorted(terms_by_id[pid])) for pid in papers_by_id]
+    )
 
-    print(f"  [SS] Total: {len(df)} | Unique: {len(df_unique)}")
+    print(f"  [SS] Total: {total_found} | Unique: {len(df_unique)}")
 
     # Save per-source raw
     raw_file = os.path.join(TMP_DIR, f"{policy_abbr}_ss_econ_raw.parquet")
@@ -986,8 +1119,8 @@ def scrape_nber(search_terms, policy_abbr, from_year=None):
         results = search_nber(term)
         safe_term = term.replace(' ', '_').replace('/', '_').lower()
         raw_file = os.path.join(TMP_DIR, f"raw_nber_{policy_abbr}_{safe_term}.json")
-        with open(raw_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        with open(raw_file, 'wb') as f:
+            f.write(dump_json_bytes(results))
         papers = []
         for p in results:
             paper_info = extract_nber_paper(p)
@@ -1016,7 +1149,7 @@ def scrape_nber(search_terms, policy_abbr, from_year=None):
     df = pd.DataFrame(all_papers)
 
     # Dedup by normalized title (NBER has no stable paper ID across search terms)
-    df['normalized_title'] = df['title'].apply(normalize_title)
+    df['normalized_title'] = normalize_title_series(df['title'])
     search_terms_agg = df.groupby('normalized_title')['search_term'].apply(
         lambda x: ' | '.join(sorted(set(x)))
     ).reset_index()
@@ -1101,14 +1234,35 @@ def _fill_abstracts_from_source(merged, source_df, match_mask, source_name):
         print(f"    Filled {filled} abstracts from {source_name}")
 
 
+def values_present_in(values, other_values):
+    """
+    Flag which values also occur in other_values.
+
+    One vectorized hash lookup (Series.isin) against the non-null other
+    values, instead of building a Python set from them.
+
+    Parameters:
+    -----------
+    values : pd.Series
+        Keys to look up (e.g. doi_norm, normalized_title)
+    other_values : pd.Series
+        Keys of the other frame
+
+    Returns:
+    --------
+    np.ndarray : Boolean flags aligned with values
+    """
+    return pd.Series(values).isin(other_values.dropna()).to_numpy(dtype=bool)
+
+
 def merge_sources(oa_df, ss_df, nber_df):
     """
     Merge papers from OpenAlex, Semantic Scholar, and NBER.
     Match by DOI (primary) and normalized title (fallback).
     Track which sources found each paper.
 
-    Uses vectorized set-based matching instead of row-by-row iteration
-    for performance with large datasets.
+    Uses vectorized hash-lookup matching (values_present_in) instead of
+    row-by-row iteration for performance with large datasets.
 
     Parameters:
     -----------
@@ -1135,7 +1289,7 @@ def merge_sources(oa_df, ss_df, nber_df):
         else:
             df['doi_norm'] = ''
         if 'normalized_title' not in df.columns:
-            df['normalized_title'] = df['title'].apply(normalize_title)
+            df['normalized_title'] = normalize_title_series(df['title'])
 
     # Start with OpenAlex as the base
     merged = oa_df.copy() if len(oa_df) > 0 else pd.DataFrame()
@@ -1149,23 +1303,22 @@ def merge_sources(oa_df, ss_df, nber_df):
     if len(ss_df) > 0:
         if len(merged) > 0:
             # Identify which SS papers match merged (by DOI or title)
-            merged_dois = set(merged['doi_norm'].dropna()) - {''}
-            merged_titles = set(merged['normalized_title'].dropna()) - {''}
             ss_df_copy = ss_df.copy()
-            ss_df_copy['matched_by_doi'] = ss_df_copy['doi_norm'].isin(merged_dois) & (ss_df_copy['doi_norm'] != '')
+            ss_df_copy['matched_by_doi'] = values_present_in(ss_df_copy['doi_norm'], merged['doi_norm']) & \
+                                           (ss_df_copy['doi_norm'] != '')
             ss_df_copy['matched_by_title'] = (~ss_df_copy['matched_by_doi']) & \
-                                              ss_df_copy['normalized_title'].isin(merged_titles) & \
+                                              values_present_in(ss_df_copy['normalized_title'], merged['normalized_title']) & \
                                               (ss_df_copy['normalized_title'] != '')
             ss_is_matched = ss_df_copy['matched_by_doi'] | ss_df_copy['matched_by_title']
             ss_matched = ss_df_copy[ss_is_matched]
             ss_new = ss_df_copy[~ss_is_matched]
 
             # Vectorized: mark merged rows that have a matching SS paper
-            ss_matched_dois = set(ss_matched.loc[ss_matched['matched_by_doi'], 'doi_norm'].dropna()) - {''}
-            ss_matched_titles = set(ss_matched.loc[ss_matched['matched_by_title'], 'normalized_title'].dropna()) - {''}
+            ss_matched_dois = ss_matched.loc[ss_matched['matched_by_doi'], 'doi_norm']
+            ss_matched_titles = ss_matched.loc[ss_matched['matched_by_title'], 'normalized_title']
 
-            doi_match_mask = merged['doi_norm'].isin(ss_matched_dois) & (merged['doi_norm'] != '')
-            title_match_mask = merged['normalized_title'].isin(ss_matched_titles) & \
+            doi_match_mask = values_present_in(merged['doi_norm'], ss_matched_dois) & (merged['doi_norm'] != '')
+            title_match_mask = values_present_in(merged['normalized_title'], ss_matched_titles) & \
                                (merged['normalized_title'] != '') & ~doi_match_mask
             ss_match_mask = doi_match_mask | title_match_mask
 
@@ -1196,16 +1349,14 @@ def merge_sources(oa_df, ss_df, nber_df):
     # Add NBER papers (vectorized matching)
     if len(nber_df) > 0:
         if len(merged) > 0:
-            merged_titles = set(merged['normalized_title'].dropna()) - {''}
             nber_df_copy = nber_df.copy()
-            nber_df_copy['matched'] = nber_df_copy['normalized_title'].isin(merged_titles) & \
+            nber_df_copy['matched'] = values_present_in(nber_df_copy['normalized_title'], merged['normalized_title']) & \
                                        (nber_df_copy['normalized_title'] != '')
             nber_matched = nber_df_copy[nber_df_copy['matched']]
             nber_new = nber_df_copy[~nber_df_copy['matched']]
 
             # Vectorized: mark merged rows that have a matching NBER paper
-            nber_matched_titles = set(nber_matched['normalized_title'].dropna()) - {''}
-            nber_match_mask = merged['normalized_title'].isin(nber_matched_titles) & \
+            nber_match_mask = values_present_in(merged['normalized_title'], nber_matched['normalized_title']) & \
                               (merged['normalized_title'] != '')
 
             merged.loc[nber_match_mask, 'in_nber'] = True
@@ -1287,13 +1438,8 @@ def recover_abstract_ss(doi):
         return None, 'empty_doi'
 
     try:
-        ss_rate_limiter.wait()
         url = f"https://api.semanticscholar.org/graph/v1/paper/DOI:{clean_doi}"
-        headers = {}
-        if SS_API_KEY:
-            headers['x-api-key'] = SS_API_KEY
-
-        response = requests.get(url, params={'fields': 'abstract'}, headers=headers, timeout=15)
+        response = ss_get(url, {'fields': 'abstract'}, timeout=15)
 
         if response.status_code == 404:
             return None, 'ss_not_found'
@@ -1993,15 +2139,13 @@ def recover_abstract_ss_title(title):
     if len(title_clean) < 10:
         return None, 'title_too_short'
     try:
-        ss_rate_limiter.wait()
         url = "https://api.semanticscholar.org/graph/v1/paper/search"
         params = {
             'query': title_clean[:200],
             'fields': 'title,abstract',
             'limit': 3,
         }
-        headers = {'x-api-key': SS_API_KEY} if SS_API_KEY else {}
-        resp = requests.get(url, params=params, headers=headers, timeout=15)
+        resp = ss_get(url, params, timeout=15)
         if resp.status_code != 200:
             return None, f'ss_title_http_{resp.status_code}'
         papers = resp.json().get('data', [])
@@ -2329,8 +2473,9 @@ def process_policy(policy_row, resume=False, ssrn_mode=False):
             ssrn_stats['dropped_after_refilter'] = pre_ssrn - post_ssrn
             print(f"  [SSRN] After re-filter: {pre_ssrn} -> {post_ssrn} ({pre_ssrn - post_ssrn} dropped)")
             filtered.to_parquet(filtered_output_path, index=False, engine='pyarrow')
-            filtered_csv = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_econ_apis_filtered.csv")
-            filtered.to_csv(filtered_csv, index=False, encoding='utf-8')
+            if WRITE_CSV:
+                filtered_csv = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_econ_apis_filtered.csv")
+                filtered.to_csv(filtered_csv, index=False, encoding='utf-8')
             print(f"  [SSRN] Re-saved filtered outputs")
 
             # Update metadata
@@ -2443,7 +2588,7 @@ def process_policy(policy_row, resume=False, ssrn_mode=False):
 
         # Add normalized_title if not present
         if 'normalized_title' not in merged.columns:
-            merged['normalized_title'] = merged['title'].apply(normalize_title)
+            merged['normalized_title'] = normalize_title_series(merged['title'])
 
         # Add policy metadata
         merged['policy_studied'] = policy_name
@@ -2467,9 +2612,10 @@ def process_policy(policy_row, resume=False, ssrn_mode=False):
     merged.to_parquet(raw_output_path, index=False, engine='pyarrow')
     print(f"\n  Saved RAW: {raw_output_path}")
 
-    raw_csv = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_econ_apis_raw.csv")
-    merged.to_csv(raw_csv, index=False, encoding='utf-8')
-    print(f"  Saved RAW CSV: {raw_csv}")
+    if WRITE_CSV:
+        raw_csv = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_econ_apis_raw.csv")
+        merged.to_csv(raw_csv, index=False, encoding='utf-8')
+        print(f"  Saved RAW CSV: {raw_csv}")
 
     # Step 6: Relevance filtering
     print(f"\n  Applying relevance filtering (search terms in title/abstract)...")
@@ -2485,8 +2631,9 @@ def process_policy(policy_row, resume=False, ssrn_mode=False):
     print(f"  Saved FILTERED: {filtered_output_path}")
 
     filtered_csv = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_econ_apis_filtered.csv")
-    filtered.to_csv(filtered_csv, index=False, encoding='utf-8')
-    print(f"  Saved FILTERED CSV: {filtered_csv}")
+    if WRITE_CSV:
+        filtered.to_csv(filtered_csv, index=False, encoding='utf-8')
+        print(f"  Saved FILTERED CSV: {filtered_csv}")
 
     # Step 7 (optional): SSRN abstract recovery via Cloudflare bypass
     ssrn_stats = {'attempted': 0, 'recovered': 0, 'dropped_after_refilter': 0}
@@ -2504,7 +2651,8 @@ def process_policy(policy_row, resume=False, ssrn_mode=False):
 
         # Re-save filtered outputs
         filtered.to_parquet(filtered_output_path, index=False, engine='pyarrow')
-        filtered.to_csv(filtered_csv, index=False, encoding='utf-8')
+        if WRITE_CSV:
+            filtered.to_csv(filtered_csv, index=False, encoding='utf-8')
         print(f"  [SSRN] Re-saved filtered outputs")
 
     elapsed = time.time() - start_time
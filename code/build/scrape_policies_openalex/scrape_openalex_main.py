@@ -11,23 +11,35 @@ Pipeline Overview:
 1. Load policy configurations from ../get_policies/output/policies.csv
 2. For each policy, search OpenAlex using configured search terms (in parallel)
 3. Extract paper metadata (title, authors, abstract, citations, etc.)
-4. Deduplicate results, tracking ALL search terms that found each paper
-5. Save RAW results (no relevance filtering) to Parquet/CSV formats
+4. Deduplicate results at ingest time, tracking ALL search terms that found each paper
+5. Save RAW results (no relevance filtering) to Parquet (CSV optional via --emit-csv)
 
 Key Implementation Notes:
 -------------------------
 - OpenAlex stores abstracts as "inverted indices" (word -> positions mapping),
   not plain text. The reconstruct_abstract() function handles this conversion.
 - Uses OpenAlex "polite pool" (via mailto parameter) for better rate limits.
-- Raw API responses are saved to tmp/ for debugging and reproducibility.
+- API responses are cached in tmp/http_cache.sqlite (requests-cache, 7-day
+  expiry, honoring ETag/Last-Modified), so reruns during development revalidate
+  or reuse pages instead of re-downloading them.
+- Raw API responses are streamed to tmp/ as NDJSON (one work per line) page by
+  page, and extracted in the same pass, so a term's full result list is never
+  held in memory.
 - Search terms are processed in parallel using ThreadPoolExecutor for speed.
+- Optionally (--batch-terms N), up to N search terms are combined into one
+  boolean query "(t1) OR (t2) OR ...", cutting API calls roughly N-fold. Hits
+  from a combined query are attributed to the terms found in their title/abstract
+  (Aho-Corasick scan); if none is found, to every term in the batch.
 - NO relevance filtering at this stage - filtering happens after abstract recovery.
 - Tracks ALL search terms that found each paper (pipe-separated in search_terms column).
+- Parquet is written with zstd compression and dictionary encoding on the
+  low-cardinality columns. The CSV copy is opt-in (--emit-csv) since it is
+  several times larger and dominates write time for large policies.
 
 Output Files:
 -------------
 - {abbr}_papers_openalex_raw.parquet: Raw dataset (efficient storage)
-- {abbr}_papers_openalex_raw.csv: Raw dataset (compatibility)
+- {abbr}_papers_openalex_raw.csv: Raw dataset (compatibility, only with --emit-csv)
 - {abbr}_openalex_metadata.json: Scraping metadata and statistics
 
 Author: claude ai with modifications by roberto gonzalez
@@ -36,12 +48,17 @@ Updated: January 14, 2026 - Fixed abstract extraction from inverted index
 Updated: January 27, 2026 - Increased max_results to 1500, added relevance filtering
 Updated: February 4, 2026 - Increased max_results to 10000, added parallel processing
 Updated: February 4, 2026 - Removed relevance filtering, track all search terms, save raw data
+Updated: October 16, 2026 - zstd/dictionary-encoded Parquet, CSV output made opt-in
 """
 
 import argparse
+import csv
 import requests
+from requests_cache import CachedSession
 import json
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import time
 from datetime import datetime
 import os
@@ -50,6 +67,20 @@ import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
+# pyahocorasick — optional dependency (single-pass multi-term scan for term attribution)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# orjson — optional dependency (faster serialization of raw API responses)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # OpenAlex API endpoint
 OPENALEX_API = "https://api.openalex.org/works"
 
@@ -63,6 +94,22 @@ MAX_RESULTS_PER_TERM = None   # No limit - use cursor pagination to get all resu
 PER_PAGE = 200                # Results per API page (max 200 for OpenAlex)
 RATE_LIMIT_DELAY = 0.1        # Seconds between API requests
 MAX_WORKERS = 3               # Number of parallel threads for search terms
+TERMS_PER_QUERY = 1           # Search terms combined per OR query (1 = one query per term)
+MAX_QUERY_LENGTH = 1000       # Max characters in a combined OR query
+
+# Parquet output settings
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+PARQUET_ROW_GROUP_SIZE = 50_000
+# Low-cardinality columns that benefit from dictionary encoding
+DICTIONARY_COLUMNS = [
+    'type', 'language', 'source_type', 'policy_studied', 'policy_abbreviation',
+    'policy_category', 'data_source', 'scrape_date'
+]
+# Columns worth min/max statistics (for predicate pushdown downstream);
+# stats on long text columns (title, abstract, authors) are skipped
+STATISTICS_COLUMNS = ['publication_year', 'cited_by_count', 'author_count', 'policy_year']
+PARQUET_DATA_PAGE_SIZE = 1 << 20
 
 # Thread-safe rate limiter for parallel requests
 class RateLimiter:
@@ -90,6 +137,8 @@ TMP_DIR = os.path.join(SCRIPT_DIR, "tmp")
 # Policies file location: ../get_policies/output/policies.csv
 POLICIES_FILE = os.path.join(SCRIPT_DIR, "..", "get_policies", "output", "policies.csv")
 POLICIES_FILE = os.path.normpath(POLICIES_FILE)
+REQUIRED_POLICY_COLUMNS = {'policy_name', 'policy_abbreviation', 'policy_year',
+                           'policy_category', 'search_terms'}
 
 # NBER and Semantic Scholar output for comparison
 NBER_OUTPUT_DIR = os.path.join(SCRIPT_DIR, "..", "scrape_policies_nber", "output")
@@ -98,10 +147,33 @@ NBER_OUTPUT_DIR = os.path.normpath(NBER_OUTPUT_DIR)
 SEMANTIC_SCHOLAR_OUTPUT_DIR = os.path.join(SCRIPT_DIR, "..", "scrape_policies_semantic_scholar", "output")
 SEMANTIC_SCHOLAR_OUTPUT_DIR = os.path.normpath(SEMANTIC_SCHOLAR_OUTPUT_DIR)
 
+# Per-policy / per-term output path templates (filled with str.format)
+RAW_PATH_TMPL = os.path.join(TMP_DIR, "raw_{abbr}_{term}.jsonl")
+PARQUET_PATH_TMPL = os.path.join(OUTPUT_DIR, "{abbr}_papers_openalex_raw.parquet")
+CSV_PATH_TMPL = os.path.join(OUTPUT_DIR, "{abbr}_papers_openalex_raw.csv")
+METADATA_PATH_TMPL = os.path.join(OUTPUT_DIR, "{abbr}_openalex_metadata.json")
+
+# Characters in search terms that are unsafe in raw file names
+SAFE_TERM_TRANS = str.maketrans({' ': '_', '/': '_', '\\': '_', ':': '_'})
+
 # Create directories if they don't exist
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 os.makedirs(TMP_DIR, exist_ok=True)
 
+# Shared HTTP session with an on-disk response cache (conditional GETs via
+# ETag/Last-Modified when the server provides them)
+HTTP_CACHE_FILE = os.path.join(TMP_DIR, "http_cache.sqlite")
+HTTP_CACHE_EXPIRE_SECONDS = 7 * 86400
+SESSION = CachedSession(
+    HTTP_CACHE_FILE,
+    backend='sqlite',
+    cache_control=True,
+    expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+    allowable_methods=('GET',),
+    stale_if_error=True
+)
+SESSION.headers.update({'User-Agent': f'polecon_res (mailto:{USER_EMAIL})'})
+
 
 def reconstruct_abstract(abstract_inverted_index):
     """
@@ -175,29 +247,170 @@ def load_policies(policies_file):
     
     Returns:
     --------
-    pd.DataFrame : DataFrame with policy configurations
+    list : One dict per policy (all values as strings)
+
+    Notes:
+    ------
+    The file is small, so it is read with the stdlib csv module rather than
+    pandas to keep start-up cheap.
     """
     if not os.path.exists(policies_file):
         print(f"ERROR: Policies file not found: {policies_file}")
         print(f"Please create {policies_file} with required columns:")
         print("  policy_name, policy_abbreviation, policy_year, policy_category, search_terms")
         sys.exit(1)
-    
-    df = pd.read_csv(policies_file)
-    
+
+    with open(policies_file, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+
     # Validate required columns
-    required_cols = ['policy_name', 'policy_abbreviation', 'policy_year', 
-                     'policy_category', 'search_terms']
-    missing_cols = set(required_cols) - set(df.columns)
+    missing_cols = REQUIRED_POLICY_COLUMNS - set(reader.fieldnames or [])
     if missing_cols:
         print(f"ERROR: Missing required columns: {missing_cols}")
         sys.exit(1)
-    
-    print(f"Loaded {len(df)} policies from {policies_file}")
-    return df
+
+    print(f"Loaded {len(rows)} policies from {policies_file}")
+    return rows
+
+
+def build_query_batches(search_terms, terms_per_query=TERMS_PER_QUERY,
+                        max_query_length=MAX_QUERY_LENGTH):
+    """
+    Group search terms into batches that are searched with a single OR query.
+
+    Parameters:
+    -----------
+    search_terms : list
+        Search terms for a policy
+    terms_per_query : int
+        Maximum number of terms per batch
+    max_query_length : int
+        Maximum length of the combined query string
+
+    Returns:
+    --------
+    list : List of tuples of search terms
+    """
+    batches = []
+    current = []
+    for term in search_terms:
+        candidate = current + [term]
+        if current and (len(candidate) > terms_per_query
+                        or len(build_query(candidate)) > max_query_length):
+            batches.append(tuple(current))
+            candidate = [term]
+        current = candidate
+    if current:
+        batches.append(tuple(current))
+    return batches
+
+
+def build_query(batch):
+    """
+    Build the OpenAlex search string for a batch of terms.
+
+    A single term is searched as-is; several terms are parenthesized and
+    joined with OR so each keeps its own (non-phrase) search semantics.
+    """
+    if len(batch) == 1:
+        return batch[0]
+    return ' OR '.join(f"({term})" for term in batch)
+
+
+def build_term_automaton(search_terms):
+    """
+    Build an Aho-Corasick automaton mapping lowercased terms to original terms.
+
+    Returns None when pyahocorasick is not installed.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for term in search_terms:
+        automaton.add_word(term.lower(), term)
+    automaton.make_automaton()
+    return automaton
+
+
+def find_terms_in_text(text_lower, search_terms, automaton=None):
+    """
+    Return the set of search terms that occur (case-insensitively) in a text.
+
+    Parameters:
+    -----------
+    text_lower : str
+        Lowercased text to scan
+    search_terms : list
+        Candidate search terms (used when no automaton is given)
+    automaton : ahocorasick.Automaton or None
+        Automaton from build_term_automaton()
+
+    Returns:
+    --------
+    set : Original-case search terms found in the text
+    """
+    if automaton is not None:
+        return {term for _, term in automaton.iter(text_lower)}
+    return {term for term in search_terms if term.lower() in text_lower}
 
 
-def search_openalex(query, per_page=PER_PAGE, max_results=MAX_RESULTS_PER_TERM):
+def attribute_search_terms(df, matched_batches, search_terms):
+    """
+    Compute the pipe-separated search terms that found each paper.
+
+    Papers found by a single-term query are attributed to that term. Papers
+    found by a combined OR query are attributed to the batch terms that occur
+    in their title/abstract, or to every batch term if none occurs (the hit
+    may come from stemming or full text).
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Unique papers with 'openalex_id', 'title' and 'abstract' columns
+    matched_batches : dict
+        openalex_id -> set of term batches (tuples) whose query returned it
+    search_terms : list
+        All search terms for the policy
+
+    Returns:
+    --------
+    list : search_terms_matched value for each row of df
+    """
+    automaton = build_term_automaton(search_terms)
+    text_lower = (df['title'].fillna('').astype(str) + ' '
+                  + df['abstract'].fillna('').astype(str)).str.lower()
+
+    terms_matched = []
+    for work_id, text in zip(df['openalex_id'], text_lower):
+        batches = matched_batches[work_id]
+        terms = set()
+        found = None
+        for batch in batches:
+            if len(batch) == 1:
+                terms.add(batch[0])
+                continue
+            if found is None:
+                found = find_terms_in_text(text, search_terms, automaton)
+            hits = found.intersection(batch)
+            terms.update(hits if hits else batch)
+        terms_matched.append(' | '.join(sorted(terms)))
+    return terms_matched
+
+
+def dump_json_line(obj):
+    """
+    Serialize an object as a single compact JSON line (bytes, newline-terminated).
+
+    Uses orjson when available, falling back to the standard json module.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj, separators=(',', ':')) + "\n").encode('utf-8')
+
+
+def search_openalex(query, on_work, per_page=PER_PAGE, max_results=MAX_RESULTS_PER_TERM):
     """
     Search OpenAlex for papers matching the query using cursor-based pagination.
 
@@ -206,12 +419,17 @@ def search_openalex(query, per_page=PER_PAGE, max_results=MAX_RESULTS_PER_TERM):
     Uses cursor-based pagination (no result cap), unlike page-based
     pagination which is limited to 10,000 results.
 
+    Results are not accumulated: each work is handed to `on_work` as soon as
+    its page arrives, so memory use is bounded by a single page.
+
     API Documentation: https://docs.openalex.org/api-entities/works
 
     Parameters:
     -----------
     query : str
         Search query string (searches title, abstract, and full text)
+    on_work : callable
+        Called once per work dictionary, in API order
     per_page : int
         Number of results per page (max 200 per OpenAlex limits)
     max_results : int or None
@@ -220,16 +438,17 @@ def search_openalex(query, per_page=PER_PAGE, max_results=MAX_RESULTS_PER_TERM):
 
     Returns:
     --------
-    list : List of work dictionaries from OpenAlex API
+    int : Number of works passed to on_work
 
     Notes:
     ------
     - Uses cursor-based pagination ('cursor' parameter) for unlimited results
     - Uses the 'mailto' parameter for polite pool access (faster rate limits)
     - Uses thread-safe rate limiter for parallel processing
+    - Requests go through the cached SESSION (see HTTP_CACHE_FILE)
     - Stops early if no more results are available
     """
-    all_results = []
+    n_fetched = 0
     cursor = '*'  # Initial cursor value for first request
     batch_num = 0
 
@@ -237,7 +456,7 @@ def search_openalex(query, per_page=PER_PAGE, max_results=MAX_RESULTS_PER_TERM):
 
     while True:
         # Check max_results limit
-        if max_results is not None and len(all_results) >= max_results:
+        if max_results is not None and n_fetched >= max_results:
             break
 
         # OpenAlex API parameters with cursor pagination
@@ -250,16 +469,20 @@ def search_openalex(query, per_page=PER_PAGE, max_results=MAX_RESULTS_PER_TERM):
 
         try:
             rate_limiter.wait()  # Thread-safe rate limiting
-            response = requests.get(OPENALEX_API, params=params)
+            response = SESSION.get(OPENALEX_API, params=params)
             response.raise_for_status()
             data = response.json()
 
             results = data.get('results', [])
             if not results:
-                print(f"    [{query[:30]}...] No more results after {len(all_results)} total")
+                print(f"    [{query[:30]}...] No more results after {n_fetched} total")
                 break
 
-            all_results.extend(results)
+            if max_results is not None:
+                results = results[:max_results - n_fetched]
+            for work in results:
+                on_work(work)
+            n_fetched += len(results)
             batch_num += 1
 
             # Print progress every 5 batches or on first batch
@@ -267,12 +490,12 @@ def search_openalex(query, per_page=PER_PAGE, max_results=MAX_RESULTS_PER_TERM):
             total_available = meta.get('count', '?')
             if batch_num <= 2 or batch_num % 5 == 0:
                 print(f"    [{query[:30]}...] Batch {batch_num}: {len(results)} results "
-                      f"(total: {len(all_results)}/{total_available})")
+                      f"(total: {n_fetched}/{total_available})")
 
             # Get next cursor for pagination
             next_cursor = meta.get('next_cursor')
             if not next_cursor:
-                print(f"    [{query[:30]}...] Reached end at {len(all_results)} results")
+                print(f"    [{query[:30]}...] Reached end at {n_fetched} results")
                 break
             cursor = next_cursor
 
@@ -280,9 +503,7 @@ def search_openalex(query, per_page=PER_PAGE, max_results=MAX_RESULTS_PER_TERM):
             print(f"    [{query[:30]}...] ERROR at batch {batch_num + 1}: {e}")
             break
 
-    if max_results is not None:
-        return all_results[:max_results]
-    return all_results
+    return n_fetched
 
 
 def extract_paper_info(work):
@@ -376,6 +597,69 @@ def extract_paper_info(work):
     return paper_info
 
 
+def downcast_dtypes(df):
+    """
+    Downcast numeric/boolean columns to the smallest dtypes that hold them.
+
+    Years fit in Int16 (nullable), citation counts in int32 and author
+    counts in int16.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Paper dataset (modified in place)
+
+    Returns:
+    --------
+    pd.DataFrame : The same DataFrame with downcast columns
+    """
+    if 'publication_year' in df.columns:
+        df['publication_year'] = pd.to_numeric(df['publication_year'], errors='coerce').astype('Int16')
+    if 'policy_year' in df.columns:
+        df['policy_year'] = df['policy_year'].astype('int16')
+    if 'cited_by_count' in df.columns:
+        df['cited_by_count'] = df['cited_by_count'].fillna(0).astype('int32')
+    if 'author_count' in df.columns:
+        df['author_count'] = df['author_count'].fillna(0).astype('int16')
+    if 'is_open_access' in df.columns:
+        df['is_open_access'] = df['is_open_access'].fillna(False).astype(bool)
+    return df
+
+
+def write_parquet(df, parquet_file, file_metadata=None):
+    """
+    Write a DataFrame to Parquet with zstd compression and dictionary encoding.
+
+    The Arrow conversion runs column-parallel, and column statistics are only
+    written for the numeric columns in STATISTICS_COLUMNS.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Data to write
+    parquet_file : str
+        Output path
+    file_metadata : dict or None
+        Extra key/value pairs stored in the Parquet file-level metadata
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False, nthreads=pa.cpu_count())
+    if file_metadata:
+        schema_metadata = dict(table.schema.metadata or {})
+        schema_metadata.update({str(k).encode(): str(v).encode() for k, v in file_metadata.items()})
+        table = table.replace_schema_metadata(schema_metadata)
+    dictionary_cols = [c for c in DICTIONARY_COLUMNS if c in table.column_names]
+    statistics_cols = [c for c in STATISTICS_COLUMNS if c in table.column_names]
+    pq.write_table(
+        table, parquet_file,
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+        use_dictionary=dictionary_cols,
+        write_statistics=statistics_cols,
+        row_group_size=PARQUET_ROW_GROUP_SIZE,
+        data_page_size=PARQUET_DATA_PAGE_SIZE
+    )
+
+
 def normalize_title(title):
     """
     Normalize title for comparison.
@@ -638,7 +922,7 @@ def compare_with_semantic_scholar(policy_abbr):
     }
 
 
-def process_policy(policy_row):
+def process_policy(policy_row, emit_csv=False, terms_per_query=TERMS_PER_QUERY):
     """
     Process a single policy: search OpenAlex and save results.
 
@@ -646,19 +930,23 @@ def process_policy(policy_row):
     1. Parses search terms from the policy configuration
     2. Searches OpenAlex for each term and saves raw API responses
     3. Extracts structured paper information from results
-    4. Deduplicates papers (same paper may match multiple search terms)
+    4. Deduplicates papers at ingest time (same paper may match multiple search terms)
     5. Saves final dataset in Parquet and CSV formats
     6. Generates metadata with scraping statistics
 
     Parameters:
     -----------
-    policy_row : pd.Series
-        Row from policies DataFrame with columns:
+    policy_row : dict
+        Row from load_policies() with keys:
         - policy_name: Full name (e.g., "Tax Cuts and Jobs Act")
         - policy_abbreviation: Short code for filenames (e.g., "TCJA")
         - policy_year: Year enacted (e.g., 2017)
         - policy_category: Category (e.g., "tax", "health")
         - search_terms: Pipe-separated search queries
+    emit_csv : bool
+        Also write a CSV copy of the dataset (default: Parquet only)
+    terms_per_query : int
+        Number of search terms combined into one OR query (default: 1)
 
     Returns:
     --------
@@ -671,75 +959,92 @@ def process_policy(policy_row):
     Output Files:
     -------------
     - {abbr}_papers_openalex.parquet: Main dataset (efficient storage)
-    - {abbr}_papers_openalex.csv: Main dataset (compatibility)
+    - {abbr}_papers_openalex.csv: Main dataset (compatibility, only if emit_csv)
     - {abbr}_metadata.json: Scraping metadata and statistics
-    - tmp/raw_{abbr}_{term}.json: Raw API responses for each search term
+    - tmp/raw_{abbr}_{term}.jsonl: Raw API responses for each search term (NDJSON)
     """
     policy_name = policy_row['policy_name']
     policy_abbr = policy_row['policy_abbreviation']
-    policy_year = policy_row['policy_year']
+    policy_year = int(policy_row['policy_year'])
     policy_category = policy_row['policy_category']
     search_terms_str = policy_row['search_terms']
-    
+
     # Parse search terms (pipe-separated)
     search_terms = [term.strip() for term in search_terms_str.split('|')]
-    
+    query_batches = build_query_batches(search_terms, terms_per_query)
+
     print(f"\n{'='*80}")
     print(f"Processing: {policy_name} ({policy_abbr})")
     print(f"Year: {policy_year} | Category: {policy_category}")
     print(f"Search terms: {len(search_terms)}")
     print(f"{'='*80}")
-    
+
+    # Single timestamp for the whole policy run
+    scrape_time = datetime.now()
+
     all_papers = []
     search_metadata = []
     results_lock = threading.Lock()
+    # openalex_id -> set of term batches whose query found it. Papers are
+    # extracted only the first time their id is seen; later hits just record
+    # the batch.
+    matched_batches = {}
+
+    def search_batch(batch):
+        """Search for a batch of terms (one query) and return metadata."""
+        query = build_query(batch)
+        safe_term = batch[0].translate(SAFE_TERM_TRANS).lower()
+        if len(batch) > 1:
+            safe_term += f"_or_{len(batch) - 1}_more"
+        raw_file = RAW_PATH_TMPL.format(abbr=policy_abbr, term=safe_term)
+
+        # Stream raw works to disk and extract paper info in the same pass
+        with open(raw_file, 'wb') as f:
+            def on_work(work):
+                f.write(dump_json_line(work))
+                work_id = work.get('id', '')
+                with results_lock:
+                    if work_id in matched_batches:
+                        matched_batches[work_id].add(batch)
+                        return
+                    matched_batches[work_id] = {batch}
+                paper_info = extract_paper_info(work)
+                with results_lock:
+                    all_papers.append(paper_info)
 
-    def search_single_term(term):
-        """Search for a single term and return results with metadata."""
-        results = search_openalex(term, per_page=PER_PAGE, max_results=MAX_RESULTS_PER_TERM)
-
-        # Save raw results for this term
-        safe_term = term.replace(' ', '_').replace('/', '_').lower()
-        raw_file = os.path.join(TMP_DIR, f"raw_{policy_abbr}_{safe_term}.json")
-        with open(raw_file, 'w') as f:
-            json.dump(results, f, indent=2)
+            results_count = search_openalex(query, on_work, per_page=PER_PAGE,
+                                            max_results=MAX_RESULTS_PER_TERM)
         print(f"    Saved raw results to: {raw_file}")
 
-        # Extract paper info
-        papers = []
-        for work in results:
-            paper_info = extract_paper_info(work)
-            paper_info['search_term'] = term
-            papers.append(paper_info)
-
         metadata = {
-            'search_term': term,
-            'results_count': len(results),
+            'search_term': query,
+            'batch_terms': list(batch),
+            'results_count': results_count,
             'timestamp': datetime.now().isoformat()
         }
 
-        print(f"    Extracted info from {len(results)} papers for '{term}'")
-        return papers, metadata
+        print(f"    Extracted info from {results_count} papers for '{query}'")
+        return metadata
 
-    # Search for each term in parallel
-    print(f"\n  Searching {len(search_terms)} terms in parallel (max {MAX_WORKERS} workers)...")
+    # Search for each query in parallel
+    print(f"\n  Searching {len(search_terms)} terms in {len(query_batches)} queries "
+          f"in parallel (max {MAX_WORKERS} workers)...")
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_term = {executor.submit(search_single_term, term): term for term in search_terms}
+        future_to_batch = {executor.submit(search_batch, batch): batch for batch in query_batches}
 
-        for future in as_completed(future_to_term):
-            term = future_to_term[future]
+        for future in as_completed(future_to_batch):
+            batch = future_to_batch[future]
             try:
-                papers, metadata = future.result()
+                metadata = future.result()
                 with results_lock:
-                    all_papers.extend(papers)
                     search_metadata.append(metadata)
             except Exception as e:
-                print(f"    ERROR processing term '{term}': {e}")
+                print(f"    ERROR processing query '{build_query(batch)}': {e}")
     
-    # Create DataFrame
-    df = pd.DataFrame(all_papers)
+    # Create DataFrame (already one row per openalex_id)
+    df_unique = pd.DataFrame(all_papers)
 
-    if len(df) == 0:
+    if len(df_unique) == 0:
         print(f"\n  WARNING: No papers found for {policy_name}")
         return {
             'policy_abbreviation': policy_abbr,
@@ -750,21 +1055,13 @@ def process_policy(policy_row):
             'pre_policy_filtered': 0
         }
 
-    initial_count = len(df)
-
-    # Aggregate all search terms for each paper (instead of keeping just the first)
-    print(f"\n  Aggregating search terms and removing duplicates...")
-    search_terms_agg = df.groupby('openalex_id')['search_term'].apply(
-        lambda x: ' | '.join(sorted(set(x)))
-    ).reset_index()
-    search_terms_agg.columns = ['openalex_id', 'search_terms_matched']
-
-    # Keep first occurrence of each paper (for other columns)
-    df_unique = df.drop_duplicates(subset=['openalex_id'], keep='first').copy()
+    initial_count = sum(m['results_count'] for m in search_metadata)
 
-    # Merge aggregated search terms
-    df_unique = df_unique.drop(columns=['search_term'])
-    df_unique = df_unique.merge(search_terms_agg, on='openalex_id', how='left')
+    # Attach all search terms that found each paper (instead of keeping just the first)
+    print(f"\n  Aggregating search terms (duplicates skipped at ingest)...")
+    df_unique['search_terms_matched'] = attribute_search_terms(
+        df_unique, matched_batches, search_terms
+    )
 
     duplicate_count = initial_count - len(df_unique)
     print(f"    Initial: {initial_count} | Duplicates: {duplicate_count} | Unique: {len(df_unique)}")
@@ -788,7 +1085,7 @@ def process_policy(policy_row):
     df_unique['policy_abbreviation'] = policy_abbr
     df_unique['policy_category'] = policy_category
     df_unique['data_source'] = 'OpenAlex'
-    df_unique['scrape_date'] = datetime.now().strftime('%Y-%m-%d')
+    df_unique['scrape_date'] = scrape_time.strftime('%Y-%m-%d')
 
     # Reorder columns (search_terms_matched contains all matched terms)
     column_order = [
@@ -800,17 +1097,24 @@ def process_policy(policy_row):
         'policy_category', 'data_source', 'scrape_date', 'url'
     ]
     df_unique = df_unique[[c for c in column_order if c in df_unique.columns]]
+    df_unique = downcast_dtypes(df_unique.copy())
 
     # Save RAW outputs (no relevance filtering applied)
     # Save as Parquet (primary format)
-    parquet_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_openalex_raw.parquet")
-    df_unique.to_parquet(parquet_file, index=False, engine='pyarrow')
+    parquet_file = PARQUET_PATH_TMPL.format(abbr=policy_abbr)
+    write_parquet(df_unique, parquet_file, file_metadata={
+        'policy_name': policy_name,
+        'policy_abbreviation': policy_abbr,
+        'data_source': 'OpenAlex',
+        'scrape_date': scrape_time.isoformat()
+    })
     print(f"\n  Saved RAW Parquet: {parquet_file}")
 
-    # Save as CSV (for compatibility)
-    csv_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_openalex_raw.csv")
-    df_unique.to_csv(csv_file, index=False, encoding='utf-8')
-    print(f"  Saved RAW CSV: {csv_file}")
+    # Save as CSV (for compatibility, opt-in)
+    if emit_csv:
+        csv_file = CSV_PATH_TMPL.format(abbr=policy_abbr)
+        df_unique.to_csv(csv_file, index=False, encoding='utf-8')
+        print(f"  Saved RAW CSV: {csv_file}")
 
     # Save metadata
     metadata = {
@@ -819,7 +1123,7 @@ def process_policy(policy_row):
         'policy_year': int(policy_year),
         'policy_category': policy_category,
         'search_terms': search_terms,
-        'scrape_date': datetime.now().isoformat(),
+        'scrape_date': scrape_time.isoformat(),
         'total_papers_found': initial_count,
         'duplicates_removed': duplicate_count,
         'acronym_filtered': acronym_filtered_count,
@@ -829,7 +1133,7 @@ def process_policy(policy_row):
         'search_details': search_metadata
     }
 
-    metadata_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_openalex_metadata.json")
+    metadata_file = METADATA_PATH_TMPL.format(abbr=policy_abbr)
     with open(metadata_file, 'w') as f:
         json.dump(metadata, f, indent=2)
     print(f"  Saved metadata: {metadata_file}")
@@ -868,6 +1172,9 @@ def main():
     parser = argparse.ArgumentParser(description="Policy papers scraping from OpenAlex")
     parser.add_argument('policies', nargs='*', help='Policy abbreviations to process (default: all)')
     parser.add_argument('--resume', action='store_true', help='Skip policies already completed today')
+    parser.add_argument('--emit-csv', action='store_true', help='Also write CSV copies of the raw datasets')
+    parser.add_argument('--batch-terms', type=int, default=TERMS_PER_QUERY,
+                        help='Combine up to N search terms per OR query (default: 1, one query per term)')
     args = parser.parse_args()
 
     print("="*80)
@@ -879,22 +1186,22 @@ def main():
     print()
 
     # Load policies configuration
-    policies_df = load_policies(POLICIES_FILE)
+    policies = load_policies(POLICIES_FILE)
 
     # Filter to requested policies if specified
     if args.policies:
-        policies_df = policies_df[policies_df['policy_abbreviation'].isin(args.policies)]
-        if policies_df.empty:
+        policies = [row for row in policies if row['policy_abbreviation'] in args.policies]
+        if not policies:
             print(f"ERROR: No matching policies found for {args.policies}")
             return
 
     print(f"\nPolicies to process:")
-    for _, row in policies_df.iterrows():
+    for row in policies:
         print(f"  - {row['policy_name']} ({row['policy_abbreviation']})")
 
     # Process each policy
     all_summaries = []
-    for idx, row in policies_df.iterrows():
+    for row in policies:
         policy_abbr = row['policy_abbreviation']
 
         # Check checkpoint in resume mode
@@ -903,7 +1210,8 @@ def main():
             continue
 
         try:
-            summary = process_policy(row)
+            summary = process_policy(row, emit_csv=args.emit_csv,
+                                     terms_per_query=max(1, args.batch_terms))
             all_summaries.append(summary)
         except Exception as e:
             print(f"\n  ERROR processing {row['policy_name']}: {e}")
@@ -933,7 +1241,7 @@ def main():
     print(f"{'='*80}")
 
     nber_comparison_results = []
-    for _, row in policies_df.iterrows():
+    for row in policies:
         policy_abbr = row['policy_abbreviation']
         try:
             comparison = compare_with_nber(policy_abbr)
@@ -957,7 +1265,7 @@ def main():
     print(f"{'='*80}")
 
     ss_comparison_results = []
-    for _, row in policies_df.iterrows():
+    for row in policies:
         policy_abbr = row['policy_abbreviation']
         try:
             comparison = compare_with_semantic_scholar(policy_abbr)
@@ -11,9 +11,10 @@ Pipeline Overview:
 1. Load policy configurations from ../get_policies/output/policies.csv
 2. For each policy, search Semantic Scholar using ALL search terms (pipe-separated in CSV)
 3. Extract paper metadata (title, authors, abstract, year, etc.)
-4. Deduplicate results, tracking ALL search terms that found each paper
-5. Filter papers by publication date (must be >= policy year)
-6. Save RAW results (no relevance filtering) to Parquet/CSV
+4. Deduplicate results, tracking ALL search terms that found each paper, and
+   filter papers by publication date (must be >= policy year) in one pass
+5. Validate matches found only by short acronyms (case-sensitive)
+6. Save RAW results (no relevance filtering) to Parquet (CSV with --emit-csv)
 7. Compare with OpenAlex and NBER results to check coverage
 
 Key Implementation Notes:
@@ -26,14 +27,25 @@ Key Implementation Notes:
 - Uses bulk search endpoint (/paper/search/bulk) with token-based pagination (no 10K cap)
 - API key required: Set SEMANTIC_SCHOLAR_API_KEY environment variable
 - Rate limit: 1 request per second (enforced by thread-safe RateLimiter)
-- Search terms are processed in parallel using ThreadPoolExecutor (MAX_WORKERS=2 due to strict rate limits)
+- All requests share one pooled requests.Session (keep-alive, gzip, 5xx retries)
+- API responses are cached in tmp/http_cache.sqlite (requests-cache, 7-day expiry);
+  cached pages skip the RateLimiter. Use --no-cache to force fresh requests.
+- With --resume, policies completed today or whose raw Parquet + metadata are
+  newer than policies.csv are skipped (summary read from the metadata JSON).
+- Search terms are processed in parallel using ThreadPoolExecutor. The shared RateLimiter
+  caps the aggregate request rate, so extra workers only overlap round-trips: with
+  large bulk pages (up to 1000 papers) a response often takes longer than the 1.1s
+  request spacing, and more in-flight terms keep the rate-limit budget saturated.
+- Policies are also processed concurrently (MAX_POLICY_WORKERS) against the same RateLimiter.
 - NO relevance filtering at this stage - filtering happens after abstract recovery.
 - Tracks ALL search terms that found each paper (pipe-separated in search_terms_matched column).
 
 Output Files:
 -------------
 - {abbr}_papers_semantic_scholar_raw.parquet: Raw dataset (efficient storage)
-- {abbr}_papers_semantic_scholar_raw.csv: Raw dataset (compatibility)
+- {abbr}_papers_semantic_scholar_raw.csv: Raw dataset (compatibility, only with --emit-csv)
+- {abbr}_*_indicator.parquet: Per-paper coverage flags vs OpenAlex/NBER (.csv copies with --emit-csv).
+  The OpenAlex/NBER-side files carry only the id/title/year columns plus the flag.
 - {abbr}_semantic_scholar_metadata.json: Scraping metadata and statistics
 
 Author: Claude AI with modifications by Roberto Gonzalez
@@ -45,9 +57,16 @@ Updated: February 6, 2026 - Switch to bulk API (no 10K cap), parallelize search
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 import argparse
 import json
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import time
 import re
 from datetime import datetime
@@ -56,6 +75,14 @@ import sys
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+import hashlib
+
+# orjson — optional dependency (faster serialization of raw API responses)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Load environment variables from .env file
 # Look for .env in the repo root (three levels up from this script)
@@ -80,7 +107,62 @@ API_FIELDS = "paperId,title,abstract,authors,year,citationCount,venue,publicatio
 MAX_RESULTS_PER_TERM = None   # No limit with token-based bulk pagination
 PER_PAGE = 1000               # Results per API page (bulk endpoint allows up to 1000)
 RATE_LIMIT_DELAY = 1.1        # Seconds between API requests (strict for SS)
-MAX_WORKERS = 2               # Conservative due to SS strict rate limits
+MAX_WORKERS = 4               # In-flight search terms (aggregate rate still capped by RateLimiter)
+MAX_POLICY_WORKERS = 4        # Policies scraped concurrently (share the same RateLimiter)
+REQUEST_TIMEOUT = (5, 30)     # (connect, read) seconds per API request
+MAX_RATE_LIMIT_WAIT = 120.0   # Cap on server-requested 429 waits (seconds)
+HTTP_POOL_SIZE = 16           # Keep-alive connections kept open to the API host
+
+# Title normalization patterns (compiled once)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+# Semantic Scholar API field (flattened) -> output column
+SS_FIELD_MAP = {
+    'paperId': 'semantic_scholar_id',
+    'title': 'title',
+    'abstract': 'abstract',
+    'year': 'publication_year',
+    'publicationDate': 'publication_date',
+    'venue': 'venue',
+    'citationCount': 'cited_by_count',
+    'isOpenAccess': 'is_open_access',
+    'openAccessPdf.url': 'open_access_url',
+}
+
+# Free-text columns stored as Arrow-backed strings (less memory, faster .str ops)
+STRING_COLUMNS = ['semantic_scholar_id', 'title', 'authors', 'abstract', 'venue', 'open_access_url']
+
+# Arrow schema of the per-term paper batches streamed to disk in process_policy
+PAPER_SCHEMA = pa.schema([
+    ('semantic_scholar_id', pa.string()),
+    ('title', pa.string()),
+    ('abstract', pa.string()),
+    ('publication_year', pa.int16()),
+    ('publication_date', pa.string()),
+    ('venue', pa.string()),
+    ('cited_by_count', pa.int32()),
+    ('is_open_access', pa.bool_()),
+    ('open_access_url', pa.string()),
+    ('authors', pa.string()),
+    ('author_count', pa.int16()),
+    ('data_source', pa.string()),
+    ('search_term', pa.string()),
+    ('policy_studied', pa.string()),
+    ('policy_year', pa.int16()),
+    ('policy_abbreviation', pa.string()),
+    ('policy_category', pa.string()),
+    ('scrape_date', pa.string()),
+])
+
+# Parquet output settings. Low-cardinality columns (policy fields, venue, ...)
+# are dictionary-encoded; free text (titles, abstracts) is stored plain.
+# Outputs are small (thousands of rows), so each file is a single row group.
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+PARQUET_DATA_PAGE_SIZE = 1 << 20  # 1 MiB
+DICTIONARY_COLUMNS = ['venue', 'policy_studied', 'policy_abbreviation', 'policy_category',
+                      'data_source', 'scrape_date', 'search_terms_matched']
 
 # Output paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -98,6 +180,15 @@ OPENALEX_OUTPUT_DIR = os.path.normpath(OPENALEX_OUTPUT_DIR)
 NBER_OUTPUT_DIR = os.path.join(SCRIPT_DIR, "..", "scrape_policies_nber", "output")
 NBER_OUTPUT_DIR = os.path.normpath(NBER_OUTPUT_DIR)
 
+# Columns read from the other sources for comparison (abstracts etc. are skipped);
+# these also make up their *_semantic_scholar_indicator files
+OPENALEX_COMPARE_COLUMNS = ('openalex_id', 'doi', 'title', 'publication_year')
+NBER_COMPARE_COLUMNS = ('nber_id', 'title', 'publication_year')
+
+# On-disk HTTP response cache (re-runs skip pages already fetched)
+HTTP_CACHE_FILE = os.path.join(TMP_DIR, "http_cache.sqlite")
+HTTP_CACHE_EXPIRE_SECONDS = 7 * 86400
+
 # Create directories if they don't exist
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 os.makedirs(TMP_DIR, exist_ok=True)
@@ -122,6 +213,60 @@ class RateLimiter:
 rate_limiter = RateLimiter(RATE_LIMIT_DELAY)
 
 
+def build_session():
+    """
+    Build a shared HTTP session for the Semantic Scholar API.
+
+    Successive pages and search terms reuse pooled keep-alive connections
+    instead of paying a new TCP + TLS handshake per request. Transient 5xx
+    errors are retried by urllib3 with backoff; 429 responses are left to
+    search_semantic_scholar so that retries still go through the RateLimiter.
+    Successful responses are cached on disk (HTTP_CACHE_FILE), keyed on the
+    full request URL (query, fields, limit, continuation token), so re-runs
+    replay previously fetched pages without hitting the API. The API key
+    header is excluded from the cache key and stored responses.
+
+    Returns:
+    --------
+    CachedSession : Session with pooled HTTPS adapter and default headers
+    """
+    session = CachedSession(
+        HTTP_CACHE_FILE,
+        backend='sqlite',
+        expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+        allowable_methods=('GET',),
+        stale_if_error=True
+    )
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session.mount("https://", adapter)
+    session.headers.update({
+        'User-Agent': 'PolEconResearch/1.0',
+        'Accept-Encoding': 'gzip'
+    })
+    if SEMANTIC_SCHOLAR_API_KEY:
+        session.headers['x-api-key'] = SEMANTIC_SCHOLAR_API_KEY
+    return session
+
+
+SESSION = build_session()
+
+
+def is_cached(params):
+    """Return True if a fresh cached response exists for this API request."""
+    if SESSION.settings.disabled:
+        return False
+    request = SESSION.prepare_request(requests.Request('GET', SEMANTIC_SCHOLAR_API, params=params))
+    response = SESSION.cache.get_response(SESSION.cache.create_key(request))
+    return response is not None and not response.is_expired
+
+
 def load_policies(policies_file):
     """
     Load policy configurations from CSV file.
@@ -162,6 +307,46 @@ def load_policies(policies_file):
     return df
 
 
+def rate_limit_wait_seconds(response, retry):
+    """
+    Seconds to wait after a 429 response.
+
+    Uses the Retry-After header when present, otherwise the
+    x-ratelimit-reset header (epoch timestamp or seconds remaining), and
+    falls back to a short linear backoff (1s, 2s, 3s, ...) when neither
+    is set.
+
+    Parameters:
+    -----------
+    response : requests.Response
+        The 429 response
+    retry : int
+        Zero-based retry attempt
+
+    Returns:
+    --------
+    float : Seconds to sleep (between 1 and MAX_RATE_LIMIT_WAIT)
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is not None:
+        try:
+            return min(MAX_RATE_LIMIT_WAIT, max(1.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form; fall through
+
+    reset = response.headers.get('x-ratelimit-reset')
+    if reset is not None:
+        try:
+            reset = float(reset)
+            # Large values are epoch timestamps, small ones a delta in seconds
+            wait = reset - time.time() if reset > 1e9 else reset
+            return min(MAX_RATE_LIMIT_WAIT, max(1.0, wait))
+        except ValueError:
+            pass
+
+    return 1.0 + retry
+
+
 def search_semantic_scholar(query, limit=PER_PAGE, max_results=MAX_RESULTS_PER_TERM, max_retries=3):
     """
     Search Semantic Scholar for papers matching the query.
@@ -185,15 +370,11 @@ def search_semantic_scholar(query, limit=PER_PAGE, max_results=MAX_RESULTS_PER_T
     list : List of paper dictionaries from Semantic Scholar API
     """
     all_results = []
+    seen_ids = set()  # paperIds already collected (pages can overlap)
     continuation_token = None
 
     print(f"  Searching Semantic Scholar for: '{query}'")
 
-    # Set up headers with API key if available
-    headers = {}
-    if SEMANTIC_SCHOLAR_API_KEY:
-        headers['x-api-key'] = SEMANTIC_SCHOLAR_API_KEY
-
     while True:
         # Check max_results limit
         if max_results is not None and len(all_results) >= max_results:
@@ -212,13 +393,17 @@ def search_semantic_scholar(query, limit=PER_PAGE, max_results=MAX_RESULTS_PER_T
         # Retry logic for rate limit errors
         for retry in range(max_retries):
             try:
-                rate_limiter.wait()
-                response = requests.get(SEMANTIC_SCHOLAR_API, params=params, headers=headers)
+                # Cached pages are replayed from disk and do not count against the rate limit
+                if not is_cached(params):
+                    rate_limiter.wait()
+                response = SESSION.get(SEMANTIC_SCHOLAR_API, params=params, timeout=REQUEST_TIMEOUT)
 
-                # Handle rate limit (429) with exponential backoff
+                # Handle rate limit (429): wait as long as the server asks
                 if response.status_code == 429:
-                    wait_time = (2 ** retry) * 5  # 5, 10, 20 seconds
-                    print(f"    Rate limited. Waiting {wait_time}s before retry {retry + 1}/{max_retries}...")
+                    wait_time = rate_limit_wait_seconds(response, retry)
+                    print(f"    Rate limited (Retry-After: {response.headers.get('Retry-After')}, "
+                          f"x-ratelimit-reset: {response.headers.get('x-ratelimit-reset')}). "
+                          f"Waiting {wait_time:.1f}s before retry {retry + 1}/{max_retries}...")
                     time.sleep(wait_time)
                     continue
 
@@ -232,9 +417,17 @@ def search_semantic_scholar(query, limit=PER_PAGE, max_results=MAX_RESULTS_PER_T
                         return all_results[:max_results]
                     return all_results
 
-                all_results.extend(results)
+                # Record each id as it is accepted, so repeats within the
+                # same page are skipped too
+                new_results = []
+                for paper in results:
+                    paper_id = paper.get('paperId')
+                    if paper_id and paper_id not in seen_ids:
+                        seen_ids.add(paper_id)
+                        new_results.append(paper)
+                all_results.extend(new_results)
                 total = data.get('total', 0)
-                print(f"    Page: {len(results)} results (total: {len(all_results)}/{total})")
+                print(f"    Page: {len(results)} results, {len(new_results)} new (total: {len(all_results)}/{total})")
 
                 # Get continuation token for next page
                 continuation_token = data.get('token')
@@ -262,47 +455,150 @@ def search_semantic_scholar(query, limit=PER_PAGE, max_results=MAX_RESULTS_PER_T
     return all_results
 
 
-def extract_paper_info(paper):
+def extract_papers_frame(results):
     """
-    Extract relevant information from Semantic Scholar paper object.
+    Build a DataFrame of paper information from Semantic Scholar paper objects.
+
+    Flattens the API results in one pd.json_normalize call and renames the
+    fields via SS_FIELD_MAP, instead of building one dict per paper. Author
+    lists are exploded into one name per (row, author) and aggregated with a
+    groupby on the row position, so repeated paperIds keep their own authors.
 
     Parameters:
     -----------
-    paper : dict
-        Semantic Scholar paper object from API response
+    results : list
+        Semantic Scholar paper objects from API responses
 
     Returns:
     --------
-    dict : Extracted paper information
+    pd.DataFrame : One row per paper with the extracted columns
     """
-    # Extract authors
-    authors = paper.get('authors', [])
-    if isinstance(authors, list):
-        author_names = [a.get('name', '') if isinstance(a, dict) else str(a) for a in authors]
-        authors_str = ' | '.join(author_names)
+    if not results:
+        return pd.DataFrame(columns=list(SS_FIELD_MAP.values()) + ['authors', 'author_count', 'data_source'])
+
+    raw = pd.json_normalize(results, sep='.')
+    df = pd.DataFrame(index=raw.index)
+    for field, col in SS_FIELD_MAP.items():
+        df[col] = raw[field] if field in raw.columns else None
+
+    # Authors: list of {'authorId', 'name'} dicts -> pipe-separated names.
+    # explode keeps raw's row index, so grouping on it maps names back by
+    # position (not by paperId, which may repeat within a batch)
+    authors = raw['authors'].explode().dropna() if 'authors' in raw.columns else pd.Series(dtype=object)
+    if len(authors) > 0:
+        author_groups = authors.str.get('name').fillna('').astype(str).groupby(level=0, sort=False)
+        df['authors'] = author_groups.agg(' | '.join).reindex(df.index, fill_value='')
+        df['author_count'] = author_groups.size().reindex(df.index, fill_value=0).astype('int32')
     else:
-        authors_str = str(authors) if authors else ''
-
-    # Extract open access PDF URL
-    oa_pdf = paper.get('openAccessPdf', {})
-    oa_url = oa_pdf.get('url', '') if isinstance(oa_pdf, dict) else ''
-
-    paper_info = {
-        'semantic_scholar_id': paper.get('paperId', ''),
-        'title': paper.get('title', ''),
-        'abstract': paper.get('abstract', ''),
-        'authors': authors_str,
-        'author_count': len(author_names) if isinstance(authors, list) else 0,
-        'publication_year': paper.get('year'),
-        'publication_date': paper.get('publicationDate', ''),
-        'venue': paper.get('venue', ''),
-        'cited_by_count': paper.get('citationCount', 0),
-        'is_open_access': paper.get('isOpenAccess', False),
-        'open_access_url': oa_url,
-        'data_source': 'SemanticScholar'
-    }
+        df['authors'] = ''
+        df['author_count'] = 0
+
+    # Cast before filling: fillna on object columns triggers a downcast warning
+    df['cited_by_count'] = pd.to_numeric(df['cited_by_count'], errors='coerce').fillna(0).astype('int64')
+    df['is_open_access'] = df['is_open_access'].astype('boolean').fillna(False).astype(bool)
+    df['open_access_url'] = df['open_access_url'].fillna('')
+    df['data_source'] = 'SemanticScholar'
+    return df
+
+
+def paper_id_keys(ids):
+    """
+    Map Semantic Scholar paper IDs to 64-bit integer keys for deduplication.
+
+    Semantic Scholar paperIds are 40-character hex SHA-1 digests, so the first
+    16 hex characters already form a well-distributed uint64. Hashing and
+    comparing 8-byte integers is cheaper than 40-byte strings. If any ID is
+    not hex (or missing), falls back to pandas' vectorized string hash.
+
+    Parameters:
+    -----------
+    ids : pd.Series
+        semantic_scholar_id column
+
+    Returns:
+    --------
+    pd.Series : uint64 keys aligned with ids
+    """
+    prefixes = ids.fillna('').astype(str).str.slice(0, 16)
+    try:
+        if not (prefixes.str.len() == 16).all():
+            raise ValueError("short paperId")
+        keys = np.frombuffer(bytes.fromhex(''.join(prefixes)), dtype='>u8').astype(np.uint64)
+    except ValueError:
+        keys = pd.util.hash_array(ids.fillna('').astype(str).to_numpy())
+    return pd.Series(keys, index=ids.index, dtype='uint64')
+
+
+def downcast_dtypes(df):
+    """
+    Downcast numeric/boolean columns to the smallest dtypes that hold them.
+
+    Years fit in Int16 (nullable), citation counts in int32 and author
+    counts in int16.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Paper dataset (modified in place)
+
+    Returns:
+    --------
+    pd.DataFrame : The same DataFrame with downcast columns
+    """
+    if 'publication_year' in df.columns:
+        df['publication_year'] = pd.to_numeric(df['publication_year'], errors='coerce').astype('Int16')
+    if 'policy_year' in df.columns:
+        df['policy_year'] = df['policy_year'].astype('int16')
+    if 'cited_by_count' in df.columns:
+        df['cited_by_count'] = df['cited_by_count'].fillna(0).astype('int32')
+    if 'author_count' in df.columns:
+        df['author_count'] = df['author_count'].fillna(0).astype('int16')
+    if 'is_open_access' in df.columns:
+        df['is_open_access'] = df['is_open_access'].fillna(False).astype(bool)
+    return df
 
-    return paper_info
+
+def write_parquet(df, parquet_file):
+    """
+    Write a DataFrame to Parquet with the scraper's compression/encoding settings.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Data to write
+    parquet_file : str
+        Output path
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(
+        table,
+        parquet_file,
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+        row_group_size=max(table.num_rows, 1),
+        data_page_size=PARQUET_DATA_PAGE_SIZE,
+        use_dictionary=[c for c in DICTIONARY_COLUMNS if c in table.column_names]
+    )
+
+
+def dump_json_bytes(obj):
+    """
+    Serialize raw API results compactly (no indentation).
+
+    Uses orjson when available, falling back to the standard json module.
+
+    Parameters:
+    -----------
+    obj : list or dict
+        JSON-serializable object
+
+    Returns:
+    --------
+    bytes : UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
 
 
 def normalize_title(title):
@@ -320,10 +616,95 @@ def normalize_title(title):
     """
     if not title or pd.isna(title):
         return ''
-    title = str(title).lower()
-    title = re.sub(r'[^\w\s]', '', title)  # Remove punctuation
-    title = ' '.join(title.split())  # Normalize whitespace
-    return title
+    # Remove punctuation, then collapse whitespace
+    return _WS_RE.sub(' ', _PUNCT_RE.sub('', str(title).lower())).strip()
+
+
+def normalize_title_series(titles):
+    """
+    Vectorized version of normalize_title for a whole column.
+
+    Duplicate titles are common (within a source and across sources), so
+    only the distinct titles are normalized and the result is mapped back.
+
+    Parameters:
+    -----------
+    titles : pd.Series
+        Paper titles
+
+    Returns:
+    --------
+    pd.Series : Normalized titles (same rules as normalize_title, '' for missing)
+    """
+    codes, uniques = pd.factorize(titles.fillna('').astype(str))
+    normalized = (
+        pd.Series(uniques, dtype=object)
+        .str.lower()
+        .str.replace(_PUNCT_RE, '', regex=True)
+        .str.split()
+        .str.join(' ')
+        .to_numpy()
+    )
+    return pd.Series(normalized[codes], index=titles.index, dtype=object)
+
+
+def title_fingerprints(normalized_titles):
+    """
+    Compute 64-bit fingerprints of normalized titles.
+
+    Each distinct title is hashed once with blake2b (8-byte digest); the
+    digests are joined and reinterpreted as one uint64 array, so joins
+    between sources compare integers instead of variable-length strings.
+
+    Parameters:
+    -----------
+    normalized_titles : pd.Series
+        Output of normalize_title_series
+
+    Returns:
+    --------
+    pd.Series : uint64 fingerprints aligned with normalized_titles
+    """
+    codes, uniques = pd.factorize(normalized_titles.astype(str))
+    digests = b''.join(
+        hashlib.blake2b(t.encode('utf-8'), digest_size=8).digest()
+        for t in uniques
+    )
+    fingerprints = np.frombuffer(digests, dtype='<u8')[codes]
+    return pd.Series(fingerprints, index=normalized_titles.index, dtype='uint64')
+
+
+def add_title_keys(df):
+    """
+    Return df with normalized_title and title_h64 columns (df is not modified).
+
+    A stored title_h64 (e.g. from the raw Parquet) is reused as-is.
+    """
+    normalized = normalize_title_series(df['title'])
+    if 'title_h64' in df.columns:
+        return df.assign(normalized_title=normalized, title_h64=df['title_h64'].astype('uint64'))
+    return df.assign(normalized_title=normalized, title_h64=title_fingerprints(normalized))
+
+
+def titles_present_in(title_keys, other_title_keys):
+    """
+    Flag which titles also appear in another source.
+
+    Uses a single vectorized hash lookup (Series.isin) of the title
+    fingerprints against the keys of the other source.
+
+    Parameters:
+    -----------
+    title_keys : pd.Series
+        title_h64 fingerprints to check
+    other_title_keys : pd.Series
+        title_h64 fingerprints of the other source
+
+    Returns:
+    --------
+    np.ndarray : Boolean flags aligned with title_keys
+    """
+    return pd.Series(title_keys).isin(other_title_keys).to_numpy(dtype=bool)
 
 
 def validate_acronym_matches(df):
@@ -377,71 +758,119 @@ def validate_acronym_matches(df):
     return df[keep].copy(), n_dropped
 
 
-def compare_with_openalex(policy_abbr):
+def load_parquet_or_csv(path_stem, columns=None):
     """
-    Compare Semantic Scholar papers with OpenAlex coverage.
+    Load {path_stem}.parquet, or {path_stem}.csv if no Parquet file exists.
+
+    Parameters:
+    -----------
+    path_stem : str
+        File path without extension
+    columns : tuple or None
+        Columns to read (those missing from the file are skipped); None reads all
+
+    Returns:
+    --------
+    pd.DataFrame or None : Loaded data, or None if neither file exists
+    """
+    parquet_file = path_stem + '.parquet'
+    if os.path.exists(parquet_file):
+        if columns is not None:
+            available = set(pq.read_schema(parquet_file).names)
+            columns = [c for c in columns if c in available]
+        return pd.read_parquet(parquet_file, columns=columns, dtype_backend='pyarrow')
+    csv_file = path_stem + '.csv'
+    if os.path.exists(csv_file):
+        usecols = (lambda c: c in columns) if columns is not None else None
+        return pd.read_csv(csv_file, usecols=usecols, dtype_backend='pyarrow')
+    return None
+
+
+def load_source_papers(output_dir, policy_abbr, source, columns=None):
+    """
+    Load a source's papers for a policy, trying raw outputs before regular ones.
 
     Parameters:
     -----------
+    output_dir : str
+        Output directory of the source's scraper
     policy_abbr : str
         Policy abbreviation (e.g., "TCJA")
+    source : str
+        Source file tag (e.g., "openalex", "nber", "semantic_scholar")
+    columns : tuple or None
+        Columns to read; None reads all
 
     Returns:
     --------
-    dict : Comparison statistics
+    pd.DataFrame or None : Loaded papers, or None if not found
     """
-    print(f"\n  Comparing Semantic Scholar vs OpenAlex for {policy_abbr}...")
+    for suffix in ('_raw', ''):
+        df = load_parquet_or_csv(os.path.join(output_dir, f"{policy_abbr}_papers_{source}{suffix}"), columns)
+        if df is not None:
+            return df
+    return None
+
+
+def load_semantic_scholar_papers(policy_abbr):
+    """
+    Load a policy's Semantic Scholar papers with normalized titles.
 
-    # Load Semantic Scholar papers (try raw first, then regular)
-    ss_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_semantic_scholar_raw.parquet")
-    if not os.path.exists(ss_file):
-        ss_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_semantic_scholar_raw.csv")
-    if not os.path.exists(ss_file):
-        ss_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_semantic_scholar.parquet")
-    if not os.path.exists(ss_file):
-        ss_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_semantic_scholar.csv")
+    Tries the raw Parquet/CSV outputs first, then the regular ones.
 
-    if not os.path.exists(ss_file):
+    Parameters:
+    -----------
+    policy_abbr : str
+        Policy abbreviation (e.g., "TCJA")
+
+    Returns:
+    --------
+    pd.DataFrame or None : Papers with normalized_title/title_h64 columns, or None if not found
+    """
+    ss_df = load_source_papers(OUTPUT_DIR, policy_abbr, 'semantic_scholar')
+    if ss_df is None:
         print(f"    ERROR: Semantic Scholar file not found for {policy_abbr}")
         return None
 
-    if ss_file.endswith('.parquet'):
-        ss_df = pd.read_parquet(ss_file)
-    else:
-        ss_df = pd.read_csv(ss_file)
+    return add_title_keys(ss_df)
+
+
+def compare_with_openalex(policy_abbr, ss_df, emit_csv=False):
+    """
+    Compare Semantic Scholar papers with OpenAlex coverage.
+
+    Parameters:
+    -----------
+    policy_abbr : str
+        Policy abbreviation (e.g., "TCJA")
+    ss_df : pd.DataFrame
+        Semantic Scholar papers with title keys (see load_semantic_scholar_papers)
+    emit_csv : bool
+        Also write CSV copies of the indicator files
+
+    Returns:
+    --------
+    dict : Comparison statistics
+    """
+    print(f"\n  Comparing Semantic Scholar vs OpenAlex for {policy_abbr}...")
 
     # Load OpenAlex papers (try raw first, then regular)
-    openalex_file = os.path.join(OPENALEX_OUTPUT_DIR, f"{policy_abbr}_papers_openalex_raw.parquet")
-    if not os.path.exists(openalex_file):
-        openalex_file = os.path.join(OPENALEX_OUTPUT_DIR, f"{policy_abbr}_papers_openalex_raw.csv")
-    if not os.path.exists(openalex_file):
-        openalex_file = os.path.join(OPENALEX_OUTPUT_DIR, f"{policy_abbr}_papers_openalex.parquet")
-    if not os.path.exists(openalex_file):
-        openalex_file = os.path.join(OPENALEX_OUTPUT_DIR, f"{policy_abbr}_papers_openalex.csv")
-
-    if not os.path.exists(openalex_file):
+    openalex_df = load_source_papers(OPENALEX_OUTPUT_DIR, policy_abbr, 'openalex', OPENALEX_COMPARE_COLUMNS)
+    if openalex_df is None:
         print(f"    ERROR: OpenAlex file not found for {policy_abbr}")
         return None
 
-    if openalex_file.endswith('.parquet'):
-        openalex_df = pd.read_parquet(openalex_file)
-    else:
-        openalex_df = pd.read_csv(openalex_file)
-
     print(f"    Semantic Scholar papers: {len(ss_df)}")
     print(f"    OpenAlex papers: {len(openalex_df)}")
 
     # Normalize titles for matching
-    ss_df['normalized_title'] = ss_df['title'].apply(normalize_title)
-    openalex_df['normalized_title'] = openalex_df['title'].apply(normalize_title)
-
-    # Create sets for fast lookup
-    ss_titles = set(ss_df['normalized_title'].dropna())
-    openalex_titles = set(openalex_df['normalized_title'].dropna())
+    openalex_df = add_title_keys(openalex_df)
 
-    # Add indicators
-    ss_df['in_openalex'] = ss_df['normalized_title'].isin(openalex_titles)
-    openalex_df['in_semantic_scholar'] = openalex_df['normalized_title'].isin(ss_titles)
+    # Add indicators (assign returns a new frame, leaving the shared ss_df untouched)
+    ss_df = ss_df.assign(
+        in_openalex=titles_present_in(ss_df['title_h64'], openalex_df['title_h64'])
+    )
+    openalex_df['in_semantic_scholar'] = titles_present_in(openalex_df['title_h64'], ss_df['title_h64'])
 
     # Calculate statistics
     ss_in_openalex = ss_df['in_openalex'].sum()
@@ -451,13 +880,17 @@ def compare_with_openalex(policy_abbr):
     print(f"    OpenAlex papers also in Semantic Scholar: {openalex_in_ss} ({100*openalex_in_ss/len(openalex_df):.1f}%)")
 
     # Save with indicators
-    ss_indicator_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_semantic_scholar_openalex_indicator.csv")
-    ss_df.to_csv(ss_indicator_file, index=False)
+    ss_indicator_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_semantic_scholar_openalex_indicator.parquet")
+    write_parquet(ss_df, ss_indicator_file)
     print(f"    Saved: {ss_indicator_file}")
+    if emit_csv:
+        ss_df.to_csv(ss_indicator_file.replace('.parquet', '.csv'), index=False)
 
-    openalex_indicator_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_openalex_semantic_scholar_indicator.csv")
-    openalex_df.to_csv(openalex_indicator_file, index=False)
+    openalex_indicator_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_openalex_semantic_scholar_indicator.parquet")
+    write_parquet(openalex_df, openalex_indicator_file)
     print(f"    Saved: {openalex_indicator_file}")
+    if emit_csv:
+        openalex_df.to_csv(openalex_indicator_file.replace('.parquet', '.csv'), index=False)
 
     return {
         'policy_abbr': policy_abbr,
@@ -470,7 +903,7 @@ def compare_with_openalex(policy_abbr):
     }
 
 
-def compare_with_nber(policy_abbr):
+def compare_with_nber(policy_abbr, ss_df, emit_csv=False):
     """
     Compare Semantic Scholar papers with NBER coverage.
 
@@ -480,6 +913,10 @@ def compare_with_nber(policy_abbr):
     -----------
     policy_abbr : str
         Policy abbreviation (e.g., "TCJA")
+    ss_df : pd.DataFrame
+        Semantic Scholar papers with title keys (see load_semantic_scholar_papers)
+    emit_csv : bool
+        Also write CSV copies of the indicator files
 
     Returns:
     --------
@@ -487,56 +924,23 @@ def compare_with_nber(policy_abbr):
     """
     print(f"\n  Comparing Semantic Scholar vs NBER for {policy_abbr}...")
 
-    # Load Semantic Scholar papers (try raw first, then regular)
-    ss_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_semantic_scholar_raw.parquet")
-    if not os.path.exists(ss_file):
-        ss_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_semantic_scholar_raw.csv")
-    if not os.path.exists(ss_file):
-        ss_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_semantic_scholar.parquet")
-    if not os.path.exists(ss_file):
-        ss_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_semantic_scholar.csv")
-
-    if not os.path.exists(ss_file):
-        print(f"    ERROR: Semantic Scholar file not found for {policy_abbr}")
-        return None
-
-    if ss_file.endswith('.parquet'):
-        ss_df = pd.read_parquet(ss_file)
-    else:
-        ss_df = pd.read_csv(ss_file)
-
     # Load NBER papers (try raw first, then regular)
-    nber_file = os.path.join(NBER_OUTPUT_DIR, f"{policy_abbr}_papers_nber_raw.parquet")
-    if not os.path.exists(nber_file):
-        nber_file = os.path.join(NBER_OUTPUT_DIR, f"{policy_abbr}_papers_nber_raw.csv")
-    if not os.path.exists(nber_file):
-        nber_file = os.path.join(NBER_OUTPUT_DIR, f"{policy_abbr}_papers_nber.parquet")
-    if not os.path.exists(nber_file):
-        nber_file = os.path.join(NBER_OUTPUT_DIR, f"{policy_abbr}_papers_nber.csv")
-
-    if not os.path.exists(nber_file):
+    nber_df = load_source_papers(NBER_OUTPUT_DIR, policy_abbr, 'nber', NBER_COMPARE_COLUMNS)
+    if nber_df is None:
         print(f"    ERROR: NBER file not found for {policy_abbr}")
         return None
 
-    if nber_file.endswith('.parquet'):
-        nber_df = pd.read_parquet(nber_file)
-    else:
-        nber_df = pd.read_csv(nber_file)
-
     print(f"    Semantic Scholar papers: {len(ss_df)}")
     print(f"    NBER papers: {len(nber_df)}")
 
     # Normalize titles for matching
-    ss_df['normalized_title'] = ss_df['title'].apply(normalize_title)
-    nber_df['normalized_title'] = nber_df['title'].apply(normalize_title)
+    nber_df = add_title_keys(nber_df)
 
-    # Create sets for fast lookup
-    ss_titles = set(ss_df['normalized_title'].dropna())
-    nber_titles = set(nber_df['normalized_title'].dropna())
-
-    # Add indicators
-    ss_df['in_nber'] = ss_df['normalized_title'].isin(nber_titles)
-    nber_df['in_semantic_scholar'] = nber_df['normalized_title'].isin(ss_titles)
+    # Add indicators (assign returns a new frame, leaving the shared ss_df untouched)
+    ss_df = ss_df.assign(
+        in_nber=titles_present_in(ss_df['title_h64'], nber_df['title_h64'])
+    )
+    nber_df['in_semantic_scholar'] = titles_present_in(nber_df['title_h64'], ss_df['title_h64'])
 
     # Calculate statistics
     ss_in_nber = ss_df['in_nber'].sum()
@@ -553,13 +957,17 @@ def compare_with_nber(policy_abbr):
             print(f"      - {row['title'][:60]}...")
 
     # Save with indicators
-    ss_nber_indicator_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_semantic_scholar_nber_indicator.csv")
-    ss_df.to_csv(ss_nber_indicator_file, index=False)
+    ss_nber_indicator_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_semantic_scholar_nber_indicator.parquet")
+    write_parquet(ss_df, ss_nber_indicator_file)
     print(f"    Saved: {ss_nber_indicator_file}")
+    if emit_csv:
+        ss_df.to_csv(ss_nber_indicator_file.replace('.parquet', '.csv'), index=False)
 
-    nber_ss_indicator_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_nber_semantic_scholar_indicator.csv")
-    nber_df.to_csv(nber_ss_indicator_file, index=False)
+    nber_ss_indicator_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_nber_semantic_scholar_indicator.parquet")
+    write_parquet(nber_df, nber_ss_indicator_file)
     print(f"    Saved: {nber_ss_indicator_file}")
+    if emit_csv:
+        nber_df.to_csv(nber_ss_indicator_file.replace('.parquet', '.csv'), index=False)
 
     return {
         'policy_abbr': policy_abbr,
@@ -573,18 +981,105 @@ def compare_with_nber(policy_abbr):
     }
 
 
-def process_policy(policy_row):
+def compare_policy(policy_abbr, ss_df=None, emit_csv=False):
+    """
+    Compare one policy's Semantic Scholar papers with both OpenAlex and NBER.
+
+    The Semantic Scholar titles are normalized once and shared by both
+    comparisons. The papers are read from disk only when no in-memory
+    frame is given.
+
+    Parameters:
+    -----------
+    policy_abbr : str
+        Policy abbreviation (e.g., "TCJA")
+    ss_df : pd.DataFrame or None
+        Papers returned by process_policy in this run (None to load the saved file)
+    emit_csv : bool
+        Also write CSV copies of the indicator files
+
+    Returns:
+    --------
+    dict : {'openalex': stats or None, 'nber': stats or None}
+    """
+    if ss_df is None:
+        print(f"\n  Loading Semantic Scholar papers for {policy_abbr}...")
+        ss_df = load_semantic_scholar_papers(policy_abbr)
+        if ss_df is None:
+            return {'openalex': None, 'nber': None}
+    else:
+        ss_df = add_title_keys(ss_df)
+
+    results = {}
+    for source, compare in (('openalex', compare_with_openalex), ('nber', compare_with_nber)):
+        try:
+            results[source] = compare(policy_abbr, ss_df, emit_csv=emit_csv)
+        except Exception as e:
+            print(f"  ERROR comparing {policy_abbr} with {source}: {e}")
+            import traceback
+            traceback.print_exc()
+            results[source] = None
+    return results
+
+
+def load_existing_summary(policy_abbr, policy_name):
+    """
+    Return the summary of a previous run if its outputs are still current.
+
+    Outputs are considered current when both the raw Parquet file and the
+    metadata JSON exist and are newer than the policies CSV (so edited
+    search terms trigger a re-scrape).
+
+    Parameters:
+    -----------
+    policy_abbr : str
+        Policy abbreviation
+    policy_name : str
+        Full policy name
+
+    Returns:
+    --------
+    dict or None : Summary statistics, or None if the policy must be scraped
+    """
+    parquet_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_semantic_scholar_raw.parquet")
+    metadata_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_semantic_scholar_metadata.json")
+    if not (os.path.exists(parquet_file) and os.path.exists(metadata_file)):
+        return None
+
+    policies_mtime = os.path.getmtime(POLICIES_FILE)
+    if min(os.path.getmtime(parquet_file), os.path.getmtime(metadata_file)) < policies_mtime:
+        return None
+
+    with open(metadata_file, 'r') as f:
+        metadata = json.load(f)
+
+    return {
+        'policy_abbreviation': policy_abbr,
+        'policy_name': policy_name,
+        'total_papers': metadata.get('total_papers_found', 0),
+        'duplicates_removed': metadata.get('duplicates_removed', 0),
+        'pre_policy_filtered': metadata.get('pre_policy_filtered', 0),
+        'unique_papers_raw': metadata.get('unique_papers_raw', 0)
+    }
+
+
+def process_policy(policy_row, resume=False, emit_csv=False):
     """
     Process a single policy: search Semantic Scholar and save results.
 
     Parameters:
     -----------
-    policy_row : pd.Series
+    policy_row : dict or pd.Series
         Row from policies DataFrame
+    resume : bool
+        Skip the scrape if current outputs already exist (--resume)
+    emit_csv : bool
+        Also write a CSV copy of the raw dataset (Parquet is always written)
 
     Returns:
     --------
-    dict : Summary statistics
+    tuple : (summary statistics dict, raw papers DataFrame or None if the
+        policy was skipped or returned no papers)
     """
     policy_name = policy_row['policy_name']
     policy_abbr = policy_row['policy_abbreviation']
@@ -592,6 +1087,12 @@ def process_policy(policy_row):
     policy_category = policy_row['policy_category']
     search_terms_str = policy_row['search_terms']
 
+    if resume:
+        summary = load_existing_summary(policy_abbr, policy_name)
+        if summary is not None:
+            print(f"\n  SKIP {policy_name} ({policy_abbr}) — outputs newer than policies.csv (--resume)")
+            return summary, None
+
     # Parse search terms (pipe-separated)
     search_terms = [term.strip() for term in search_terms_str.split('|')]
 
@@ -601,10 +1102,13 @@ def process_policy(policy_row):
     print(f"Search terms: {len(search_terms)}")
     print(f"{'='*80}")
 
-    all_papers = []
     search_metadata = []
     results_lock = threading.Lock()
 
+    # One timestamp for the whole policy run (constant scrape_date column)
+    scrape_time = datetime.now()
+    scrape_date_str = scrape_time.strftime('%Y-%m-%d')
+
     def search_single_term(term):
         """Search for a single term and return results with metadata."""
         results = search_semantic_scholar(term, limit=PER_PAGE, max_results=MAX_RESULTS_PER_TERM)
@@ -612,21 +1116,18 @@ def process_policy(policy_row):
         # Save raw results for this term
         safe_term = term.replace(' ', '_').replace('/', '_').lower()
         raw_file = os.path.join(TMP_DIR, f"raw_{policy_abbr}_{safe_term}.json")
-        with open(raw_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(raw_file, 'wb') as f:
+            f.write(dump_json_bytes(results))
         print(f"    Saved raw results to: {raw_file}")
 
-        # Extract paper info
-        papers = []
-        for paper in results:
-            paper_info = extract_paper_info(paper)
-            paper_info['search_term'] = term
-            paper_info['policy_studied'] = policy_name
-            paper_info['policy_year'] = policy_year
-            paper_info['policy_abbreviation'] = policy_abbr
-            paper_info['policy_category'] = policy_category
-            paper_info['scrape_date'] = datetime.now().strftime('%Y-%m-%d')
-            papers.append(paper_info)
+        # Extract paper info (policy fields are constant for the whole term)
+        papers = extract_papers_frame(results)
+        papers['search_term'] = term
+        papers['policy_studied'] = policy_name
+        papers['policy_year'] = policy_year
+        papers['policy_abbreviation'] = policy_abbr
+        papers['policy_category'] = policy_category
+        papers['scrape_date'] = scrape_date_str
 
         metadata = {
             'search_term': term,
@@ -637,25 +1138,37 @@ def process_policy(policy_row):
         print(f"    Extracted info from {len(results)} papers for '{term}'")
         return papers, metadata
 
-    # Search for each term in parallel
-    print(f"\n  Searching {len(search_terms)} terms in parallel (max {MAX_WORKERS} workers)...")
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_term = {executor.submit(search_single_term, term): term for term in search_terms}
-
-        for future in as_completed(future_to_term):
-            term = future_to_term[future]
-            try:
-                papers, metadata = future.result()
+    # Search for each term in parallel. Each finished term is appended to a
+    # staging Parquet file as its own row group, so only the terms still in
+    # flight are held in memory during the crawl. Only a failed search skips
+    # its term; schema/write errors propagate, and the staging file is always
+    # removed.
+    staging_file = os.path.join(TMP_DIR, f"{policy_abbr}_papers_semantic_scholar_staging.parquet")
+    n_workers = min(MAX_WORKERS, len(search_terms))
+    print(f"\n  Searching {len(search_terms)} terms in parallel ({n_workers} workers)...")
+    try:
+        with pq.ParquetWriter(staging_file, PAPER_SCHEMA) as writer, \
+                ThreadPoolExecutor(max_workers=n_workers) as executor:
+            future_to_term = {executor.submit(search_single_term, term): term for term in search_terms}
+
+            for future in as_completed(future_to_term):
+                term = future_to_term[future]
+                try:
+                    papers, metadata = future.result()
+                except Exception as e:
+                    print(f"    ERROR processing term '{term}': {e}")
+                    continue
                 with results_lock:
-                    all_papers.extend(papers)
+                    writer.write_table(pa.Table.from_pandas(papers, schema=PAPER_SCHEMA, preserve_index=False))
                     search_metadata.append(metadata)
-            except Exception as e:
-                print(f"    ERROR processing term '{term}': {e}")
 
-    # Create DataFrame
-    df = pd.DataFrame(all_papers)
+        # Read the staged batches back once for deduplication
+        table = pq.read_table(staging_file)
+    finally:
+        if os.path.exists(staging_file):
+            os.remove(staging_file)
 
-    if len(df) == 0:
+    if table.num_rows == 0:
         print(f"\n  WARNING: No papers found for {policy_name}")
         return {
             'policy_abbreviation': policy_abbr,
@@ -664,47 +1177,53 @@ def process_policy(policy_row):
             'duplicates_removed': 0,
             'pre_policy_filtered': 0,
             'unique_papers_raw': 0
-        }
+        }, None
 
-    initial_count = len(df)
+    initial_count = table.num_rows
     print(f"\n  Total papers found: {initial_count}")
 
     # Aggregate all search terms for each paper (instead of keeping just the first)
-    print(f"\n  Aggregating search terms and removing duplicates...")
-    search_terms_agg = df.groupby('semantic_scholar_id')['search_term'].apply(
+    print(f"\n  Aggregating search terms, removing duplicates and filtering by date (>= {policy_year})...")
+    # Integer key derived from the paperId (cheaper to hash than the string)
+    sid_key = paper_id_keys(table.column('semantic_scholar_id').to_pandas())
+    search_terms_agg = table.column('search_term').to_pandas().groupby(sid_key.to_numpy()).apply(
         lambda x: ' | '.join(sorted(set(x)))
-    ).reset_index()
-    search_terms_agg.columns = ['semantic_scholar_id', 'search_terms_matched']
+    )
+
+    # One mask for both steps: first occurrence of each paper AND
+    # (publication_year unknown OR publication_year >= policy_year)
+    is_first = pa.array(~sid_key.duplicated().to_numpy())
+    year = table.column('publication_year')
+    year_ok = pc.fill_null(pc.or_(pc.is_null(year), pc.greater_equal(year, policy_year)), True)
+    keep = pc.and_(is_first, year_ok)
 
-    # Keep first occurrence of each paper (for other columns)
-    df_unique = df.drop_duplicates(subset=['semantic_scholar_id'], keep='first').copy()
+    unique_count = pc.sum(is_first).as_py()
+    duplicate_count = initial_count - unique_count
+    filtered_count = unique_count - pc.sum(keep).as_py()
 
-    # Merge aggregated search terms
-    df_unique = df_unique.drop(columns=['search_term'])
-    df_unique = df_unique.merge(search_terms_agg, on='semantic_scholar_id', how='left')
+    df_unique = table.filter(keep).drop_columns(['search_term']).to_pandas()
+    df_unique['search_terms_matched'] = sid_key[keep.to_numpy(zero_copy_only=False)].map(search_terms_agg).to_numpy()
+    for col in STRING_COLUMNS:
+        df_unique[col] = df_unique[col].astype('string[pyarrow]')
+    df_unique = downcast_dtypes(df_unique)
 
-    duplicate_count = initial_count - len(df_unique)
-    print(f"    Initial: {initial_count} | Duplicates: {duplicate_count} | Unique: {len(df_unique)}")
+    print(f"    Initial: {initial_count} | Duplicates: {duplicate_count} | Unique: {unique_count}")
+    print(f"    Pre-policy filtered out: {filtered_count} | After filter: {len(df_unique)}")
 
     # Case-sensitive validation for short acronym search terms
     df_unique, acronym_filtered_count = validate_acronym_matches(df_unique)
 
-    # Filter out papers published before the policy year
-    print(f"\n  Filtering papers by publication date (>= {policy_year})...")
-    pre_filter_count = len(df_unique)
-    # Keep papers where publication_year >= policy_year, or where publication_year is None (unknown)
-    df_unique = df_unique[
-        (df_unique['publication_year'].isna()) |
-        (df_unique['publication_year'] >= policy_year)
-    ]
-    filtered_count = pre_filter_count - len(df_unique)
-    print(f"    Before filter: {pre_filter_count} | Filtered out: {filtered_count} | After filter: {len(df_unique)}")
-
     # NO relevance filtering at scrape stage - will be done after abstract recovery
     print(f"\n  Skipping relevance filtering (will be applied after abstract recovery)")
 
-    # Add normalized title for comparison
-    df_unique['normalized_title'] = df_unique['title'].apply(normalize_title)
+    # Title fingerprint for comparison (normalized_title itself is derivable
+    # from title and is not stored; readers recompute it via add_title_keys)
+    df_unique['title_h64'] = title_fingerprints(normalize_title_series(df_unique['title']))
+
+    # Low-cardinality columns repeated on every row -> categoricals
+    for col in DICTIONARY_COLUMNS:
+        if col in df_unique.columns:
+            df_unique[col] = df_unique[col].astype('category')
 
     # Reorder columns (search_terms_matched contains all matched terms)
     column_order = [
@@ -712,18 +1231,19 @@ def process_policy(policy_row):
         'publication_year', 'publication_date', 'abstract', 'venue',
         'cited_by_count', 'is_open_access', 'open_access_url',
         'search_terms_matched', 'policy_studied', 'policy_year', 'policy_abbreviation',
-        'policy_category', 'data_source', 'scrape_date', 'normalized_title'
+        'policy_category', 'data_source', 'scrape_date', 'title_h64'
     ]
     df_unique = df_unique[[c for c in column_order if c in df_unique.columns]]
 
     # Save RAW outputs (no relevance filtering applied)
     parquet_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_semantic_scholar_raw.parquet")
-    df_unique.to_parquet(parquet_file, index=False, engine='pyarrow')
+    write_parquet(df_unique, parquet_file)
     print(f"\n  Saved RAW Parquet: {parquet_file}")
 
-    csv_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_semantic_scholar_raw.csv")
-    df_unique.to_csv(csv_file, index=False, encoding='utf-8')
-    print(f"  Saved RAW CSV: {csv_file}")
+    if emit_csv:
+        csv_file = os.path.join(OUTPUT_DIR, f"{policy_abbr}_papers_semantic_scholar_raw.csv")
+        df_unique.to_csv(csv_file, index=False, encoding='utf-8')
+        print(f"  Saved RAW CSV: {csv_file}")
 
     # Save metadata
     metadata = {
@@ -732,7 +1252,7 @@ def process_policy(policy_row):
         'policy_year': policy_year,
         'policy_category': policy_category,
         'search_terms': search_terms,
-        'scrape_date': datetime.now().isoformat(),
+        'scrape_date': scrape_time.isoformat(),
         'total_papers_found': initial_count,
         'duplicates_removed': duplicate_count,
         'acronym_filtered': acronym_filtered_count,
@@ -763,7 +1283,7 @@ def process_policy(policy_row):
         'duplicates_removed': duplicate_count,
         'pre_policy_filtered': filtered_count,
         'unique_papers_raw': len(df_unique)
-    }
+    }, df_unique
 
 
 def is_policy_complete(policy_abbr, source_name):
@@ -781,15 +1301,23 @@ def main():
     """
     parser = argparse.ArgumentParser(description="Semantic Scholar paper scraping and comparison")
     parser.add_argument('policies', nargs='*', help='Policy abbreviations to process (default: all)')
-    parser.add_argument('--resume', action='store_true', help='Skip policies already completed today')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip policies completed today or whose outputs are newer than policies.csv')
+    parser.add_argument('--emit-csv', action='store_true',
+                        help='Also write CSV copies of the raw dataset and indicator files')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the on-disk HTTP response cache and re-fetch every page')
     args = parser.parse_args()
 
+    if args.no_cache:
+        SESSION.settings.disabled = True
+
     print("="*80)
     print("SEMANTIC SCHOLAR PAPER SCRAPING AND COMPARISON")
     print("="*80)
     print(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     if args.resume:
-        print("  Mode: RESUME (skipping policies completed today)")
+        print("  Mode: RESUME (skipping policies completed today or with current outputs)")
     print()
 
     # Load policies configuration
@@ -802,45 +1330,68 @@ def main():
             print(f"ERROR: No matching policies found for {args.policies}")
             return
 
+    # Plain dicts (built once) instead of one boxed Series per iterrows() step
+    policy_rows = policies_df.to_dict('records')
+
     print(f"\nPolicies to process:")
-    for _, row in policies_df.iterrows():
+    for row in policy_rows:
         print(f"  - {row['policy_name']} ({row['policy_abbreviation']})")
 
-    # Process each policy
-    all_summaries = []
-    for idx, row in policies_df.iterrows():
+    # Process policies concurrently (the module-level RateLimiter bounds the
+    # aggregate request rate, so extra workers only overlap network waits)
+    pending_rows = []
+    for row in policy_rows:
         policy_abbr = row['policy_abbreviation']
 
         # Check checkpoint in resume mode
         if args.resume and is_policy_complete(policy_abbr, 'semantic_scholar'):
             print(f"\n  SKIP {row['policy_name']} — already completed today (--resume)")
             continue
-
-        try:
-            summary = process_policy(row)
-            all_summaries.append(summary)
-        except Exception as e:
-            print(f"\n  ERROR processing {row['policy_name']}: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
-
-    # Compare with OpenAlex
+        pending_rows.append(row)
+
+    summaries_by_abbr = {}
+    comparisons_by_abbr = {}  # comparisons of the policies scraped in this run
+    if pending_rows:
+        n_workers = min(MAX_POLICY_WORKERS, len(pending_rows))
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            future_to_row = {executor.submit(process_policy, row, args.resume, args.emit_csv): row for row in pending_rows}
+            for future in as_completed(future_to_row):
+                row = future_to_row[future]
+                try:
+                    summary, df_unique = future.result()
+                    summaries_by_abbr[row['policy_abbreviation']] = summary
+                    if df_unique is not None:
+                        # Compare while the papers are still in memory, then
+                        # drop them so peak memory stays flat across policies
+                        comparisons_by_abbr[row['policy_abbreviation']] = compare_policy(
+                            row['policy_abbreviation'], ss_df=df_unique, emit_csv=args.emit_csv)
+                        del df_unique
+                except Exception as e:
+                    print(f"\n  ERROR processing {row['policy_name']}: {e}")
+                    import traceback
+                    traceback.print_exc()
+
+    # Keep summaries in policies.csv order
+    all_summaries = [summaries_by_abbr[row['policy_abbreviation']] for row in pending_rows
+                     if row['policy_abbreviation'] in summaries_by_abbr]
+
+    # Compare with OpenAlex and NBER (policies scraped in this run were
+    # compared as they finished; skipped policies are loaded from their
+    # saved file)
     print(f"\n{'='*80}")
-    print("COMPARING WITH OPENALEX")
+    print("COMPARING WITH OPENALEX AND NBER")
     print(f"{'='*80}")
 
     openalex_comparison_results = []
-    for _, row in policies_df.iterrows():
-        policy_abbr = row['policy_abbreviation']
-        try:
-            comparison = compare_with_openalex(policy_abbr)
-            if comparison:
-                openalex_comparison_results.append(comparison)
-        except Exception as e:
-            print(f"  ERROR comparing {policy_abbr} with OpenAlex: {e}")
-            import traceback
-            traceback.print_exc()
+    nber_comparison_results = []
+    for row in policy_rows:
+        comparison = comparisons_by_abbr.pop(row['policy_abbreviation'], None)
+        if comparison is None:
+            comparison = compare_policy(row['policy_abbreviation'], emit_csv=args.emit_csv)
+        if comparison['openalex']:
+            openalex_comparison_results.append(comparison['openalex'])
+        if comparison['nber']:
+            nber_comparison_results.append(comparison['nber'])
 
     # Save OpenAlex comparison results
     if openalex_comparison_results:
@@ -849,23 +1400,6 @@ def main():
         comparison_df.to_csv(comparison_file, index=False)
         print(f"\nSaved OpenAlex comparison: {comparison_file}")
 
-    # Compare with NBER
-    print(f"\n{'='*80}")
-    print("COMPARING WITH NBER")
-    print(f"{'='*80}")
-
-    nber_comparison_results = []
-    for _, row in policies_df.iterrows():
-        policy_abbr = row['policy_abbreviation']
-        try:
-            comparison = compare_with_nber(policy_abbr)
-            if comparison:
-                nber_comparison_results.append(comparison)
-        except Exception as e:
-            print(f"  ERROR comparing {policy_abbr} with NBER: {e}")
-            import traceback
-            traceback.print_exc()
-
     # Save NBER comparison results
     if nber_comparison_results:
         comparison_df = pd.DataFrame(nber_comparison_results)
@@ -18,8 +18,18 @@ import sys
 import json
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+# orjson — optional dependency (faster parsing of the source metadata files)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -30,41 +40,111 @@ REPORTS_DIR = os.path.join(SCRIPT_DIR, "reports")
 # Policies file
 POLICIES_FILE = os.path.join(BASE_DIR, "code", "build", "get_policies", "output", "policies.csv")
 
-
-def load_unified_dataset(policy_abbr):
-    """Load the unified dataset for a policy."""
+# Scraper output directories holding each source's {abbr}_metadata.json
+SOURCE_OUTPUT_DIRS = {
+    'openalex': os.path.join(BASE_DIR, "code", "build", "scrape_policies_openalex", "output"),
+    'semantic_scholar': os.path.join(BASE_DIR, "code", "build", "scrape_policies_semantic_scholar", "output"),
+    'nber': os.path.join(BASE_DIR, "code", "build", "scrape_policies_nber", "output"),
+}
+
+# Policies are independent (separate input and report files), so their
+# reports are generated in parallel worker processes
+MAX_WORKERS = os.cpu_count() or 1
+
+# Write buffer for the Markdown reports
+REPORT_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# Unified dataset columns used by the report (others are never decoded)
+REPORT_COLUMNS = ['in_openalex', 'in_semantic_scholar', 'in_nber', 'title', 'abstract', 'doi',
+                  'publication_year', 'cited_by_count', 'venue', 'match_method']
+
+# Compact dtypes applied after loading (source flags are 0/1)
+SOURCE_FLAG_COLUMNS = ('in_openalex', 'in_semantic_scholar', 'in_nber')
+NUMERIC_DTYPES = {'publication_year': 'Int16', 'cited_by_count': 'Int32'}
+CATEGORICAL_COLUMNS = ('match_method',)  # small vocabulary: counted on integer codes
+
+# Source-combination categories as 3-bit source masks
+# (bit 0 = OpenAlex, bit 1 = Semantic Scholar, bit 2 = NBER)
+CATEGORY_CODES = {
+    'all_three': 0b111,
+    'oa_and_ss_only': 0b011,
+    'oa_and_nber_only': 0b101,
+    'ss_and_nber_only': 0b110,
+    'oa_only': 0b001,
+    'ss_only': 0b010,
+    'nber_only': 0b100,
+}
+
+
+def load_unified_dataset(policy_abbr, columns=None):
+    """
+    Load the unified dataset for a policy.
+
+    Parameters:
+    -----------
+    policy_abbr : str
+        Policy abbreviation (e.g., "TCJA")
+    columns : list or None
+        Columns to read (missing ones are skipped); None reads all columns
+
+    Returns:
+    --------
+    pd.DataFrame or None : Unified dataset (source flags as int8), or None
+        if the file does not exist
+    """
     file_path = os.path.join(OUTPUT_DIR, f"{policy_abbr}_unified_dataset.parquet")
-    if os.path.exists(file_path):
-        return pd.read_parquet(file_path)
-    return None
-
-
-def load_source_metadata(policy_abbr):
-    """Load metadata from each source's scraping run."""
-    metadata = {}
+    if not os.path.exists(file_path):
+        return None
 
-    # OpenAlex metadata
-    oa_meta_file = os.path.join(BASE_DIR, "code", "build", "scrape_policies_openalex", "output",
-                                f"{policy_abbr}_metadata.json")
-    if os.path.exists(oa_meta_file):
-        with open(oa_meta_file, 'r') as f:
-            metadata['openalex'] = json.load(f)
+    if columns is not None:
+        available = set(pq.ParquetFile(file_path).schema_arrow.names)
+        columns = [c for c in columns if c in available]
+    df = pd.read_parquet(file_path, engine='pyarrow', columns=columns)
+
+    # Plain int8 flags (never categorical) keep the mask/groupby on the fast path
+    for col in SOURCE_FLAG_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(np.int8)
+    for col, dtype in NUMERIC_DTYPES.items():
+        if col in df.columns:
+            df[col] = df[col].astype(dtype)
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+
+@lru_cache(maxsize=None)
+def list_source_files(source):
+    """Names of the files in a source's output directory (listed once per process)."""
+    out_dir = SOURCE_OUTPUT_DIRS[source]
+    if not os.path.isdir(out_dir):
+        return frozenset()
+    with os.scandir(out_dir) as entries:
+        return frozenset(entry.name for entry in entries if entry.is_file())
+
+
+def load_json(path):
+    """Read one JSON file (with orjson when available)."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
 
-    # Semantic Scholar metadata
-    ss_meta_file = os.path.join(BASE_DIR, "code", "build", "scrape_policies_semantic_scholar", "output",
-                                f"{policy_abbr}_metadata.json")
-    if os.path.exists(ss_meta_file):
-        with open(ss_meta_file, 'r') as f:
-            metadata['semantic_scholar'] = json.load(f)
 
-    # NBER metadata
-    nber_meta_file = os.path.join(BASE_DIR, "code", "build", "scrape_policies_nber", "output",
-                                  f"{policy_abbr}_metadata.json")
-    if os.path.exists(nber_meta_file):
-        with open(nber_meta_file, 'r') as f:
-            metadata['nber'] = json.load(f)
+def load_source_metadata(policy_abbr):
+    """Load metadata from each source's scraping run (files are read concurrently)."""
+    file_name = f"{policy_abbr}_metadata.json"
+    paths = {source: os.path.join(out_dir, file_name)
+             for source, out_dir in SOURCE_OUTPUT_DIRS.items()
+             if file_name in list_source_files(source)}
+    if not paths:
+        return {}
 
-    return metadata
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        futures = {source: executor.submit(load_json, path) for source, path in paths.items()}
+        return {source: future.result() for source, future in futures.items()}
 
 
 def load_policies():
@@ -74,169 +154,239 @@ def load_policies():
     return None
 
 
-def categorize_papers(df):
+def source_mask(df):
+    """Return each paper's 3-bit source mask (see CATEGORY_CODES) as a uint8 array."""
+    return ((df['in_openalex'].to_numpy() == 1).astype(np.uint8)
+            | ((df['in_semantic_scholar'].to_numpy() == 1).astype(np.uint8) << 1)
+            | ((df['in_nber'].to_numpy() == 1).astype(np.uint8) << 2))
+
+
+def categorize_papers(df, mask=None):
     """
     Categorize papers by source presence.
 
-    Returns dict with paper indices for each category.
+    Returns dict with the positional indices (numpy arrays) of the papers
+    in each category. mask is the precomputed source_mask(df), if available.
     """
-    categories = {
-        'all_three': df[(df['in_openalex'] == 1) & (df['in_semantic_scholar'] == 1) & (df['in_nber'] == 1)].index.tolist(),
-        'oa_and_ss_only': df[(df['in_openalex'] == 1) & (df['in_semantic_scholar'] == 1) & (df['in_nber'] == 0)].index.tolist(),
-        'oa_and_nber_only': df[(df['in_openalex'] == 1) & (df['in_semantic_scholar'] == 0) & (df['in_nber'] == 1)].index.tolist(),
-        'ss_and_nber_only': df[(df['in_openalex'] == 0) & (df['in_semantic_scholar'] == 1) & (df['in_nber'] == 1)].index.tolist(),
-        'oa_only': df[(df['in_openalex'] == 1) & (df['in_semantic_scholar'] == 0) & (df['in_nber'] == 0)].index.tolist(),
-        'ss_only': df[(df['in_openalex'] == 0) & (df['in_semantic_scholar'] == 1) & (df['in_nber'] == 0)].index.tolist(),
-        'nber_only': df[(df['in_openalex'] == 0) & (df['in_semantic_scholar'] == 0) & (df['in_nber'] == 1)].index.tolist(),
-    }
-    return categories
-
-
-def analyze_category_characteristics(df, indices, category_name):
-    """Analyze characteristics of papers in a category."""
-    if not indices:
-        return None
+    if mask is None:
+        mask = source_mask(df)
+    groups = pd.Series(mask).groupby(mask).indices
+    empty = np.array([], dtype=np.intp)
+    return {cat_name: groups.get(code, empty) for cat_name, code in CATEGORY_CODES.items()}
 
-    subset = df.loc[indices]
-
-    analysis = {
-        'count': len(subset),
-        'pct_with_abstract': round(100 * (subset['abstract'].notna() & (subset['abstract'] != '')).mean(), 1),
-        'pct_with_doi': round(100 * subset['doi'].notna().mean(), 1),
-        'year_distribution': subset['publication_year'].value_counts().sort_index().to_dict(),
-        'year_min': int(subset['publication_year'].min()) if subset['publication_year'].notna().any() else None,
-        'year_max': int(subset['publication_year'].max()) if subset['publication_year'].notna().any() else None,
-        'year_median': int(subset['publication_year'].median()) if subset['publication_year'].notna().any() else None,
-    }
-
-    # Citation analysis
-    if 'cited_by_count' in subset.columns and subset['cited_by_count'].notna().any():
-        citations = subset['cited_by_count'].dropna()
-        analysis['citations_median'] = float(citations.median())
-        analysis['citations_mean'] = round(float(citations.mean()), 1)
-        analysis['citations_max'] = int(citations.max())
-
-    # Venue analysis
-    if 'venue' in subset.columns:
-        venues = subset['venue'].dropna()
-        if len(venues) > 0:
-            analysis['top_venues'] = venues.value_counts().head(10).to_dict()
-            analysis['unique_venues'] = venues.nunique()
-
-    # Match method (how was this paper matched across sources)
-    if 'match_method' in subset.columns:
-        analysis['match_methods'] = subset['match_method'].value_counts().to_dict()
-
-    # Sample papers
-    sample_cols = ['title', 'publication_year', 'venue', 'doi']
-    sample_cols = [c for c in sample_cols if c in subset.columns]
-    analysis['sample_papers'] = subset[sample_cols].head(5).to_dict('records')
 
-    return analysis
+def top_counts(values, k=10):
+    """
+    Return the k most frequent values and their counts, most frequent first.
+
+    Uses a partial sort (argpartition) over the unique values instead of
+    sorting all of them like value_counts().head(k).
+
+    Parameters:
+    -----------
+    values : np.ndarray
+        Non-null values
+    k : int
+        Number of values to return
+
+    Returns:
+    --------
+    dict : value -> count
+    """
+    uniques, counts = np.unique(values, return_counts=True)
+    if len(counts) > k:
+        top = np.argpartition(-counts, k - 1)[:k]
+    else:
+        top = np.arange(len(counts))
+    top = top[np.argsort(-counts[top], kind='stable')]
+    return dict(zip(uniques[top].tolist(), counts[top].tolist()))
 
 
-def explain_source_differences():
+def analyze_categories(df, mask, categories):
     """
-    Return detailed explanations of why sources differ.
-    Based on understanding of each API/source.
+    Analyze characteristics of the papers in every source category.
+
+    The per-category statistics come from one groupby over the source mask
+    (or from whole-column flags indexed by category) instead of one
+    DataFrame slice per category; only the top venues and sample papers
+    are taken per category.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Unified dataset
+    mask : np.ndarray
+        source_mask(df)
+    categories : dict
+        Output of categorize_papers (positional indices per category)
+
+    Returns:
+    --------
+    dict : Category name -> analysis dict (None for empty categories)
     """
-    explanations = {
-        'openalex': {
-            'name': 'OpenAlex',
-            'description': 'OpenAlex is a comprehensive open catalog of scholarly works, authors, venues, institutions, and concepts.',
-            'api': 'https://api.openalex.org/works',
-            'search_method': 'Full-text search across titles, abstracts, and full text (when available)',
-            'coverage': 'Broad academic coverage including journals, conferences, books, dissertations, and preprints',
-            'strengths': [
-                'Comprehensive DOI coverage',
-                'Rich metadata including concepts, affiliations',
-                'Open access status tracking',
-                'Citation counts from multiple sources',
-            ],
-            'limitations': [
-                'Abstracts stored as inverted index (may have reconstruction issues)',
-                'Some newer papers may have delayed indexing',
-                'Search relevance algorithm may differ from other sources',
-            ],
-            'why_unique_papers': [
-                'Indexes venues not covered by Semantic Scholar (e.g., law reviews, policy journals)',
-                'Better coverage of older publications',
-                'Includes non-English publications',
-                'Indexes institutional repositories and working papers beyond NBER',
-            ],
-        },
-        'semantic_scholar': {
-            'name': 'Semantic Scholar',
-            'description': 'Semantic Scholar is an AI-powered research tool developed by the Allen Institute for AI.',
-            'api': 'https://api.semanticscholar.org/graph/v1/paper/search',
-            'search_method': 'Semantic search using AI/ML models to understand query intent',
-            'coverage': 'Strong in computer science, biomedical; expanding to other fields',
-            'strengths': [
-                'AI-powered relevance ranking',
-                'Good coverage of preprints (arXiv, bioRxiv)',
-                'Influential citation metrics',
-                'Strong CS and biomedical coverage',
-            ],
-            'limitations': [
-                'Historically focused on STEM fields',
-                'May have gaps in social sciences, humanities, law',
-                'DOI coverage less complete than OpenAlex',
-                'API rate limits more restrictive',
-            ],
-            'why_unique_papers': [
-                'Different relevance algorithm returns different papers for same query',
-                'Better coverage of certain preprint servers',
-                'May surface papers based on semantic similarity not just keyword match',
-                'Indexes some venues not in OpenAlex',
-            ],
-        },
-        'nber': {
-            'name': 'NBER Working Papers',
-            'description': 'The National Bureau of Economic Research (NBER) working paper series.',
-            'api': 'Web scraping from nber.org',
-            'search_method': 'Keyword search on NBER website',
-            'coverage': 'NBER working papers ONLY - a specific subset of economics research',
-            'strengths': [
-                'Authoritative source for NBER working papers',
-                'High-quality economics research',
-                'Often early versions of influential papers',
-                'Consistent metadata quality',
-            ],
-            'limitations': [
-                'ONLY includes NBER working papers',
-                'Does not include published versions of same papers',
-                'Limited to economics and related fields',
-                'Much smaller scope than general academic indexes',
-            ],
-            'why_unique_papers': [
-                'NBER working papers may not be indexed elsewhere before publication',
-                'Some working papers never get published in journals',
-                'Working paper versions have different titles/metadata than published versions',
-            ],
-        },
-    }
-    return explanations
-
-
-def explain_overlap_reasons():
-    """Explain why papers appear in multiple sources."""
-    return {
-        'doi_match': {
-            'description': 'Papers matched by Digital Object Identifier (DOI)',
-            'reliability': 'High - DOIs are unique identifiers assigned by publishers',
-            'interpretation': 'Same paper indexed by multiple sources with consistent DOI metadata',
-        },
-        'title_match': {
-            'description': 'Papers matched by normalized title (lowercase, no punctuation)',
-            'reliability': 'Medium - may have false positives for common titles',
-            'interpretation': 'Likely same paper, but sources may have different metadata (e.g., one has DOI, other does not)',
-        },
-        'no_match': {
-            'description': 'Papers that appear in only one source',
-            'reliability': 'N/A',
-            'interpretation': 'Either unique to source, or matching failed due to metadata differences',
-        },
-    }
+    g = df.groupby(mask, sort=False)
+
+    # Whole-column flags computed once; each category just indexes into them
+    has_abstract = df['abstract'].fillna('').ne('').to_numpy()
+    has_doi = df['doi'].notna().to_numpy()
+    years = g['publication_year'].agg(['min', 'max', 'median', 'count'])
+
+    citations = None
+    if 'cited_by_count' in df.columns:
+        citations = g['cited_by_count'].agg(['median', 'mean', 'max', 'count'])
+
+    venue_stats = None
+    if 'venue' in df.columns:
+        venue_stats = g['venue'].agg(['nunique', 'count'])
+
+    match_methods = {}
+    if 'match_method' in df.columns:
+        method_counts = g['match_method'].value_counts()
+        method_counts = method_counts[method_counts > 0]  # categorical: drop unused methods
+        match_methods = {code: counts.droplevel(0).to_dict()
+                         for code, counts in method_counts.groupby(level=0)}
+
+    sample_cols = ['title', 'publication_year', 'venue', 'doi']
+    sample_arrays = {c: df[c].to_numpy() for c in sample_cols if c in df.columns}
+
+    analyses = {}
+    for cat_name, code in CATEGORY_CODES.items():
+        indices = categories[cat_name]
+        if len(indices) == 0:
+            analyses[cat_name] = None
+            continue
+
+        has_years = years.at[code, 'count'] > 0
+        analysis = {
+            'count': len(indices),
+            'pct_with_abstract': round(100 * has_abstract[indices].mean(), 1),
+            'pct_with_doi': round(100 * has_doi[indices].mean(), 1),
+            'year_min': int(years.at[code, 'min']) if has_years else None,
+            'year_max': int(years.at[code, 'max']) if has_years else None,
+            'year_median': int(years.at[code, 'median']) if has_years else None,
+        }
+
+        # Citation analysis
+        if citations is not None and citations.at[code, 'count'] > 0:
+            analysis['citations_median'] = float(citations.at[code, 'median'])
+            analysis['citations_mean'] = round(float(citations.at[code, 'mean']), 1)
+            analysis['citations_max'] = int(citations.at[code, 'max'])
+
+        # Venue analysis
+        if venue_stats is not None and venue_stats.at[code, 'count'] > 0:
+            venues = df['venue'].iloc[indices].dropna().to_numpy()
+            analysis['top_venues'] = top_counts(venues, k=10)
+            analysis['unique_venues'] = int(venue_stats.at[code, 'nunique'])
+
+        # Match method (how was this paper matched across sources)
+        if 'match_method' in df.columns:
+            analysis['match_methods'] = match_methods.get(code, {})
+
+        # Sample papers
+        analysis['sample_papers'] = [{c: arr[i] for c, arr in sample_arrays.items()}
+                                     for i in indices[:5]]
+
+        analyses[cat_name] = analysis
+
+    return analyses
+
+
+# Why sources differ, based on understanding of each API/source
+SOURCE_EXPLANATIONS = {
+    'openalex': {
+        'name': 'OpenAlex',
+        'description': 'OpenAlex is a comprehensive open catalog of scholarly works, authors, venues, institutions, and concepts.',
+        'api': 'https://api.openalex.org/works',
+        'search_method': 'Full-text search across titles, abstracts, and full text (when available)',
+        'coverage': 'Broad academic coverage including journals, conferences, books, dissertations, and preprints',
+        'strengths': [
+            'Comprehensive DOI coverage',
+            'Rich metadata including concepts, affiliations',
+            'Open access status tracking',
+            'Citation counts from multiple sources',
+        ],
+        'limitations': [
+            'Abstracts stored as inverted index (may have reconstruction issues)',
+            'Some newer papers may have delayed indexing',
+            'Search relevance algorithm may differ from other sources',
+        ],
+        'why_unique_papers': [
+            'Indexes venues not covered by Semantic Scholar (e.g., law reviews, policy journals)',
+            'Better coverage of older publications',
+            'Includes non-English publications',
+            'Indexes institutional repositories and working papers beyond NBER',
+        ],
+    },
+    'semantic_scholar': {
+        'name': 'Semantic Scholar',
+        'description': 'Semantic Scholar is an AI-powered research tool developed by the Allen Institute for AI.',
+        'api': 'https://api.semanticscholar.org/graph/v1/paper/search',
+        'search_method': 'Semantic search using AI/ML models to understand query intent',
+        'coverage': 'Strong in computer science, biomedical; expanding to other fields',
+        'strengths': [
+            'AI-powered relevance ranking',
+            'Good coverage of preprints (arXiv, bioRxiv)',
+            'Influential citation metrics',
+            'Strong CS and biomedical coverage',
+        ],
+        'limitations': [
+            'Historically focused on STEM fields',
+            'May have gaps in social sciences, humanities, law',
+            'DOI coverage less complete than OpenAlex',
+            'API rate limits more restrictive',
+        ],
+        'why_unique_papers': [
+            'Different relevance algorithm returns different papers for same query',
+            'Better coverage of certain preprint servers',
+            'May surface papers based on semantic similarity not just keyword match',
+            'Indexes some venues not in OpenAlex',
+        ],
+    },
+    'nber': {
+        'name': 'NBER Working Papers',
+        'description': 'The National Bureau of Economic Research (NBER) working paper series.',
+        'api': 'Web scraping from nber.org',
+        'search_method': 'Keyword search on NBER website',
+        'coverage': 'NBER working papers ONLY - a specific subset of economics research',
+        'strengths': [
+            'Authoritative source for NBER working papers',
+            'High-quality economics research',
+            'Often early versions of influential papers',
+            'Consistent metadata quality',
+        ],
+        'limitations': [
+            'ONLY includes NBER working papers',
+            'Does not include published versions of same papers',
+            'Limited to economics and related fields',
+            'Much smaller scope than general academic indexes',
+        ],
+        'why_unique_papers': [
+            'NBER working papers may not be indexed elsewhere before publication',
+            'Some working papers never get published in journals',
+            'Working paper versions have different titles/metadata than published versions',
+        ],
+    },
+}
+
+
+# Why papers appear in multiple sources
+OVERLAP_EXPLANATIONS = {
+    'doi_match': {
+        'description': 'Papers matched by Digital Object Identifier (DOI)',
+        'reliability': 'High - DOIs are unique identifiers assigned by publishers',
+        'interpretation': 'Same paper indexed by multiple sources with consistent DOI metadata',
+    },
+    'title_match': {
+        'description': 'Papers matched by normalized title (lowercase, no punctuation)',
+        'reliability': 'Medium - may have false positives for common titles',
+        'interpretation': 'Likely same paper, but sources may have different metadata (e.g., one has DOI, other does not)',
+    },
+    'no_match': {
+        'description': 'Papers that appear in only one source',
+        'reliability': 'N/A',
+        'interpretation': 'Either unique to source, or matching failed due to metadata differences',
+    },
+}
 
 
 def generate_methodology_text(policy_abbr, df, categories, source_metadata, policy_info):
@@ -293,11 +443,12 @@ def generate_methodology_text(policy_abbr, df, categories, source_metadata, poli
     lines.append("   (lowercase, punctuation removed). Papers with identical normalized titles were considered matches.")
     lines.append("")
 
-    # Sample sizes
+    # Sample sizes (per-source totals come from the category sizes, no extra column scans)
     total = len(df)
-    in_oa = df['in_openalex'].sum()
-    in_ss = df['in_semantic_scholar'].sum()
-    in_nber = df['in_nber'].sum()
+    category_sizes = {code: len(categories[cat_name]) for cat_name, code in CATEGORY_CODES.items()}
+    in_oa = sum(n for code, n in category_sizes.items() if code & 0b001)
+    in_ss = sum(n for code, n in category_sizes.items() if code & 0b010)
+    in_nber = sum(n for code, n in category_sizes.items() if code & 0b100)
 
     lines.append("**Final Sample:**")
     lines.append("")
@@ -310,241 +461,266 @@ def generate_methodology_text(policy_abbr, df, categories, source_metadata, poli
     return '\n'.join(lines)
 
 
-def generate_sample_construction_report(policy_abbr):
-    """Generate comprehensive sample construction report."""
+def write_empty_report(policy_abbr):
+    """Write a minimal report for a policy whose unified dataset has no papers."""
+    report_path = os.path.join(REPORTS_DIR, f"{policy_abbr}_sample_construction.md")
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.write(f"# Sample Construction Analysis: {policy_abbr}\n\n")
+        f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        f.write("The unified dataset for this policy contains no papers, so there is no ")
+        f.write("sample composition to analyze.\n")
+
+    print(f"  Generated (empty dataset): {report_path}")
+    return report_path
+
+
+def generate_sample_construction_report(policy_abbr, policy_info=None):
+    """
+    Generate comprehensive sample construction report.
+
+    Parameters:
+    -----------
+    policy_abbr : str
+        Policy abbreviation (e.g., "TCJA")
+    policy_info : dict or None
+        The policy's row from policies.csv; looked up from the file when None
+
+    Returns:
+    --------
+    str or None : Path of the written report, or None if the dataset is missing
+    """
 
     print(f"\nAnalyzing sample construction for {policy_abbr}...")
 
     # Load data
-    df = load_unified_dataset(policy_abbr)
+    df = load_unified_dataset(policy_abbr, columns=REPORT_COLUMNS)
     if df is None:
         print(f"  ERROR: Could not load unified dataset for {policy_abbr}")
         return None
+    if len(df) == 0:
+        return write_empty_report(policy_abbr)
 
     source_metadata = load_source_metadata(policy_abbr)
-    policies_df = load_policies()
-    policy_info = None
-    if policies_df is not None:
-        policy_row = policies_df[policies_df['policy_abbreviation'] == policy_abbr]
-        if len(policy_row) > 0:
-            policy_info = policy_row.iloc[0].to_dict()
+    if policy_info is None:
+        policies_df = load_policies()
+        if policies_df is not None:
+            policy_row = policies_df[policies_df['policy_abbreviation'] == policy_abbr]
+            if len(policy_row) > 0:
+                policy_info = policy_row.iloc[0].to_dict()
 
     # Categorize papers
-    categories = categorize_papers(df)
+    mask = source_mask(df)
+    categories = categorize_papers(df, mask)
 
     # Analyze each category
-    category_analyses = {}
-    for cat_name, indices in categories.items():
-        category_analyses[cat_name] = analyze_category_characteristics(df, indices, cat_name)
-
-    # Get explanations
-    source_explanations = explain_source_differences()
-    overlap_explanations = explain_overlap_reasons()
-
-    # Generate report
-    lines = []
-    lines.append(f"# Sample Construction Analysis: {policy_abbr}")
-    lines.append("")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
-    lines.append("This document provides detailed documentation of how the research sample was ")
-    lines.append("constructed, suitable for inclusion in a research paper's methodology section ")
-    lines.append("and supplementary materials.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    category_analyses = analyze_categories(df, mask, categories)
 
-    # Methodology text
-    lines.append("## 1. Methodology")
-    lines.append("")
-    lines.append(generate_methodology_text(policy_abbr, df, categories, source_metadata, policy_info))
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    # Sample composition table
-    lines.append("## 2. Sample Composition")
-    lines.append("")
-    lines.append("### 2.1 Overview by Source Combination")
-    lines.append("")
-    lines.append("| Category | Count | % of Total | Description |")
-    lines.append("|----------|-------|------------|-------------|")
-
-    total = len(df)
-    category_descriptions = {
-        'all_three': 'In all three sources',
-        'oa_and_ss_only': 'In OpenAlex and Semantic Scholar only',
-        'oa_and_nber_only': 'In OpenAlex and NBER only',
-        'ss_and_nber_only': 'In Semantic Scholar and NBER only',
-        'oa_only': 'In OpenAlex only',
-        'ss_only': 'In Semantic Scholar only',
-        'nber_only': 'In NBER only',
-    }
-
-    for cat_name, desc in category_descriptions.items():
-        count = len(categories[cat_name])
-        pct = round(100 * count / total, 1) if total > 0 else 0
-        lines.append(f"| {cat_name} | {count:,} | {pct}% | {desc} |")
-
-    lines.append(f"| **Total** | **{total:,}** | **100%** | |")
-    lines.append("")
-
-    # Match method breakdown
-    lines.append("### 2.2 How Papers Were Matched")
-    lines.append("")
-    if 'match_method' in df.columns:
-        match_counts = df['match_method'].value_counts()
-        lines.append("| Match Method | Count | % | Interpretation |")
-        lines.append("|--------------|-------|---|----------------|")
-        for method, count in match_counts.items():
-            pct = round(100 * count / total, 1)
-            interp = overlap_explanations.get(method, {}).get('interpretation', 'N/A')
-            lines.append(f"| {method} | {count:,} | {pct}% | {interp[:50]}... |")
-        lines.append("")
-
-    lines.append("---")
-    lines.append("")
-
-    # Source explanations
-    lines.append("## 3. Understanding Source Differences")
-    lines.append("")
-    lines.append("### 3.1 Why do papers appear in one source but not another?")
-    lines.append("")
-
-    for source, info in source_explanations.items():
-        lines.append(f"#### {info['name']}")
-        lines.append("")
-        lines.append(f"**Coverage:** {info['coverage']}")
-        lines.append("")
-        lines.append(f"**Search Method:** {info['search_method']}")
-        lines.append("")
-        lines.append("**Why papers may be unique to this source:**")
-        for reason in info['why_unique_papers']:
-            lines.append(f"- {reason}")
-        lines.append("")
-        lines.append("**Limitations:**")
-        for lim in info['limitations']:
-            lines.append(f"- {lim}")
-        lines.append("")
-
-    lines.append("### 3.2 Why do papers appear in multiple sources?")
-    lines.append("")
-    lines.append("Papers appear in multiple sources when:")
-    lines.append("")
-    lines.append("1. **Both sources index the same venue/journal** - Major academic databases have ")
-    lines.append("   overlapping coverage of prominent journals and conferences.")
-    lines.append("")
-    lines.append("2. **DOI matching succeeds** - When a paper has a DOI and both sources have indexed it ")
-    lines.append("   with that DOI, we can confidently identify it as the same paper.")
-    lines.append("")
-    lines.append("3. **Title matching succeeds** - When DOIs are unavailable, papers with identical ")
-    lines.append("   titles (after normalization) are considered the same paper.")
-    lines.append("")
-
-    lines.append("---")
-    lines.append("")
-
-    # Detailed category analysis
-    lines.append("## 4. Detailed Category Analysis")
-    lines.append("")
-
-    for cat_name, analysis in category_analyses.items():
-        if analysis is None or analysis['count'] == 0:
-            continue
-
-        lines.append(f"### 4.{list(category_analyses.keys()).index(cat_name)+1} {category_descriptions[cat_name]}")
-        lines.append("")
-        lines.append(f"**Count:** {analysis['count']:,} papers")
-        lines.append("")
-
-        # Characteristics
-        lines.append("**Characteristics:**")
-        lines.append(f"- {analysis['pct_with_abstract']}% have abstracts")
-        lines.append(f"- {analysis['pct_with_doi']}% have DOIs")
-        if analysis.get('year_median'):
-            lines.append(f"- Publication years: {analysis['year_min']}-{analysis['year_max']} (median: {analysis['year_median']})")
-        if analysis.get('citations_median') is not None:
-            lines.append(f"- Citations: median={analysis['citations_median']}, mean={analysis['citations_mean']}, max={analysis['citations_max']}")
-        lines.append("")
-
-        # Top venues
-        if analysis.get('top_venues'):
-            lines.append("**Top Venues:**")
-            for venue, count in list(analysis['top_venues'].items())[:5]:
-                lines.append(f"- {venue}: {count} papers")
-            lines.append("")
-
-        # Sample papers
-        if analysis.get('sample_papers'):
-            lines.append("**Sample Papers:**")
-            for i, paper in enumerate(analysis['sample_papers'][:3], 1):
-                title = paper.get('title', 'Unknown')[:80]
-                year = paper.get('publication_year', 'N/A')
-                lines.append(f"{i}. \"{title}...\" ({year})")
-            lines.append("")
-
-        # Interpretation
-        lines.append("**Interpretation:**")
-        if cat_name == 'oa_only':
-            lines.append("These papers are indexed by OpenAlex but not found in Semantic Scholar or NBER. ")
-            lines.append("This typically occurs because: (1) the paper is from a venue not well-covered by ")
-            lines.append("Semantic Scholar, (2) the paper's metadata differs between sources preventing matching, ")
-            lines.append("or (3) the search relevance algorithms returned different results.")
-        elif cat_name == 'ss_only':
-            lines.append("These papers are indexed by Semantic Scholar but not found in OpenAlex or NBER. ")
-            lines.append("Semantic Scholar's AI-powered search may surface papers based on semantic similarity ")
-            lines.append("that keyword-based searches miss.")
-        elif cat_name == 'nber_only':
-            lines.append("These are NBER working papers not found in the other sources. This may occur because: ")
-            lines.append("(1) the working paper version has a different title than any published version, ")
-            lines.append("(2) the paper has not been indexed by OpenAlex/Semantic Scholar yet, or ")
-            lines.append("(3) the paper was never published in a journal.")
-        elif cat_name == 'all_three':
-            lines.append("These papers appear in all three sources, indicating they are well-established ")
-            lines.append("papers with consistent metadata across databases. They are likely published in ")
-            lines.append("major venues and have DOIs.")
-        elif 'and' in cat_name:
-            lines.append("These papers appear in two sources but not the third, suggesting partial coverage ")
-            lines.append("overlap between the sources.")
-        lines.append("")
-
-    lines.append("---")
-    lines.append("")
-
-    # Implications for research
-    lines.append("## 5. Implications for Research")
-    lines.append("")
-    lines.append("### 5.1 Sample Completeness")
-    lines.append("")
-    lines.append("By combining three sources, we capture a more complete picture of research on this policy ")
-    lines.append("than any single source would provide. However, researchers should be aware that:")
-    lines.append("")
-    lines.append("- The sample is not exhaustive; papers not indexed by any of these sources are not included")
-    lines.append("- Search term selection affects which papers are retrieved")
-    lines.append("- Relevance filtering may exclude marginally relevant papers")
-    lines.append("")
-
-    lines.append("### 5.2 Potential Biases")
-    lines.append("")
-    lines.append("- **Publication bias:** Working papers (NBER) may differ systematically from published papers")
-    lines.append("- **Field bias:** Semantic Scholar has historically emphasized STEM fields")
-    lines.append("- **Recency bias:** Newer papers may have incomplete indexing")
-    lines.append("- **Language bias:** English-language papers are over-represented")
-    lines.append("")
-
-    lines.append("### 5.3 Robustness Checks")
-    lines.append("")
-    lines.append("To assess sensitivity of results to sample construction, researchers may:")
-    lines.append("")
-    lines.append("1. **Restrict to papers in multiple sources:** Analyze only papers found in 2+ sources")
-    lines.append("2. **Source-specific analysis:** Run analyses separately by source")
-    lines.append("3. **Exclude NBER:** Analyze only published papers (OpenAlex + Semantic Scholar)")
-    lines.append("")
-
-    # Write report
+    # Write the report straight to a buffered file (no intermediate list of lines)
     report_path = os.path.join(REPORTS_DIR, f"{policy_abbr}_sample_construction.md")
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+    with open(report_path, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as f:
+        def emit(text):
+            f.write(text)
+            f.write('\n')
+
+        emit(f"# Sample Construction Analysis: {policy_abbr}")
+        emit("")
+        emit(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        emit("")
+        emit("This document provides detailed documentation of how the research sample was ")
+        emit("constructed, suitable for inclusion in a research paper's methodology section ")
+        emit("and supplementary materials.")
+        emit("")
+        emit("---")
+        emit("")
+
+        # Methodology text
+        emit("## 1. Methodology")
+        emit("")
+        emit(generate_methodology_text(policy_abbr, df, categories, source_metadata, policy_info))
+        emit("")
+        emit("---")
+        emit("")
+
+        # Sample composition table
+        emit("## 2. Sample Composition")
+        emit("")
+        emit("### 2.1 Overview by Source Combination")
+        emit("")
+        emit("| Category | Count | % of Total | Description |")
+        emit("|----------|-------|------------|-------------|")
+
+        total = len(df)
+        category_descriptions = {
+            'all_three': 'In all three sources',
+            'oa_and_ss_only': 'In OpenAlex and Semantic Scholar only',
+            'oa_and_nber_only': 'In OpenAlex and NBER only',
+            'ss_and_nber_only': 'In Semantic Scholar and NBER only',
+            'oa_only': 'In OpenAlex only',
+            'ss_only': 'In Semantic Scholar only',
+            'nber_only': 'In NBER only',
+        }
+
+        for cat_name, desc in category_descriptions.items():
+            count = len(categories[cat_name])
+            pct = round(100 * count / total, 1) if total > 0 else 0
+            emit(f"| {cat_name} | {count:,} | {pct}% | {desc} |")
+
+        emit(f"| **Total** | **{total:,}** | **100%** | |")
+        emit("")
+
+        # Match method breakdown
+        emit("### 2.2 How Papers Were Matched")
+        emit("")
+        if 'match_method' in df.columns:
+            match_counts = df['match_method'].value_counts()
+            match_counts = match_counts[match_counts > 0]
+            emit("| Match Method | Count | % | Interpretation |")
+            emit("|--------------|-------|---|----------------|")
+            for method, count in match_counts.items():
+                pct = round(100 * count / total, 1)
+                interp = OVERLAP_EXPLANATIONS.get(method, {}).get('interpretation', 'N/A')
+                emit(f"| {method} | {count:,} | {pct}% | {interp[:50]}... |")
+            emit("")
+
+        emit("---")
+        emit("")
+
+        # Source explanations
+        emit("## 3. Understanding Source Differences")
+        emit("")
+        emit("### 3.1 Why do papers appear in one source but not another?")
+        emit("")
+
+        for source, info in SOURCE_EXPLANATIONS.items():
+            emit(f"#### {info['name']}")
+            emit("")
+            emit(f"**Coverage:** {info['coverage']}")
+            emit("")
+            emit(f"**Search Method:** {info['search_method']}")
+            emit("")
+            emit("**Why papers may be unique to this source:**")
+            for reason in info['why_unique_papers']:
+                emit(f"- {reason}")
+            emit("")
+            emit("**Limitations:**")
+            for lim in info['limitations']:
+                emit(f"- {lim}")
+            emit("")
+
+        emit("### 3.2 Why do papers appear in multiple sources?")
+        emit("")
+        emit("Papers appear in multiple sources when:")
+        emit("")
+        emit("1. **Both sources index the same venue/journal** - Major academic databases have ")
+        emit("   overlapping coverage of prominent journals and conferences.")
+        emit("")
+        emit("2. **DOI matching succeeds** - When a paper has a DOI and both sources have indexed it ")
+        emit("   with that DOI, we can confidently identify it as the same paper.")
+        emit("")
+        emit("3. **Title matching succeeds** - When DOIs are unavailable, papers with identical ")
+        emit("   titles (after normalization) are considered the same paper.")
+        emit("")
+
+        emit("---")
+        emit("")
+
+        # Detailed category analysis
+        emit("## 4. Detailed Category Analysis")
+        emit("")
+
+        # Section numbers follow the category order (empty categories keep their number)
+        for section_num, (cat_name, analysis) in enumerate(category_analyses.items(), start=1):
+            if analysis is None or analysis['count'] == 0:
+                continue
+
+            emit(f"### 4.{section_num} {category_descriptions[cat_name]}")
+            emit("")
+            emit(f"**Count:** {analysis['count']:,} papers")
+            emit("")
+
+            # Characteristics
+            emit("**Characteristics:**")
+            emit(f"- {analysis['pct_with_abstract']}% have abstracts")
+            emit(f"- {analysis['pct_with_doi']}% have DOIs")
+            if analysis.get('year_median'):
+                emit(f"- Publication years: {analysis['year_min']}-{analysis['year_max']} (median: {analysis['year_median']})")
+            if analysis.get('citations_median') is not None:
+                emit(f"- Citations: median={analysis['citations_median']}, mean={analysis['citations_mean']}, max={analysis['citations_max']}")
+            emit("")
+
+            # Top venues
+            if analysis.get('top_venues'):
+                emit("**Top Venues:**")
+                for venue, count in list(analysis['top_venues'].items())[:5]:
+                    emit(f"- {venue}: {count} papers")
+                emit("")
+
+            # Sample papers
+            if analysis.get('sample_papers'):
+                emit("**Sample Papers:**")
+                for i, paper in enumerate(analysis['sample_papers'][:3], 1):
+                    title = paper.get('title', 'Unknown')[:80]
+                    year = paper.get('publication_year', 'N/A')
+                    emit(f"{i}. \"{title}...\" ({year})")
+                emit("")
+
+            # Interpretation
+            emit("**Interpretation:**")
+            if cat_name == 'oa_only':
+                emit("These papers are indexed by OpenAlex but not found in Semantic Scholar or NBER. ")
+                emit("This typically occurs because: (1) the paper is from a venue not well-covered by ")
+                emit("Semantic Scholar, (2) the paper's metadata differs between sources preventing matching, ")
+                emit("or (3) the search relevance algorithms returned different results.")
+            elif cat_name == 'ss_only':
+                emit("These papers are indexed by Semantic Scholar but not found in OpenAlex or NBER. ")
+                emit("Semantic Scholar's AI-powered search may surface papers based on semantic similarity ")
+                emit("that keyword-based searches miss.")
+            elif cat_name == 'nber_only':
+                emit("These are NBER working papers not found in the other sources. This may occur because: ")
+                emit("(1) the working paper version has a different title than any published version, ")
+                emit("(2) the paper has not been indexed by OpenAlex/Semantic Scholar yet, or ")
+                emit("(3) the paper was never published in a journal.")
+            elif cat_name == 'all_three':
+                emit("These papers appear in all three sources, indicating they are well-established ")
+                emit("papers with consistent metadata across databases. They are likely published in ")
+                emit("major venues and have DOIs.")
+            elif 'and' in cat_name:
+                emit("These papers appear in two sources but not the third, suggesting partial coverage ")
+                emit("overlap between the sources.")
+            emit("")
+
+        emit("---")
+        emit("")
+
+        # Implications for research
+        emit("## 5. Implications for Research")
+        emit("")
+        emit("### 5.1 Sample Completeness")
+        emit("")
+        emit("By combining three sources, we capture a more complete picture of research on this policy ")
+        emit("than any single source would provide. However, researchers should be aware that:")
+        emit("")
+        emit("- The sample is not exhaustive; papers not indexed by any of these sources are not included")
+        emit("- Search term selection affects which papers are retrieved")
+        emit("- Relevance filtering may exclude marginally relevant papers")
+        emit("")
+
+        emit("### 5.2 Potential Biases")
+        emit("")
+        emit("- **Publication bias:** Working papers (NBER) may differ systematically from published papers")
+        emit("- **Field bias:** Semantic Scholar has historically emphasized STEM fields")
+        emit("- **Recency bias:** Newer papers may have incomplete indexing")
+        emit("- **Language bias:** English-language papers are over-represented")
+        emit("")
+
+        emit("### 5.3 Robustness Checks")
+        emit("")
+        emit("To assess sensitivity of results to sample construction, researchers may:")
+        emit("")
+        emit("1. **Restrict to papers in multiple sources:** Analyze only papers found in 2+ sources")
+        emit("2. **Source-specific analysis:** Run analyses separately by source")
+        emit("3. **Exclude NBER:** Analyze only published papers (OpenAlex + Semantic Scholar)")
+        emit("")
 
     print(f"  Generated: {report_path}")
     return report_path
@@ -557,20 +733,37 @@ def main():
     print("=" * 80)
     print(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-    # Get policies
+    # Get policies (policies.csv is read once and each row handed to its report)
+    policies_df = load_policies()
+    policy_info_map = {}
+    if policies_df is not None:
+        policy_info_map = {row['policy_abbreviation']: row for row in policies_df.to_dict('records')}
+
     if len(sys.argv) > 1:
         policy_abbrs = sys.argv[1:]
-    elif os.path.exists(POLICIES_FILE):
-        policies_df = pd.read_csv(POLICIES_FILE)
+    elif policies_df is not None:
         policy_abbrs = policies_df['policy_abbreviation'].tolist()
     else:
         policy_abbrs = ['TCJA', 'ACA', 'NCLB']
 
     print(f"\nPolicies to analyze: {policy_abbrs}")
 
-    # Generate reports
-    for policy_abbr in policy_abbrs:
-        generate_sample_construction_report(policy_abbr)
+    # Generate reports (one worker process per policy, up to MAX_WORKERS)
+    n_workers = min(MAX_WORKERS, len(policy_abbrs))
+    if n_workers <= 1:
+        for policy_abbr in policy_abbrs:
+            generate_sample_construction_report(policy_abbr, policy_info_map.get(policy_abbr))
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            future_to_abbr = {executor.submit(generate_sample_construction_report, abbr,
+                                              policy_info_map.get(abbr)): abbr
+                              for abbr in policy_abbrs}
+            for future in as_completed(future_to_abbr):
+                policy_abbr = future_to_abbr[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"  ERROR generating report for {policy_abbr}: {e}")
 
     print(f"\n{'='*80}")
     print("COMPLETE")
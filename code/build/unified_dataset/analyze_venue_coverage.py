@@ -5,7 +5,10 @@ Identifies venues that are indexed by one source but not the other,
 ranked by academic relevance (total citations).
 """
 
+import io
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import os
 import re
 
@@ -16,21 +19,72 @@ REPORTS_DIR = os.path.join(SCRIPT_DIR, "reports")
 
 policies = ['TCJA', 'ACA', 'NCLB']
 
-all_dfs = []
+# Only these unified dataset columns are used (the rest are never decoded)
+VENUE_COLUMNS = ['unified_id', 'venue', 'in_openalex', 'in_semantic_scholar', 'cited_by_count']
+
+# Compact dtypes for the per-policy frames: 0/1 source flags
+FLAG_DTYPES = {'in_openalex': 'uint8', 'in_semantic_scholar': 'uint8'}
+
+# Every statistic below only needs per-(venue, source flags) totals
+VENUE_KEYS = ['venue', 'in_openalex', 'in_semantic_scholar']
+
+# Venue normalization patterns (compiled once)
+_PAREN_RE = re.compile(r'\s*\(.*?\)')
+_NONALNUM_RE = re.compile(r'[^a-z0-9\s]')
+_WS_RE = re.compile(r'\s+')
+
+
+
+def count_policy_venues(df):
+    """
+    Collapse one policy's papers to per-venue totals.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Unified dataset restricted to VENUE_COLUMNS
+
+    Returns:
+    --------
+    pd.DataFrame : One row per VENUE_KEYS combination with n_papers (papers
+        with a venue), paper_count (those with a unified_id) and total_citations
+    """
+    df = df[df['venue'].notna() & (df['venue'].astype(str) != '')]
+    # Dictionary-encode the repeated venue strings so the groupby hashes int codes
+    df = df.astype({
+        'venue': 'category',
+        **{col: dtype for col, dtype in FLAG_DTYPES.items() if col in df.columns},
+    })
+    return df.groupby(VENUE_KEYS, observed=True).agg(
+        n_papers=('venue', 'size'),
+        paper_count=('unified_id', 'count'),
+        total_citations=('cited_by_count', 'sum'),
+    ).reset_index()
+
+
+# Stream the policies: only each policy's per-venue totals are kept, never
+# all papers at once
+venue_count_frames = []
+total_papers = 0
 for policy in policies:
     path = os.path.join(OUTPUT_DIR, f'{policy}_unified_dataset.parquet')
     if os.path.exists(path):
-        df = pd.read_parquet(path)
-        df['policy'] = policy
-        all_dfs.append(df)
+        available = set(pq.ParquetFile(path).schema_arrow.names)
+        df = pd.read_parquet(path, engine='pyarrow',
+                             columns=[c for c in VENUE_COLUMNS if c in available])
         print(f'{policy}: {len(df)} papers')
+        total_papers += len(df)
+        venue_count_frames.append(count_policy_venues(df))
+        del df
 
-combined = pd.concat(all_dfs, ignore_index=True)
-print(f'\nTotal combined: {len(combined)} papers')
+print(f'\nTotal combined: {total_papers} papers')
 
-# Filter to papers with venues
-combined = combined[combined['venue'].notna() & (combined['venue'].astype(str) != '')]
-print(f'Papers with venue info: {len(combined)}')
+# Add up the per-policy totals
+venue_counts = (pd.concat(venue_count_frames, ignore_index=True)
+                .astype({'venue': str})
+                .groupby(VENUE_KEYS, as_index=False).sum())
+n_venue_papers = int(venue_counts['n_papers'].sum())
+print(f'Papers with venue info: {n_venue_papers}')
 
 
 def normalize_venue(v):
@@ -39,69 +93,104 @@ def normalize_venue(v):
         return ''
     v = str(v).lower().strip()
     # Remove common suffixes/variations
-    v = re.sub(r'\s*\(.*?\)', '', v)  # Remove parentheticals
-    v = re.sub(r'[^a-z0-9\s]', '', v)  # Keep only alphanumeric
-    v = re.sub(r'\s+', ' ', v).strip()
-    return v
-
-
-combined['venue_normalized'] = combined['venue'].apply(normalize_venue)
-
-# Get venues that appear in OpenAlex papers
-oa_papers = combined[combined['in_openalex'] == 1]
-oa_venues = set(oa_papers['venue_normalized'].unique())
-
-# Get venues that appear in Semantic Scholar papers
-ss_papers = combined[combined['in_semantic_scholar'] == 1]
-ss_venues = set(ss_papers['venue_normalized'].unique())
-
-print(f'\nUnique venues in OpenAlex: {len(oa_venues)}')
-print(f'Unique venues in Semantic Scholar: {len(ss_venues)}')
-print(f'Venues in both: {len(oa_venues & ss_venues)}')
-print(f'Venues ONLY in OpenAlex: {len(oa_venues - ss_venues)}')
-print(f'Venues ONLY in Semantic Scholar: {len(ss_venues - oa_venues)}')
+    v = _PAREN_RE.sub('', v)  # Remove parentheticals
+    v = _NONALNUM_RE.sub('', v)  # Keep only alphanumeric
+    return _WS_RE.sub(' ', v).strip()
+
+
+def normalize_venue_series(venues):
+    """Vectorized version of normalize_venue for a whole column ('' for missing)."""
+    return (
+        venues.astype('string')
+        .str.lower()
+        .str.strip()
+        .str.replace(_PAREN_RE, '', regex=True)
+        .str.replace(_NONALNUM_RE, '', regex=True)
+        .str.replace(_WS_RE, ' ', regex=True)
+        .str.strip()
+        .fillna('')
+    )
+
+
+# venue_counts has one row per distinct venue and flag combination, so each
+# venue string is normalized only a handful of times
+venue_counts['venue_normalized'] = normalize_venue_series(venue_counts['venue'])
+
+# Per-venue source flags in one pass: does any paper with this venue come
+# from OpenAlex / Semantic Scholar?
+venue_flags = venue_counts.groupby('venue_normalized')[['in_openalex', 'in_semantic_scholar']].max()
+venue_in_oa = (venue_flags['in_openalex'] == 1).to_numpy()
+venue_in_ss = (venue_flags['in_semantic_scholar'] == 1).to_numpy()
+
+n_oa_venues = int(venue_in_oa.sum())
+n_ss_venues = int(venue_in_ss.sum())
+n_shared_venues = int((venue_in_oa & venue_in_ss).sum())
 
 # Get venues ONLY in OpenAlex (never appear in any SS paper)
-oa_exclusive_venues = oa_venues - ss_venues
+oa_exclusive_venues = venue_flags.index[venue_in_oa & ~venue_in_ss]
 
 # Get venues ONLY in Semantic Scholar (never appear in any OA paper)
-ss_exclusive_venues = ss_venues - oa_venues
-
-# For OpenAlex-exclusive venues, get paper counts and total citations
-oa_exclusive_df = oa_papers[oa_papers['venue_normalized'].isin(oa_exclusive_venues)]
-oa_venue_stats = oa_exclusive_df.groupby('venue').agg({
-    'unified_id': 'count',
-    'cited_by_count': 'sum'
-}).rename(columns={'unified_id': 'paper_count', 'cited_by_count': 'total_citations'})
-oa_venue_stats['total_citations'] = oa_venue_stats['total_citations'].fillna(0)
-oa_venue_stats['avg_citations'] = (oa_venue_stats['total_citations'] / oa_venue_stats['paper_count']).round(1)
-oa_venue_stats = oa_venue_stats.sort_values('total_citations', ascending=False)
+ss_exclusive_venues = venue_flags.index[~venue_in_oa & venue_in_ss]
+
+print(f'\nUnique venues in OpenAlex: {n_oa_venues}')
+print(f'Unique venues in Semantic Scholar: {n_ss_venues}')
+print(f'Venues in both: {n_shared_venues}')
+print(f'Venues ONLY in OpenAlex: {len(oa_exclusive_venues)}')
+print(f'Venues ONLY in Semantic Scholar: {len(ss_exclusive_venues)}')
+
+# Paper counts and total citations for the papers in source-exclusive venues,
+# both sources in one groupby keyed by (src, venue). A paper in an
+# OpenAlex-exclusive venue can't be in Semantic Scholar and vice versa, so
+# in_openalex alone tells the two sides apart
+in_exclusive_venue = venue_counts['venue_normalized'].isin(oa_exclusive_venues.union(ss_exclusive_venues))
+in_oa_or_ss = (venue_counts['in_openalex'] == 1) | (venue_counts['in_semantic_scholar'] == 1)
+exclusive_counts = venue_counts[in_exclusive_venue & in_oa_or_ss]
+exclusive_counts = exclusive_counts.assign(src=np.where(exclusive_counts['in_openalex'] == 1, 'oa', 'ss'))
+venue_stats = exclusive_counts.groupby(['src', 'venue'])[['paper_count', 'total_citations']].sum()
+venue_stats['avg_citations'] = venue_stats['total_citations'] / venue_stats['paper_count']
+
+
+def source_venue_stats(src):
+    """Per-venue stats for one source ('oa' or 'ss'), ranked by total citations."""
+    if src in venue_stats.index.get_level_values('src'):
+        stats = venue_stats.xs(src, level='src')
+    else:
+        stats = venue_stats.iloc[0:0].droplevel('src')
+    return stats.sort_values('total_citations', ascending=False)
+
+
+def format_top_venues(stats, n):
+    """Format the top n venues once as (venue, papers, total citations, avg citations) strings."""
+    top = stats.head(n)
+    return [
+        (venue, f'{int(papers):,}', f'{int(total):,}', f'{avg:.1f}')
+        for venue, papers, total, avg in zip(top.index, top['paper_count'],
+                                             top['total_citations'], top['avg_citations'])
+    ]
+
+
+oa_venue_stats = source_venue_stats('oa')
+ss_venue_stats = source_venue_stats('ss')
+
+# Top rows are shared by the console output and the markdown report
+oa_top = format_top_venues(oa_venue_stats, 15)
+ss_top = format_top_venues(ss_venue_stats, 15)
 
 print('\n' + '='*80)
 print('TOP 15 VENUES INDEXED BY OPENALEX BUT NOT SEMANTIC SCHOLAR')
 print('(Ranked by total citations - proxy for academic relevance)')
 print('='*80)
-for i, (venue, row) in enumerate(oa_venue_stats.head(15).iterrows(), 1):
+for i, (venue, papers, total, avg) in enumerate(oa_top, 1):
     print(f'{i:2}. {venue}')
-    print(f'    Papers: {int(row["paper_count"]):,} | Total Citations: {int(row["total_citations"]):,} | Avg: {row["avg_citations"]}')
-
-# For Semantic Scholar-exclusive venues
-ss_exclusive_df = ss_papers[ss_papers['venue_normalized'].isin(ss_exclusive_venues)]
-ss_venue_stats = ss_exclusive_df.groupby('venue').agg({
-    'unified_id': 'count',
-    'cited_by_count': 'sum'
-}).rename(columns={'unified_id': 'paper_count', 'cited_by_count': 'total_citations'})
-ss_venue_stats['total_citations'] = ss_venue_stats['total_citations'].fillna(0)
-ss_venue_stats['avg_citations'] = (ss_venue_stats['total_citations'] / ss_venue_stats['paper_count']).round(1)
-ss_venue_stats = ss_venue_stats.sort_values('total_citations', ascending=False)
+    print(f'    Papers: {papers} | Total Citations: {total} | Avg: {avg}')
 
 print('\n' + '='*80)
 print('TOP 15 VENUES INDEXED BY SEMANTIC SCHOLAR BUT NOT OPENALEX')
 print('(Ranked by total citations - proxy for academic relevance)')
 print('='*80)
-for i, (venue, row) in enumerate(ss_venue_stats.head(15).iterrows(), 1):
+for i, (venue, papers, total, avg) in enumerate(ss_top, 1):
     print(f'{i:2}. {venue}')
-    print(f'    Papers: {int(row["paper_count"]):,} | Total Citations: {int(row["total_citations"]):,} | Avg: {row["avg_citations"]}')
+    print(f'    Papers: {papers} | Total Citations: {total} | Avg: {avg}')
 
 
 # Also show by average citations (high-impact venues with fewer papers)
@@ -109,97 +198,104 @@ print('\n' + '='*80)
 print('TOP 10 OPENALEX-ONLY VENUES BY AVERAGE CITATIONS (min 3 papers)')
 print('='*80)
 oa_by_avg = oa_venue_stats[oa_venue_stats['paper_count'] >= 3].sort_values('avg_citations', ascending=False)
-for i, (venue, row) in enumerate(oa_by_avg.head(10).iterrows(), 1):
+for i, (venue, papers, _, avg) in enumerate(format_top_venues(oa_by_avg, 10), 1):
     print(f'{i:2}. {venue}')
-    print(f'    Papers: {int(row["paper_count"]):,} | Avg Citations: {row["avg_citations"]}')
+    print(f'    Papers: {papers} | Avg Citations: {avg}')
 
 print('\n' + '='*80)
 print('TOP 10 SEMANTIC SCHOLAR-ONLY VENUES BY AVERAGE CITATIONS (min 3 papers)')
 print('='*80)
 ss_by_avg = ss_venue_stats[ss_venue_stats['paper_count'] >= 3].sort_values('avg_citations', ascending=False)
-for i, (venue, row) in enumerate(ss_by_avg.head(10).iterrows(), 1):
+for i, (venue, papers, _, avg) in enumerate(format_top_venues(ss_by_avg, 10), 1):
     print(f'{i:2}. {venue}')
-    print(f'    Papers: {int(row["paper_count"]):,} | Avg Citations: {row["avg_citations"]}')
+    print(f'    Papers: {papers} | Avg Citations: {avg}')
 
 
 # Generate a markdown report
-report_lines = []
-report_lines.append("# Venue Coverage Analysis: OpenAlex vs Semantic Scholar")
-report_lines.append("")
-report_lines.append(f"**Generated:** {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}")
-report_lines.append("")
-report_lines.append("This report identifies venues that appear exclusively in one source.")
-report_lines.append("")
-report_lines.append("---")
-report_lines.append("")
-
-report_lines.append("## Summary Statistics")
-report_lines.append("")
-report_lines.append(f"- **Total papers analyzed:** {len(combined):,}")
-report_lines.append(f"- **Unique venues in OpenAlex:** {len(oa_venues):,}")
-report_lines.append(f"- **Unique venues in Semantic Scholar:** {len(ss_venues):,}")
-report_lines.append(f"- **Venues in both sources:** {len(oa_venues & ss_venues):,}")
-report_lines.append(f"- **Venues ONLY in OpenAlex:** {len(oa_exclusive_venues):,}")
-report_lines.append(f"- **Venues ONLY in Semantic Scholar:** {len(ss_exclusive_venues):,}")
-report_lines.append("")
-
-report_lines.append("---")
-report_lines.append("")
-report_lines.append("## Top Venues Indexed by OpenAlex but NOT Semantic Scholar")
-report_lines.append("")
-report_lines.append("Ranked by total citations (proxy for academic relevance):")
-report_lines.append("")
-report_lines.append("| Rank | Venue | Papers | Total Citations | Avg Citations |")
-report_lines.append("|------|-------|--------|-----------------|---------------|")
-
-for i, (venue, row) in enumerate(oa_venue_stats.head(15).iterrows(), 1):
-    report_lines.append(f"| {i} | {venue} | {int(row['paper_count']):,} | {int(row['total_citations']):,} | {row['avg_citations']} |")
-
-report_lines.append("")
-report_lines.append("---")
-report_lines.append("")
-report_lines.append("## Top Venues Indexed by Semantic Scholar but NOT OpenAlex")
-report_lines.append("")
-report_lines.append("Ranked by total citations (proxy for academic relevance):")
-report_lines.append("")
-report_lines.append("| Rank | Venue | Papers | Total Citations | Avg Citations |")
-report_lines.append("|------|-------|--------|-----------------|---------------|")
-
-for i, (venue, row) in enumerate(ss_venue_stats.head(15).iterrows(), 1):
-    report_lines.append(f"| {i} | {venue} | {int(row['paper_count']):,} | {int(row['total_citations']):,} | {row['avg_citations']} |")
-
-report_lines.append("")
-report_lines.append("---")
-report_lines.append("")
-report_lines.append("## Interpretation")
-report_lines.append("")
-report_lines.append("### Why Some Venues Appear Only in OpenAlex")
-report_lines.append("")
-report_lines.append("1. **PsycEXTRA Dataset**: Psychology grey literature indexed by APA, which OpenAlex includes")
-report_lines.append("2. **Choice Reviews Online**: Library review publication not in Semantic Scholar's scope")
-report_lines.append("3. **Forefront Group**: Think tank publications indexed by OpenAlex")
-report_lines.append("4. **Various specialized journals**: OpenAlex has broader coverage of smaller venues")
-report_lines.append("")
-report_lines.append("### Why Some Venues Appear Only in Semantic Scholar")
-report_lines.append("")
-report_lines.append("1. **Different venue naming conventions**: Same journal may have different names")
-report_lines.append("2. **Preprint/working paper repositories**: Different coverage of preprints")
-report_lines.append("3. **Conference proceedings**: Semantic Scholar emphasizes CS/AI conferences")
-report_lines.append("")
-report_lines.append("### Important Caveat")
-report_lines.append("")
-report_lines.append("A venue appearing 'only' in one source doesn't necessarily mean the other source")
-report_lines.append("doesn't index it at all. It may mean:")
-report_lines.append("")
-report_lines.append("- The specific papers from that venue weren't returned by our search queries")
-report_lines.append("- The venue name is stored differently in each database")
-report_lines.append("- Coverage varies by publication year or paper type")
-report_lines.append("")
+report_buf = io.StringIO()
+
+
+def emit(text):
+    """Append one line to the markdown report."""
+    report_buf.write(text)
+    report_buf.write('\n')
+
+
+emit("# Venue Coverage Analysis: OpenAlex vs Semantic Scholar")
+emit("")
+emit(f"**Generated:** {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}")
+emit("")
+emit("This report identifies venues that appear exclusively in one source.")
+emit("")
+emit("---")
+emit("")
+
+emit("## Summary Statistics")
+emit("")
+emit(f"- **Total papers analyzed:** {n_venue_papers:,}")
+emit(f"- **Unique venues in OpenAlex:** {n_oa_venues:,}")
+emit(f"- **Unique venues in Semantic Scholar:** {n_ss_venues:,}")
+emit(f"- **Venues in both sources:** {n_shared_venues:,}")
+emit(f"- **Venues ONLY in OpenAlex:** {len(oa_exclusive_venues):,}")
+emit(f"- **Venues ONLY in Semantic Scholar:** {len(ss_exclusive_venues):,}")
+emit("")
+
+emit("---")
+emit("")
+emit("## Top Venues Indexed by OpenAlex but NOT Semantic Scholar")
+emit("")
+emit("Ranked by total citations (proxy for academic relevance):")
+emit("")
+emit("| Rank | Venue | Papers | Total Citations | Avg Citations |")
+emit("|------|-------|--------|-----------------|---------------|")
+
+for i, (venue, papers, total, avg) in enumerate(oa_top, 1):
+    emit(f"| {i} | {venue} | {papers} | {total} | {avg} |")
+
+emit("")
+emit("---")
+emit("")
+emit("## Top Venues Indexed by Semantic Scholar but NOT OpenAlex")
+emit("")
+emit("Ranked by total citations (proxy for academic relevance):")
+emit("")
+emit("| Rank | Venue | Papers | Total Citations | Avg Citations |")
+emit("|------|-------|--------|-----------------|---------------|")
+
+for i, (venue, papers, total, avg) in enumerate(ss_top, 1):
+    emit(f"| {i} | {venue} | {papers} | {total} | {avg} |")
+
+emit("")
+emit("---")
+emit("")
+emit("## Interpretation")
+emit("")
+emit("### Why Some Venues Appear Only in OpenAlex")
+emit("")
+emit("1. **PsycEXTRA Dataset**: Psychology grey literature indexed by APA, which OpenAlex includes")
+emit("2. **Choice Reviews Online**: Library review publication not in Semantic Scholar's scope")
+emit("3. **Forefront Group**: Think tank publications indexed by OpenAlex")
+emit("4. **Various specialized journals**: OpenAlex has broader coverage of smaller venues")
+emit("")
+emit("### Why Some Venues Appear Only in Semantic Scholar")
+emit("")
+emit("1. **Different venue naming conventions**: Same journal may have different names")
+emit("2. **Preprint/working paper repositories**: Different coverage of preprints")
+emit("3. **Conference proceedings**: Semantic Scholar emphasizes CS/AI conferences")
+emit("")
+emit("### Important Caveat")
+emit("")
+emit("A venue appearing 'only' in one source doesn't necessarily mean the other source")
+emit("doesn't index it at all. It may mean:")
+emit("")
+emit("- The specific papers from that venue weren't returned by our search queries")
+emit("- The venue name is stored differently in each database")
+emit("- Coverage varies by publication year or paper type")
 
 # Save report
 report_path = os.path.join(REPORTS_DIR, "venue_coverage_analysis.md")
 os.makedirs(REPORTS_DIR, exist_ok=True)
 with open(report_path, 'w', encoding='utf-8') as f:
-    f.write('\n'.join(report_lines))
+    f.write(report_buf.getvalue())
 
 print(f'\n\nReport saved to: {report_path}')
@@ -10,10 +10,37 @@ import numpy as np
 from typing import Dict, List, Tuple
 from collections import defaultdict
 
+# Bit of each source in the presence bitmap
+SOURCE_BITS = {'openalex': 1, 'semantic_scholar': 2, 'nber': 4}
+# Presence flag column of each source, in SOURCE_BITS order
+IN_COLS = tuple(f'in_{source}' for source in SOURCE_BITS)
+# Number of sources for each bitmap value 0..7
+SOURCE_COUNTS = np.array([0, 1, 1, 2, 1, 2, 2, 3], dtype=np.uint8)
+
+
+def presence_bitmap(unified_df: pd.DataFrame) -> np.ndarray:
+    """
+    Encode each paper's source presence as one uint8 (see SOURCE_BITS).
+
+    Parameters:
+    -----------
+    unified_df : pd.DataFrame
+        Unified dataset with in_openalex, in_semantic_scholar and in_nber flags
+
+    Returns:
+    --------
+    np.ndarray : Bitmap values 0..7, one per row
+    """
+    pres = np.zeros(len(unified_df), dtype=np.uint8)
+    for col, bit in zip(IN_COLS, SOURCE_BITS.values()):
+        pres |= (unified_df[col].to_numpy() == 1).astype(np.uint8) * np.uint8(bit)
+    return pres
+
 
 def analyze_source_pair(unified_df: pd.DataFrame,
                         source1: str,
-                        source2: str) -> Dict:
+                        source2: str,
+                        pres: np.ndarray = None) -> Dict:
     """
     Analyze coverage differences between two sources.
 
@@ -23,20 +50,39 @@ def analyze_source_pair(unified_df: pd.DataFrame,
         Unified dataset
     source1, source2 : str
         Source names to compare (e.g., 'openalex', 'semantic_scholar')
+    pres : np.ndarray, optional
+        Precomputed presence_bitmap(unified_df)
 
     Returns:
     --------
     dict : Analysis results
     """
-    col1 = f'in_{source1}'
-    col2 = f'in_{source2}'
+    if pres is None:
+        pres = presence_bitmap(unified_df)
+    bit1 = SOURCE_BITS[source1]
+    bit2 = SOURCE_BITS[source2]
+    pair = pres & (bit1 | bit2)
 
     # Papers in source1 only
-    in_s1_only = unified_df[(unified_df[col1] == 1) & (unified_df[col2] == 0)]
+    in_s1_only = unified_df[pair == bit1]
     # Papers in source2 only
-    in_s2_only = unified_df[(unified_df[col1] == 0) & (unified_df[col2] == 1)]
+    in_s2_only = unified_df[pair == bit2]
     # Papers in both
-    in_both = unified_df[(unified_df[col1] == 1) & (unified_df[col2] == 1)]
+    in_both = unified_df[pair == (bit1 | bit2)]
+
+    # Abstract/DOI/citation summaries of both single-source subsets in one
+    # grouped pass (group 1 = source1 only, 2 = source2 only, 0 = the rest)
+    subset = np.select([pair == bit1, pair == bit2], [1, 2], 0)
+    abstracts = unified_df['abstract']
+    summary_cols = {
+        'has_abstract': (abstracts.notna() & (abstracts != '')).to_numpy(),
+        'has_doi': unified_df['doi'].notna().to_numpy(),
+    }
+    summary_aggs = {'has_abstract': 'mean', 'has_doi': 'mean'}
+    if 'cited_by_count' in unified_df.columns:
+        summary_cols['cited_by_count'] = unified_df['cited_by_count'].to_numpy()
+        summary_aggs['cited_by_count'] = 'median'
+    summary = pd.DataFrame(summary_cols).groupby(subset).agg(summary_aggs)
 
     analysis = {
         'source1': source1,
@@ -52,9 +98,9 @@ def analyze_source_pair(unified_df: pd.DataFrame,
     if len(in_s1_only) > 0:
         analysis['source1_only_analysis'] = {
             'year_distribution': in_s1_only['publication_year'].value_counts().head(10).to_dict(),
-            'pct_with_abstract': round(100 * (in_s1_only['abstract'].notna() & (in_s1_only['abstract'] != '')).mean(), 1),
-            'pct_with_doi': round(100 * in_s1_only['doi'].notna().mean(), 1),
-            'median_citations': in_s1_only['cited_by_count'].median() if 'cited_by_count' in in_s1_only.columns else None,
+            'pct_with_abstract': round(100 * summary.at[1, 'has_abstract'], 1),
+            'pct_with_doi': round(100 * summary.at[1, 'has_doi'], 1),
+            'median_citations': summary.at[1, 'cited_by_count'] if 'cited_by_count' in summary.columns else None,
             'top_venues': in_s1_only['venue'].value_counts().head(5).to_dict() if 'venue' in in_s1_only.columns else {},
             'sample_titles': in_s1_only['title'].head(5).tolist(),
         }
@@ -63,9 +109,9 @@ def analyze_source_pair(unified_df: pd.DataFrame,
     if len(in_s2_only) > 0:
         analysis['source2_only_analysis'] = {
             'year_distribution': in_s2_only['publication_year'].value_counts().head(10).to_dict(),
-            'pct_with_abstract': round(100 * (in_s2_only['abstract'].notna() & (in_s2_only['abstract'] != '')).mean(), 1),
-            'pct_with_doi': round(100 * in_s2_only['doi'].notna().mean(), 1),
-            'median_citations': in_s2_only['cited_by_count'].median() if 'cited_by_count' in in_s2_only.columns else None,
+            'pct_with_abstract': round(100 * summary.at[2, 'has_abstract'], 1),
+            'pct_with_doi': round(100 * summary.at[2, 'has_doi'], 1),
+            'median_citations': summary.at[2, 'cited_by_count'] if 'cited_by_count' in summary.columns else None,
             'top_venues': in_s2_only['venue'].value_counts().head(5).to_dict() if 'venue' in in_s2_only.columns else {},
             'sample_titles': in_s2_only['title'].head(5).tolist(),
         }
@@ -74,7 +120,8 @@ def analyze_source_pair(unified_df: pd.DataFrame,
 
 
 def generate_hypotheses(unified_df: pd.DataFrame,
-                        source_metrics: Dict[str, Dict]) -> List[Dict]:
+                        source_metrics: Dict[str, Dict],
+                        pres: np.ndarray = None) -> List[Dict]:
     """
     Generate hypotheses about why papers appear in different sources.
 
@@ -84,19 +131,19 @@ def generate_hypotheses(unified_df: pd.DataFrame,
         Unified dataset
     source_metrics : dict
         Quality metrics per source
+    pres : np.ndarray, optional
+        Precomputed presence_bitmap(unified_df)
 
     Returns:
     --------
     list : List of hypothesis dictionaries with evidence
     """
     hypotheses = []
+    if pres is None:
+        pres = presence_bitmap(unified_df)
 
     # === Hypothesis 1: NBER only indexes NBER working papers ===
-    nber_only = unified_df[
-        (unified_df['in_nber'] == 1) &
-        (unified_df['in_openalex'] == 0) &
-        (unified_df['in_semantic_scholar'] == 0)
-    ]
+    nber_only = unified_df[pres == SOURCE_BITS['nber']]
 
     if len(nber_only) > 0:
         venues = nber_only['venue'].value_counts().head(3).to_dict() if 'venue' in nber_only.columns else {}
@@ -104,21 +151,16 @@ def generate_hypotheses(unified_df: pd.DataFrame,
             'hypothesis': 'NBER source only indexes NBER working papers',
             'evidence': {
                 'nber_only_papers': len(nber_only),
-                'total_nber_papers': unified_df['in_nber'].sum(),
+                'total_nber_papers': int(np.count_nonzero(pres & SOURCE_BITS['nber'])),
                 'top_venues_in_nber_only': venues,
             },
             'conclusion': f"NBER has {len(nber_only)} papers not in other sources, likely because NBER specifically scrapes NBER working papers."
         })
 
     # === Hypothesis 2: OpenAlex has better DOI coverage ===
-    oa_only = unified_df[
-        (unified_df['in_openalex'] == 1) &
-        (unified_df['in_semantic_scholar'] == 0)
-    ]
-    ss_only = unified_df[
-        (unified_df['in_openalex'] == 0) &
-        (unified_df['in_semantic_scholar'] == 1)
-    ]
+    oa_ss = pres & (SOURCE_BITS['openalex'] | SOURCE_BITS['semantic_scholar'])
+    oa_only = unified_df[oa_ss == SOURCE_BITS['openalex']]
+    ss_only = unified_df[oa_ss == SOURCE_BITS['semantic_scholar']]
 
     if len(oa_only) > 0 or len(ss_only) > 0:
         oa_doi_pct = round(100 * oa_only['doi'].notna().mean(), 1) if len(oa_only) > 0 else 0
@@ -168,18 +210,23 @@ def generate_hypotheses(unified_df: pd.DataFrame,
     # === Hypothesis 5: Search term effectiveness differs ===
     search_term_coverage = {}
     if 'search_terms' in unified_df.columns:
-        for _, row in unified_df.iterrows():
-            terms = str(row.get('search_terms', '')).split(' | ')
-            for term in terms:
-                if term and term.strip():
-                    if term not in search_term_coverage:
-                        search_term_coverage[term] = {'openalex': 0, 'semantic_scholar': 0, 'nber': 0}
-                    if row['in_openalex'] == 1:
-                        search_term_coverage[term]['openalex'] += 1
-                    if row['in_semantic_scholar'] == 1:
-                        search_term_coverage[term]['semantic_scholar'] += 1
-                    if row['in_nber'] == 1:
-                        search_term_coverage[term]['nber'] += 1
+        # Tokenize to one (row position, term) pair per term occurrence
+        term_lists = unified_df['search_terms'].fillna('').astype(str).str.split(' | ', regex=False)
+        terms = term_lists.explode().to_numpy()
+        term_rows = np.repeat(np.arange(len(term_lists)), term_lists.str.len().to_numpy())
+        keep = pd.Series(terms).str.strip().to_numpy() != ''
+
+        # Accumulate the source flags into an (n_terms, n_sources) count array
+        term_ids, unique_terms = pd.factorize(terms[keep])
+        sources = list(SOURCE_BITS)
+        flags = (unified_df[list(IN_COLS)].to_numpy() == 1).astype(np.int64)
+        counts = np.zeros((len(unique_terms), len(sources)), dtype=np.int64)
+        np.add.at(counts, term_ids, flags[term_rows[keep]])
+
+        search_term_coverage = {
+            term: dict(zip(sources, term_counts))
+            for term, term_counts in zip(unique_terms, counts.tolist())
+        }
 
     if search_term_coverage:
         hypotheses.append({
@@ -219,20 +266,17 @@ def analyze_coverage(unified_df: pd.DataFrame,
 
     # Overall statistics
     total_papers = len(unified_df)
+    pres = presence_bitmap(unified_df)
+    # Number of sources per paper, computed once for all "exactly N" counts
+    n_sources = SOURCE_COUNTS[pres]
     analysis['overall_stats'] = {
         'total_unified_papers': total_papers,
-        'papers_in_openalex': int(unified_df['in_openalex'].sum()),
-        'papers_in_semantic_scholar': int(unified_df['in_semantic_scholar'].sum()),
-        'papers_in_nber': int(unified_df['in_nber'].sum()),
-        'papers_in_all_three': int(((unified_df['in_openalex'] == 1) &
-                                     (unified_df['in_semantic_scholar'] == 1) &
-                                     (unified_df['in_nber'] == 1)).sum()),
-        'papers_in_exactly_one': int(((unified_df['in_openalex'] +
-                                        unified_df['in_semantic_scholar'] +
-                                        unified_df['in_nber']) == 1).sum()),
-        'papers_in_exactly_two': int(((unified_df['in_openalex'] +
-                                        unified_df['in_semantic_scholar'] +
-                                        unified_df['in_nber']) == 2).sum()),
+        'papers_in_openalex': int(np.count_nonzero(pres & SOURCE_BITS['openalex'])),
+        'papers_in_semantic_scholar': int(np.count_nonzero(pres & SOURCE_BITS['semantic_scholar'])),
+        'papers_in_nber': int(np.count_nonzero(pres & SOURCE_BITS['nber'])),
+        'papers_in_all_three': int((n_sources == 3).sum()),
+        'papers_in_exactly_one': int((n_sources == 1).sum()),
+        'papers_in_exactly_two': int((n_sources == 2).sum()),
     }
 
     # Pairwise comparisons
@@ -244,10 +288,10 @@ def analyze_coverage(unified_df: pd.DataFrame,
 
     for s1, s2 in pairs:
         key = f"{s1}_vs_{s2}"
-        analysis['pairwise_comparisons'][key] = analyze_source_pair(unified_df, s1, s2)
+        analysis['pairwise_comparisons'][key] = analyze_source_pair(unified_df, s1, s2, pres)
 
     # Generate hypotheses
-    analysis['hypotheses'] = generate_hypotheses(unified_df, source_metrics)
+    analysis['hypotheses'] = generate_hypotheses(unified_df, source_metrics, pres)
 
     # Print summary
     print(f"\nCoverage Analysis Summary:")
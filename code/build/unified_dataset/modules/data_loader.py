@@ -35,6 +35,13 @@ STANDARD_COLUMNS = {
     'scrape_date': 'scrape_date',
 }
 
+# URL / scheme prefixes stripped from DOIs (same list as normalize_doi)
+_DOI_PREFIX_RE = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi\.org/|doi:)')
+
+# Title normalization patterns (compiled once)
+_TITLE_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
 
 def normalize_doi(doi: Optional[str]) -> Optional[str]:
     """
@@ -86,6 +93,24 @@ def normalize_doi(doi: Optional[str]) -> Optional[str]:
     return None
 
 
+def normalize_doi_series(dois: pd.Series) -> pd.Series:
+    """
+    Vectorized version of normalize_doi for a whole column.
+
+    Parameters:
+    -----------
+    dois : pd.Series
+        DOI strings (may contain missing values)
+
+    Returns:
+    --------
+    pd.Series : Normalized DOIs (object dtype), None where empty/invalid
+    """
+    dois = dois.astype('string').str.strip().str.lower()
+    dois = dois.str.replace(_DOI_PREFIX_RE, '', regex=True).str.strip()
+    return dois.astype(object).where(dois.str.startswith('10.', na=False), None)
+
+
 def normalize_title(title: Optional[str]) -> Optional[str]:
     """
     Normalize title for matching purposes.
@@ -108,13 +133,36 @@ def normalize_title(title: Optional[str]) -> Optional[str]:
 
     title = str(title).lower()
     # Remove punctuation except spaces
-    title = re.sub(r'[^\w\s]', '', title)
+    title = _TITLE_PUNCT_RE.sub('', title)
     # Normalize whitespace
     title = ' '.join(title.split())
 
     return title if title else None
 
 
+def normalize_title_series(titles: pd.Series) -> pd.Series:
+    """
+    Vectorized version of normalize_title for a whole column.
+
+    Parameters:
+    -----------
+    titles : pd.Series
+        Title strings (may contain missing values)
+
+    Returns:
+    --------
+    pd.Series : Normalized titles (object dtype), None where empty
+    """
+    titles = (
+        titles.astype('string')
+        .str.lower()
+        .str.replace(_TITLE_PUNCT_RE, '', regex=True)
+        .str.replace(_WS_RE, ' ', regex=True)
+        .str.strip()
+    )
+    return titles.astype(object).where(titles.fillna('').ne(''), None)
+
+
 def load_openalex_data(policy_abbr: str, base_dir: str) -> Optional[pd.DataFrame]:
     """
     Load OpenAlex data for a policy.
@@ -246,14 +294,14 @@ def standardize_dataframe(df: pd.DataFrame, source: str) -> pd.DataFrame:
 
     # Normalize DOI (only OpenAlex has DOI)
     if 'doi' in df.columns:
-        df['doi_normalized'] = df['doi'].apply(normalize_doi)
+        df['doi_normalized'] = normalize_doi_series(df['doi'])
     else:
         df['doi'] = None
         df['doi_normalized'] = None
 
     # Normalize title
     if 'normalized_title' not in df.columns:
-        df['normalized_title'] = df['title'].apply(normalize_title)
+        df['normalized_title'] = normalize_title_series(df['title'])
 
     # Handle venue/source_name
     if 'venue' in df.columns:
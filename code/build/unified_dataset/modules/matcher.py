@@ -34,8 +34,8 @@ def match_by_doi(dataframes: Dict[str, pd.DataFrame]) -> Dict[str, List[int]]:
         if 'doi_normalized' not in df.columns:
             continue
 
-        for idx, row in df.iterrows():
-            doi = row.get('doi_normalized')
+        # Plain zip over the two columns instead of building a Series per row
+        for idx, doi in zip(df.index.tolist(), df['doi_normalized'].tolist()):
             if doi and pd.notna(doi):
                 doi_matches[doi].append((source, idx))
 
@@ -65,13 +65,14 @@ def match_by_title(dataframes: Dict[str, pd.DataFrame],
 
     for source, df in dataframes.items():
         matched_indices = already_matched_indices.get(source, set())
+        if 'normalized_title' not in df.columns:
+            continue
 
-        for idx, row in df.iterrows():
+        for idx, title in zip(df.index.tolist(), df['normalized_title'].tolist()):
             # Skip if already matched by DOI
             if idx in matched_indices:
                 continue
 
-            title = row.get('normalized_title')
             if title and pd.notna(title) and len(title) > 10:  # Minimum title length
                 title_matches[title].append((source, idx))
 
@@ -22,6 +22,7 @@ Updated: January 27, 2026 - Increased max_results to 1500, added relevance filte
 
 import requests
 import json
+import numpy as np
 import pandas as pd
 import time
 from datetime import datetime
@@ -29,6 +30,13 @@ import os
 import sys
 import re
 
+# pyahocorasick — optional dependency (single-pass multi-term relevance scan)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # OpenAlex API endpoint
 OPENALEX_API = "https://api.openalex.org/works"
 
@@ -207,6 +215,25 @@ def extract_paper_info(work):
     return paper_info
 
 
+def build_term_automaton(search_terms):
+    """
+    Build an Aho-Corasick automaton over the lowercased search terms.
+
+    Scanning a text with the automaton finds every term in a single pass,
+    regardless of how many terms there are. Returns None when pyahocorasick
+    is not installed.
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for term in search_terms:
+        term_lower = term.lower()
+        automaton.add_word(term_lower, term_lower)
+    automaton.make_automaton()
+    return automaton
+
+
 def filter_by_relevance(df, search_terms):
     """
     Filter papers by relevance based on search term presence in title/abstract.
@@ -215,26 +242,32 @@ def filter_by_relevance(df, search_terms):
     - If paper has title AND abstract: keep only if at least one search term
       appears in either title or abstract (case-insensitive)
     - If paper has only title (no abstract): keep the paper
+
+    Title and abstract are lowercased once for the whole column. Term
+    presence is then found with an Aho-Corasick automaton when pyahocorasick
+    is installed, otherwise with one vectorized Series.str.contains pass per
+    term.
     """
     if len(df) == 0:
         return df
 
-    def is_relevant(row):
-        title = str(row.get('title', '')).lower()
-        abstract = str(row.get('abstract', '')).lower()
-
-        if not abstract or abstract == 'nan' or abstract == '' or abstract == 'none':
-            return True
-
-        text = title + ' ' + abstract
+    title_lower = df['title'].fillna('').astype(str).str.lower()
+    abstract_lower = df['abstract'].fillna('').astype(str).str.lower()
+    has_abstract = ~abstract_lower.isin(['', 'nan', 'none']).to_numpy()
+    text = title_lower + ' ' + abstract_lower
+
+    automaton = build_term_automaton(search_terms)
+    if automaton is not None:
+        term_found = np.fromiter(
+            (next(automaton.iter(t), None) is not None for t in text.tolist()),
+            dtype=bool, count=len(text)
+        )
+    else:
+        term_found = np.zeros(len(text), dtype=bool)
         for term in search_terms:
-            term_lower = term.lower()
-            if term_lower in text:
-                return True
-
-        return False
+            term_found |= text.str.contains(term.lower(), regex=False).to_numpy(dtype=bool)
 
-    mask = df.apply(is_relevant, axis=1)
+    mask = ~has_abstract | term_found
     return df[mask].copy()
 
 